@@ -49,6 +49,7 @@ ARGS_BACKTEST = [
     *ARGS_COMMON_OPTIMIZE,
     "position_stacking",
     "enable_protections",
+    "backtest_fast_path",
     "dry_run_wallet",
     "timeframe_detail",
     "strategy_list",
@@ -66,6 +67,7 @@ ARGS_HYPEROPT = [
     "hyperopt_path",
     "position_stacking",
     "enable_protections",
+    "backtest_fast_path",
     "dry_run_wallet",
     "timeframe_detail",
     "epochs",
@@ -73,6 +75,7 @@ ARGS_HYPEROPT = [
     "print_all",
     "print_json",
     "hyperopt_jobs",
+    "hyperopt_persistent_workers",
     "hyperopt_random_state",
     "hyperopt_min_trades",
     "hyperopt_loss",
@@ -136,6 +139,7 @@ ARGS_CONVERT_DATA_OHLCV = [*ARGS_CONVERT_DATA, "timeframes", "trading_mode", "ca
 ARGS_CONVERT_TRADES = [
     "pairs",
     "timeframes",
+    "timerange",
     "exchange",
     "dataformat_ohlcv",
     "dataformat_trades",
@@ -168,6 +172,8 @@ ARGS_DOWNLOAD_DATA = [
     "dataformat_trades",
     "trading_mode",
     "prepend_data",
+    "download_workers",
+    "download_resume",
 ]
 
 ARGS_PLOT_DATAFRAME = [
@@ -251,7 +257,14 @@ ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_s
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown", "backtest_notes")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_fast_path",
+        "backtest_cache",
+        "backtest_breakdown",
+        "backtest_notes",
+    )
 ] + ["minimum_trade_amount", "targeted_trade_amount", "lookahead_analysis_exportfilename"]
 
 ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
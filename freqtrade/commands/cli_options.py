@@ -190,6 +190,13 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "backtest_fast_path": Arg(
+        "--fast-path",
+        help="Use the vectorized backtest engine for strategies without per-candle callbacks. "
+        "Falls back to the regular loop if the strategy is not supported.",
+        action="store_true",
+        default=False,
+    ),
     "strategy_list": Arg(
         "--strategy-list",
         help="Provide a space-separated list of strategies to backtest. "
@@ -327,6 +334,14 @@ AVAILABLE_CLI_OPTIONS = {
         metavar="JOBS",
         default=-1,
     ),
+    "hyperopt_persistent_workers": Arg(
+        "--persistent-workers",
+        help="Use a persistent worker pool for hyperopt. Workers are initialized once and "
+        "new epochs are started as soon as a worker becomes available. "
+        "Results are not reproducible, even when using --random-state.",
+        action="store_true",
+        default=False,
+    ),
     "hyperopt_random_state": Arg(
         "--random-state",
         help="Set random state to some positive integer for reproducible hyperopt results.",
@@ -514,6 +529,18 @@ AVAILABLE_CLI_OPTIONS = {
         help="Allow data prepending. (Data-appending is disabled)",
         action="store_true",
     ),
+    "download_resume": Arg(
+        "--resume",
+        help="Resume an interrupted download, skipping downloads it already completed. "
+        "Only works on the same day, with the same parameters.",
+        action="store_true",
+    ),
+    "download_workers": Arg(
+        "--dl-workers",
+        help="Number of pair / timeframe downloads to process concurrently. Default: `1`.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "erase": Arg(
         "--erase",
         help="Clean all existing data for the selected exchange/pairs/timeframes.",
@@ -51,6 +51,8 @@ def start_convert_trades(args: dict[str, Any]) -> None:
     config = setup_utils_configuration(args, RunMode.UTIL_EXCHANGE)
 
     timerange = TimeRange()
+    if "timerange" in config:
+        timerange = TimeRange.parse_timerange(config["timerange"])
 
     # Remove stake-currency to skip checks which are not relevant for datadownload
     config["stake_currency"] = ""
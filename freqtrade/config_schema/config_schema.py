@@ -213,6 +213,13 @@ CONF_SCHEMA = {
             "minimum": 0.0,
             "maximum": 0.99,
         },
+        "backtest_fast_path": {
+            "description": (
+                "Use the vectorized backtest engine for strategies without per-candle callbacks."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "backtest_breakdown": {
             "description": "Breakdown configuration for backtesting.",
             "type": "array",
@@ -727,6 +734,18 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "analyze_threads": {
+                    "description": "Number of threads used to analyze pairs concurrently.",
+                    "type": "integer",
+                    "minimum": 1,
+                },
+                "backtest_wallet_check": {
+                    "description": (
+                        "Compare incremental backtest wallet updates with a full "
+                        "recalculation (debugging)."
+                    ),
+                    "type": "boolean",
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -735,6 +754,12 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "dataload_workers": {
+            "description": "Number of threads used to load OHLCV data for backtesting.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "dataformat_trades": {
             "description": "Data format for trade data.",
             "type": "string",
@@ -755,6 +780,12 @@ CONF_SCHEMA = {
             "description": "Download trades data by default (instead of ohlcv data).",
             "type": "boolean",
         },
+        "download_workers": {
+            "description": "Number of pair / timeframe downloads to process concurrently.",
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "max_entry_position_adjustment": {
             "description": f"Maximum entry position adjustment allowed. {__IN_STRATEGY}",
             "type": ["integer", "number"],
@@ -801,6 +832,12 @@ CONF_SCHEMA = {
                     "type": "number",
                     "minimum": 0.0,
                 },
+                "store_trades": {
+                    "description": "Store the individual trades of each candle in the "
+                    "`trades` column.",
+                    "type": "boolean",
+                    "default": True,
+                },
             },
             "required": [
                 "max_candles",
@@ -897,6 +934,15 @@ CONF_SCHEMA = {
                     "description": "Fee rate for unknown markets.",
                     "type": "number",
                 },
+                "tickers_max_age": {
+                    "description": (
+                        "Maximum age (in seconds) of tickers fetched in bulk for pricing. "
+                        "0 fetches the ticker per pair."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 0,
+                },
                 "outdated_offset": {
                     "description": "Offset for outdated data in minutes.",
                     "type": "integer",
@@ -247,6 +247,12 @@ class Configuration:
             logstring="Parameter --enable-protections detected, enabling Protections. ...",
         )
 
+        self._args_to_config(
+            config,
+            argname="backtest_fast_path",
+            logstring="Parameter --fast-path detected, using vectorized backtest engine ...",
+        )
+
         if self.args.get("max_open_trades"):
             config.update({"max_open_trades": self.args["max_open_trades"]})
             logger.info(
@@ -341,6 +347,7 @@ class Configuration:
             ("print_json", "Parameter --print-json detected ..."),
             ("export_csv", "Parameter --export-csv detected: {}"),
             ("hyperopt_jobs", "Parameter -j/--job-workers detected: {}"),
+            ("hyperopt_persistent_workers", "Parameter --persistent-workers detected ..."),
             ("hyperopt_random_state", "Parameter --random-state detected: {}"),
             ("hyperopt_min_trades", "Parameter --min-trades detected: {}"),
             ("hyperopt_loss", "Using Hyperopt loss class name: {}"),
@@ -374,6 +381,8 @@ class Configuration:
             ("plot_auto_open", "Parameter --auto-open detected."),
             ("trade_source", "Using trades from: {}"),
             ("prepend_data", "Prepend detected. Allowing data prepending."),
+            ("download_workers", "Using {} download workers."),
+            ("download_resume", "Parameter --resume detected. Resuming interrupted download."),
             ("erase", "Erase detected. Deleting existing data."),
             ("no_trades", "Parameter --no-trades detected."),
             ("timeframes", "timeframes --timeframes: {}"),
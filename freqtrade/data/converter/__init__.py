@@ -1,6 +1,7 @@
 from freqtrade.data.converter.converter import (
     clean_ohlcv_dataframe,
     convert_ohlcv_format,
+    ohlcv_append_candles,
     ohlcv_fill_up_missing_data,
     ohlcv_to_dataframe,
     order_book_to_dataframe,
@@ -8,10 +9,12 @@ from freqtrade.data.converter.converter import (
     trim_dataframe,
     trim_dataframes,
 )
-from freqtrade.data.converter.orderflow import populate_dataframe_with_trades
+from freqtrade.data.converter.orderflow import OrderflowCache, populate_dataframe_with_trades
 from freqtrade.data.converter.trade_converter import (
     convert_trades_format,
     convert_trades_to_ohlcv,
+    trades_chunks_remove_duplicates,
+    trades_chunks_to_ohlcv,
     trades_convert_types,
     trades_df_remove_duplicates,
     trades_dict_to_list,
@@ -23,6 +26,7 @@ from freqtrade.data.converter.trade_converter import (
 __all__ = [
     "clean_ohlcv_dataframe",
     "convert_ohlcv_format",
+    "ohlcv_append_candles",
     "ohlcv_fill_up_missing_data",
     "ohlcv_to_dataframe",
     "order_book_to_dataframe",
@@ -31,7 +35,10 @@ __all__ = [
     "trim_dataframes",
     "convert_trades_format",
     "convert_trades_to_ohlcv",
+    "OrderflowCache",
     "populate_dataframe_with_trades",
+    "trades_chunks_remove_duplicates",
+    "trades_chunks_to_ohlcv",
     "trades_convert_types",
     "trades_df_remove_duplicates",
     "trades_dict_to_list",
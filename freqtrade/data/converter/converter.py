@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 def ohlcv_to_dataframe(
-    ohlcv: list,
+    ohlcv: list | np.ndarray,
     timeframe: str,
     pair: str,
     *,
@@ -27,6 +27,7 @@ def ohlcv_to_dataframe(
     Converts a list with candle (OHLCV) data (in format returned by ccxt.fetch_ohlcv)
     to a Dataframe
     :param ohlcv: list with candle (OHLCV) data, as returned by exchange.async_get_candle_history
+                  or a float array with the same columns (e.g. websocket candles)
     :param timeframe: timeframe (e.g. 5m). Used to fill up eventual missing data
     :param pair: Pair this data is for (used to warn if fillup was necessary)
     :param fill_missing: fill up missing candles with 0 candles
@@ -38,6 +39,9 @@ def ohlcv_to_dataframe(
     cols = DEFAULT_DATAFRAME_COLUMNS
     df = DataFrame(ohlcv, columns=cols)
 
+    if isinstance(ohlcv, np.ndarray):
+        # Float timestamps are exact - but must be converted as integers.
+        df["date"] = df["date"].astype(np.int64)
     df["date"] = to_datetime(df["date"], unit="ms", utc=True)
 
     # Some exchanges return int values for Volume and even for OHLC.
@@ -94,22 +98,101 @@ def clean_ohlcv_dataframe(
         return data
 
 
-def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
+def ohlcv_append_candles(
+    existing: DataFrame, new: DataFrame, timeframe: str, pair: str
+) -> DataFrame:
     """
-    Fills up missing data with 0 volume rows,
-    using the previous close as price for "open", "high", "low" and "close", volume is set to 0
-
+    Combine cached candles with newly received candles.
+    Equivalent to cleaning the concatenation of both dataframes (with fill_missing),
+    but only touches the candles overlapping with or following the existing candles,
+    instead of grouping the full history.
+    Candles present in both dataframes are combined like clean_ohlcv_dataframe does.
+    :param existing: Candle dataframe (sorted, without duplicates)
+    :param new: Candle dataframe (sorted, without duplicates) to add
+    :param timeframe: timeframe (e.g. 5m). Used to fill up eventual missing data
+    :param pair: Pair this data is for (used to warn if fillup was necessary)
+    :return: DataFrame
     """
-    from freqtrade.exchange import timeframe_to_resample_freq
+    if (
+        existing.empty
+        or new.empty
+        or list(existing.columns) != DEFAULT_DATAFRAME_COLUMNS
+        or list(new.columns) != DEFAULT_DATAFRAME_COLUMNS
+    ):
+        return clean_ohlcv_dataframe(
+            pd.concat([existing, new], axis=0),
+            timeframe,
+            pair,
+            fill_missing=True,
+            drop_incomplete=False,
+        )
+    old_dates = existing["date"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    new_dates = new["date"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    pos = np.searchsorted(old_dates, new_dates)
+    overlap = pos < len(old_dates)
+    if (old_dates[pos[overlap]] != new_dates[overlap]).any():
+        # New candles between existing candles
+        return clean_ohlcv_dataframe(
+            pd.concat([existing, new], axis=0),
+            timeframe,
+            pair,
+            fill_missing=True,
+            drop_incomplete=False,
+        )
+    # Sorted - so overlapping candles come first.
+    n_overlap = int(overlap.sum())
+    idx = pos[:n_overlap]
+
+    columns = {}
+    for col in ("open", "high", "low", "close", "volume"):
+        old_values = existing[col].to_numpy(dtype=np.float64, copy=True)
+        new_values = new[col].to_numpy(dtype=np.float64)
+        upd = new_values[:n_overlap]
+        if col == "open":
+            old_values[idx] = np.where(np.isnan(old_values[idx]), upd, old_values[idx])
+        elif col == "low":
+            old_values[idx] = np.fmin(old_values[idx], upd)
+        elif col == "close":
+            old_values[idx] = np.where(np.isnan(upd), old_values[idx], upd)
+        else:
+            old_values[idx] = np.fmax(old_values[idx], upd)
+        columns[col] = np.concatenate([old_values, new_values[n_overlap:]])
 
-    ohlcv_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
-    resample_interval = timeframe_to_resample_freq(timeframe)
-    # Resample to create "NAN" values
-    df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
+    dates = pd.DatetimeIndex(
+        np.concatenate([old_dates, new_dates[n_overlap:]]).view("datetime64[ns]"), tz="UTC"
+    )
+    df = DataFrame({"date": dates.as_unit(existing["date"].dt.unit), **columns})
+    return ohlcv_fill_up_missing_data(df, timeframe, pair)
 
-    # Forwardfill close for missing columns
+
+def _ohlcv_fill_gaps(dataframe: DataFrame, timeframe: str) -> DataFrame | None:
+    """
+    Fills up missing candles by reindexing to the candle grid, only touching the gap positions.
+    Much cheaper than resampling - and a no-op for data without gaps.
+    :return: Filled dataframe - or None if the data is not sorted, unique and aligned
+             to the candle grid, and therefore needs resampling.
+    """
+    from freqtrade.exchange import timeframe_to_seconds
+
+    if dataframe.empty or list(dataframe.columns) != DEFAULT_DATAFRAME_COLUMNS:
+        return None
+    tf_ns = timeframe_to_seconds(timeframe) * 1_000_000_000
+    dates = dataframe["date"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    diffs = np.diff(dates)
+    # Resampling bins start at midnight of the first day.
+    day_ns = 86400 * 1_000_000_000
+    if (diffs <= 0).any() or (diffs % tf_ns).any() or (dates[0] % day_ns) % tf_ns:
+        return None
+    if (diffs == tf_ns).all():
+        # No gaps
+        return dataframe
+
+    positions = (dates - dates[0]) // tf_ns
+    df = dataframe.set_index(positions).reindex(np.arange(positions[-1] + 1))
+    df["date"] = pd.date_range(
+        start=dataframe["date"].iloc[0], periods=len(df), freq=f"{tf_ns // 1_000_000_000}s"
+    ).as_unit(dataframe["date"].dt.unit)
     df["close"] = df["close"].ffill()
-    # Use close for "open, high, low"
     df.loc[:, ["open", "high", "low"]] = df[["open", "high", "low"]].fillna(
         value={
             "open": df["close"],
@@ -117,7 +200,40 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
             "low": df["close"],
         }
     )
-    df.reset_index(inplace=True)
+    df["volume"] = df["volume"].fillna(0)
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+
+def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
+    """
+    Fills up missing data with 0 volume rows,
+    using the previous close as price for "open", "high", "low" and "close", volume is set to 0
+
+    """
+    from freqtrade.exchange import timeframe_to_resample_freq
+
+    ohlcv_dict = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    resample_interval = timeframe_to_resample_freq(timeframe)
+    df = None
+    if resample_interval.endswith("s"):
+        # Fixed size candles - avoid the resample if possible.
+        df = _ohlcv_fill_gaps(dataframe, timeframe)
+    if df is None:
+        # Resample to create "NAN" values
+        df = dataframe.resample(resample_interval, on="date").agg(ohlcv_dict)
+
+        # Forwardfill close for missing columns
+        df["close"] = df["close"].ffill()
+        # Use close for "open, high, low"
+        df.loc[:, ["open", "high", "low"]] = df[["open", "high", "low"]].fillna(
+            value={
+                "open": df["close"],
+                "high": df["close"],
+                "low": df["close"],
+            }
+        )
+        df.reset_index(inplace=True)
     len_before = len(dataframe)
     len_after = len(df)
     pct_missing = (len_after - len_before) / len_before if len_before > 0 else 0
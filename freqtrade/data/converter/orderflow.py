@@ -4,7 +4,7 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
+from itertools import pairwise
 
 import numpy as np
 import pandas as pd
@@ -76,17 +76,101 @@ def _calculate_ohlcv_candle_start_and_end(df: pd.DataFrame, timeframe: str):
         df.drop(columns=["datetime"], inplace=True)
 
 
+class OrderflowCache:
+    """
+    Orderflow results of one pair, indexed by candle date.
+    Remembers the last processed trade - so only candles with new trades (usually the latest
+    one or two) have to be recalculated.
+    Expects trades in chronological order.
+    """
+
+    def __init__(self) -> None:
+        # Candles which were calculated (including candles without trades)
+        self.candles = pd.DatetimeIndex([])
+        # Orderflow of the candles with trades
+        self.results: pd.DataFrame | None = None
+        self._last_trade: tuple[int, str] | None = None
+
+    def __len__(self) -> int:
+        return len(self.candles)
+
+    def _changed_since(self, trades: pd.DataFrame, timeframe: str) -> int | None:
+        """
+        Start (in ms) of the first candle which may contain trades that weren't processed yet.
+        :return: None if there are no new trades
+        """
+        from freqtrade.exchange import timeframe_to_resample_freq
+
+        if self._last_trade == (int(trades["timestamp"].iat[-1]), str(trades["id"].iat[-1])):
+            return None
+        if self._last_trade is None or self._last_trade[0] < trades["timestamp"].iat[0]:
+            # All trades are new
+            return 0
+        # New trades were appended - they may also belong to the candle of the last known trade
+        candle_start = pd.Timestamp(self._last_trade[0], unit="ms").floor(
+            timeframe_to_resample_freq(timeframe)
+        )
+        return candle_start.value // 1_000_000
+
+    def update(
+        self,
+        trades: pd.DataFrame,
+        candles: pd.DatetimeIndex,
+        timeframe: str,
+        config_orderflow: dict,
+    ) -> None:
+        """
+        Recalculate the orderflow of candles which are not known yet or got new trades.
+        :param trades: Trades in chronological order
+        :param candles: Candles which should have orderflow results
+        """
+        recalculate = ~candles.isin(self.candles)
+        changed_since = self._changed_since(trades, timeframe)
+        if changed_since is not None:
+            recalculate |= candles.asi8 >= changed_since * 1_000_000
+        self._last_trade = (int(trades["timestamp"].iat[-1]), str(trades["id"].iat[-1]))
+        if not recalculate.any():
+            return
+
+        candles = candles[recalculate]
+        # Only the trades of the candles to recalculate (and later ones) are needed
+        first_trade = trades["timestamp"].searchsorted(candles[0].value // 1_000_000)
+        candle_trades = trades.iloc[first_trade:].copy()
+        _calculate_ohlcv_candle_start_and_end(candle_trades, timeframe)
+        candle_trades = candle_trades.loc[candle_trades["candle_start"].isin(candles)]
+
+        kept = self.candles[~self.candles.isin(candles)]
+        self.candles = kept.union(candles) if len(kept) else candles
+        if self.results is not None:
+            self.results = self.results.loc[self.results.index.isin(kept)]
+        if not candle_trades.empty:
+            orderflow = trades_to_orderflow(candle_trades, config_orderflow)
+            if self.results is None or self.results.empty:
+                self.results = orderflow
+            else:
+                self.results = pd.concat([self.results, orderflow]).sort_index()
+
+    def evict(self, before: pd.Timestamp) -> None:
+        """
+        Drop the results of candles older than before
+        """
+        self.candles = self.candles[self.candles >= before]
+        if self.results is not None:
+            self.results = self.results.loc[self.results.index >= before]
+
+
 def populate_dataframe_with_trades(
-    cached_grouped_trades: pd.DataFrame | None,
+    cached_grouped_trades: OrderflowCache | None,
     config: Config,
     dataframe: pd.DataFrame,
     trades: pd.DataFrame,
-) -> tuple[pd.DataFrame, pd.DataFrame]:
+) -> tuple[pd.DataFrame, OrderflowCache | None]:
     """
     Populates a dataframe with trades
+    :param cached_grouped_trades: Orderflow cache of the pair, returned by a previous call
     :param dataframe: Dataframe to populate
-    :param trades: Trades to populate with
-    :return: Dataframe with trades populated
+    :param trades: Trades to populate with, in chronological order
+    :return: Dataframe with trades populated and the updated orderflow cache
     """
 
     timeframe = config["timeframe"]
@@ -99,93 +183,183 @@ def populate_dataframe_with_trades(
 
     try:
         start_time = time.time()
-        # calculate ohlcv candle start and end
-        _calculate_ohlcv_candle_start_and_end(trades, timeframe)
+        cache = cached_grouped_trades if cached_grouped_trades is not None else OrderflowCache()
 
-        # get date of earliest max_candles candle
+        # dataframe row of each candle - there can only be one row with the same date
+        candle_rows = pd.Series(dataframe.index, index=dataframe["date"])
+        candle_rows = candle_rows.loc[~candle_rows.index.duplicated()]
+        # only the latest max_candles candles get orderflow
         max_candles = config_orderflow["max_candles"]
-        start_date = dataframe.tail(max_candles).date.iat[0]
-        # slice of trades that are before current ohlcv candles to make groupby faster
-        trades = trades.loc[trades["candle_start"] >= start_date]
-        trades.reset_index(inplace=True, drop=True)
-
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance(
-                    imbalances, label="bid", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance(
-                    imbalances, label="ask", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+        candles = pd.DatetimeIndex(candle_rows.index[-max_candles:])
+
+        cache.update(trades, candles, timeframe, config_orderflow)
+        if cache.results is not None:
+            orderflow = cache.results.loc[cache.results.index.isin(candles)]
+            _set_orderflow_columns(dataframe, candle_rows[orderflow.index].to_numpy(), orderflow)
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
-        # Cache the entire dataframe
-        cached_grouped_trades = dataframe.tail(config_orderflow["cache_size"]).copy()
+        # Keep the latest cache_size candles
+        cache.evict(max(candles[0], candle_rows.index[-config_orderflow["cache_size"] :][0]))
 
     except Exception as e:
         logger.exception("Error populating dataframe with trades")
         raise DependencyException(e)
 
-    return dataframe, cached_grouped_trades
+    return dataframe, cache
+
+
+def _set_orderflow_columns(dataframe: pd.DataFrame, rows: np.ndarray, values: pd.DataFrame):
+    """
+    Set the orderflow columns of the dataframe rows (index labels) to values (in the same order)
+    """
+    if len(rows) == 0:
+        return
+    for column in ORDERFLOW_ADDED_COLUMNS:
+        dataframe.loc[rows, column] = pd.Series(values[column].to_numpy(), index=rows)
+
+
+def trades_to_orderflow(trades: pd.DataFrame, config_orderflow: dict) -> pd.DataFrame:
+    """
+    Calculate the orderflow of all candles at once.
+    :param trades: Trades with a "candle_start" column
+    :param config_orderflow: orderflow configuration
+    :return: DataFrame with ORDERFLOW_ADDED_COLUMNS as columns, indexed by candle start.
+        The "trades" column is only populated if `store_trades` is enabled.
+    """
+    codes, candle_starts = pd.factorize(trades["candle_start"], sort=True)
+    # Stable sort keeps the order of trades within each candle
+    order = np.argsort(codes, kind="stable")
+    trades = trades.iloc[order]
+    codes = codes[order]
+    # Position of the first trade of each candle (and the end of the last one)
+    trade_bounds = np.searchsorted(codes, np.arange(len(candle_starts) + 1))
+
+    is_sell = trades["side"].str.contains("sell").to_numpy()
+    is_buy = trades["side"].str.contains("buy").to_numpy()
+    amount = trades["amount"].to_numpy()
+    bid_amount = np.where(is_sell, amount, 0)
+    ask_amount = np.where(is_buy, amount, 0)
+    per_trade = pd.DataFrame(
+        {
+            "candle": codes,
+            "bid_amount": bid_amount,
+            "ask_amount": ask_amount,
+            "cum_delta": pd.Series(ask_amount - bid_amount).groupby(codes).cumsum().to_numpy(),
+        }
+    )
+    result = per_trade.groupby("candle").agg(
+        max_delta=("cum_delta", "max"),
+        min_delta=("cum_delta", "min"),
+        bid=("bid_amount", "sum"),
+        ask=("ask_amount", "sum"),
+        total_trades=("cum_delta", "size"),
+    )
+    result["delta"] = result["ask"] - result["bid"]
+
+    # Volume profile - a histogram of candles x price levels
+    scale = config_orderflow["scale"]
+    levels = pd.DataFrame(
+        {
+            "candle": codes,
+            "price": ((trades["price"] / scale).round() * scale).astype("float64").to_numpy(),
+            "bid": np.where(is_sell, 1, 0),
+            "ask": np.where(is_buy, 1, 0),
+            "delta": ask_amount - bid_amount,
+            "bid_amount": bid_amount,
+            "ask_amount": ask_amount,
+            "total_volume": ask_amount + bid_amount,
+        }
+    )
+    levels["total_trades"] = levels["ask"] + levels["bid"]
+    levels = levels.groupby(["candle", "price"]).sum()
+    level_codes = levels.index.get_level_values("candle").to_numpy()
+    level_bounds = np.searchsorted(level_codes, np.arange(len(candle_starts) + 1))
+    prices = levels.index.get_level_values("price").tolist()
+
+    imbalances = _volumeprofile_to_imbalances(
+        levels,
+        imbalance_ratio=config_orderflow["imbalance_ratio"],
+        imbalance_volume=config_orderflow["imbalance_volume"],
+    )
+    stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
+    for label in ("bid", "ask"):
+        stacked = _stacked_imbalances(
+            imbalances[f"{label}_imbalance"], level_codes, prices, stacked_imbalance_range
+        )
+        result[f"stacked_imbalances_{label}"] = [stacked.get(code, []) for code in result.index]
+
+    result["orderflow"] = _split_per_candle(levels.to_dict(orient="records"), level_bounds, prices)
+    result["imbalances"] = _split_per_candle(
+        imbalances.to_dict(orient="records"), level_bounds, prices
+    )
+    if config_orderflow.get("store_trades", True):
+        trade_records = trades.drop(columns=["candle_start", "candle_end"]).to_dict(
+            orient="records"
+        )
+        result["trades"] = _split_per_candle(trade_records, trade_bounds)
+    else:
+        result["trades"] = np.nan
+
+    result.index = candle_starts
+    return result[ORDERFLOW_ADDED_COLUMNS]
+
+
+def _split_per_candle(records: list, bounds: np.ndarray, keys: list | None = None) -> list:
+    """
+    Split records (ordered by candle) into one list - or dict with keys - per candle
+    :param bounds: Position of the first record of each candle, followed by len(records)
+    """
+    if keys is None:
+        return [records[start:end] for start, end in pairwise(bounds)]
+    return [
+        dict(zip(keys[start:end], records[start:end], strict=False))
+        for start, end in pairwise(bounds)
+    ]
+
+
+def _volumeprofile_to_imbalances(
+    levels: pd.DataFrame, imbalance_ratio: int, imbalance_volume: int
+) -> pd.DataFrame:
+    """
+    Vectorized trades_orderflow_to_imbalances() for the volume profiles of multiple candles
+    :param levels: volume profiles, indexed by candle and price level
+    """
+    bid = levels["bid"]
+    # compares bid and ask diagonally (within the same candle)
+    ask = levels["ask"].groupby(level="candle").shift(-1)
+    enough_volume = levels["total_volume"] >= imbalance_volume
+    return pd.DataFrame(
+        {
+            "bid_imbalance": ((bid / ask) > imbalance_ratio) & enough_volume,
+            "ask_imbalance": ((ask / bid) > imbalance_ratio) & enough_volume,
+        },
+        index=levels.index,
+    )
+
+
+def _stacked_imbalances(
+    imbalance: pd.Series, level_codes: np.ndarray, prices: list, stacked_imbalance_range: int
+) -> pd.Series:
+    """
+    Vectorized stacked_imbalance() for the imbalances of multiple candles
+    :return: Series with the list of stacked imbalance prices, indexed by candle
+    """
+    int_series = pd.Series(np.where(imbalance, 1, 0))
+    candle = pd.Series(level_codes)
+    # Group consecutive True values (within the same candle) and get their counts
+    groups = ((int_series != int_series.shift()) | (candle != candle.shift())).cumsum()
+    counts = int_series.groupby(groups).cumsum().to_numpy()
+
+    # Find indices where count meets or exceeds the range requirement
+    valid_indices = np.flatnonzero(counts >= stacked_imbalance_range)
+    # Get all prices from valid indices from beginning of the range
+    range_start = valid_indices - (stacked_imbalance_range - 1)
+    return (
+        pd.Series(np.asarray(prices)[range_start], index=level_codes[valid_indices])
+        .groupby(level=0)
+        .agg(list)
+    )
 
 
 def trades_to_volumeprofile_with_total_delta_bid_ask(
@@ -3,6 +3,7 @@ Functions to convert data from one format to another
 """
 
 import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import pandas as pd
@@ -33,6 +34,28 @@ def trades_df_remove_duplicates(trades: pd.DataFrame) -> pd.DataFrame:
     return trades.drop_duplicates(subset=["timestamp", "id"])
 
 
+def trades_chunks_remove_duplicates(chunks: Iterable[DataFrame]) -> Iterator[DataFrame]:
+    """
+    Removes duplicates from time-ordered trades chunks - also across chunk boundaries.
+    :param chunks: DataFrames with the columns constants.DEFAULT_TRADES_COLUMNS
+    :return: Iterator of non-empty DataFrames with duplicates removed
+    """
+    last_ts = None
+    last_ids: set[str] = set()
+    for chunk in chunks:
+        chunk = trades_df_remove_duplicates(chunk)
+        if last_ts is not None:
+            # Duplicates of the previous chunk's last trades
+            chunk = chunk.loc[
+                (chunk["timestamp"] != last_ts) | ~chunk["id"].astype(str).isin(last_ids)
+            ]
+        if chunk.empty:
+            continue
+        last_ts = chunk.iloc[-1]["timestamp"]
+        last_ids = set(chunk.loc[chunk["timestamp"] == last_ts, "id"].astype(str))
+        yield chunk
+
+
 def trades_dict_to_list(trades: list[dict]) -> TradeList:
     """
     Convert fetch_trades result into a List (to be more memory efficient).
@@ -89,6 +112,43 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def trades_chunks_to_ohlcv(
+    trades_chunks: Iterable[DataFrame], timeframes: list[str]
+) -> dict[str, DataFrame]:
+    """
+    Converts time-ordered chunks of trades to OHLCV for multiple timeframes, in one pass.
+    Only one chunk of trades is held in memory at a time - candles spanning
+    multiple chunks are combined.
+    :param trades_chunks: Time-ordered trades dataframes (e.g. from trades_load_chunks()).
+    :param timeframes: Timeframes to resample data to
+    :return: dict of OHLCV Dataframes, keyed by timeframe.
+    :raises: ValueError if no trades are provided
+    """
+    candles: dict[str, list[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+    for trades in trades_chunks:
+        if trades.empty:
+            continue
+        for timeframe in timeframes:
+            candles[timeframe].append(trades_to_ohlcv(trades, timeframe))
+
+    result = {}
+    for timeframe, parts in candles.items():
+        if not parts:
+            raise ValueError("Trade-list empty.")
+        if len(parts) == 1:
+            result[timeframe] = parts[0]
+            continue
+        df = pd.concat(parts).reset_index(drop=True)
+        if df["date"].duplicated().any():
+            # Candles split across chunks
+            df = df.groupby("date", sort=False).agg(
+                {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+            )
+            df["date"] = df.index
+        result[timeframe] = df.loc[:, DEFAULT_DATAFRAME_COLUMNS]
+    return result
+
+
 def convert_trades_to_ohlcv(
     pairs: list[str],
     timeframes: list[str],
@@ -101,6 +161,7 @@ def convert_trades_to_ohlcv(
 ) -> None:
     """
     Convert stored trades data to ohlcv data
+    :param timerange: Only convert trades within this timerange
     """
     from freqtrade.data.history import get_datahandler
 
@@ -113,17 +174,28 @@ def convert_trades_to_ohlcv(
     )
     trading_mode = TradingMode.FUTURES if candle_type != CandleType.SPOT else TradingMode.SPOT
     for pair in pairs:
-        trades = data_handler_trades.trades_load(pair, trading_mode)
+        try:
+            # Stream trades in chunks - full trades histories may not fit into memory.
+            ohlcvs = trades_chunks_to_ohlcv(
+                data_handler_trades.trades_load_chunks(pair, trading_mode, timerange=timerange),
+                timeframes,
+            )
+        except ValueError:
+            ohlcvs = {}
+        except Exception:
+            logger.exception(f"Error loading trades for {pair}")
+            ohlcvs = {}
         for timeframe in timeframes:
             if erase:
                 if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                     logger.info(f"Deleting existing data for pair {pair}, interval {timeframe}.")
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
+            if timeframe not in ohlcvs:
                 logger.warning(f"Could not convert {pair} to OHLCV.")
+                continue
+            # Store ohlcv
+            data_handler_ohlcv.ohlcv_store(
+                pair, timeframe, data=ohlcvs[timeframe], candle_type=candle_type
+            )
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
@@ -155,9 +227,11 @@ def convert_trades_format(config: Config, convert_from: str, convert_to: str, er
     logger.info(f"Converting trades for {config['pairs']}")
     trading_mode: TradingMode = config.get("trading_mode", TradingMode.SPOT)
     for pair in config["pairs"]:
-        data = src.trades_load(pair, trading_mode)
-        logger.info(f"Converting {len(data)} trades for {pair}")
-        trg.trades_store(pair, data, trading_mode)
+        logger.info(f"Converting trades for {pair}")
+        count = trg.trades_store_chunks(
+            pair, src.trades_load_chunks(pair, trading_mode), trading_mode
+        )
+        logger.info(f"Converted {count} trades for {pair}")
 
         if erase and convert_from != convert_to:
             logger.info(f"Deleting source Trade data for {pair}.")
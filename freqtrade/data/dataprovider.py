@@ -439,15 +439,17 @@ class DataProvider:
         self,
         pairlist: ListPairsWithTimeframes,
         helping_pairs: ListPairsWithTimeframes | None = None,
+        priority_pairs: list[str] | None = None,
     ) -> None:
         """
         Refresh data, called with each cycle
+        :param priority_pairs: Pairs to refresh first (pairs with open trades)
         """
         if self._exchange is None:
             raise OperationalException(NO_EXCHANGE_EXCEPTION)
         final_pairs = (pairlist + helping_pairs) if helping_pairs else pairlist
         # refresh latest ohlcv data
-        self._exchange.refresh_latest_ohlcv(final_pairs)
+        self._exchange.refresh_latest_ohlcv(final_pairs, priority_pairs=priority_pairs)
         # refresh latest trades data
         self.refresh_latest_trades(pairlist)
 
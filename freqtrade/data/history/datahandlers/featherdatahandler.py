@@ -1,16 +1,26 @@
 import logging
+import re
+import shutil
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
-from pandas import DataFrame, read_feather, to_datetime
+import pyarrow as pa
+from pandas import DataFrame, concat, read_feather, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
 
-from .idatahandler import IDataHandler
+from .idatahandler import TRADES_CHUNK_SIZE, IDataHandler
 
 
 logger = logging.getLogger(__name__)
 
+# Number of small appended trades segments kept before they're merged.
+TRADES_MAX_SMALL_SEGMENTS = 16
+
+_SEGMENT_REGEX = re.compile(r"^segment-(\d+)-(\d+)-(\d+)\.feather$")
+
 
 class FeatherDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
@@ -90,6 +100,71 @@ class FeatherDataHandler(IDataHandler):
         """
         raise NotImplementedError()
 
+    @staticmethod
+    def _trades_segments_dir(filename: Path) -> Path:
+        return filename.with_name(f"{filename.stem}-segments")
+
+    @staticmethod
+    def _get_trades_segments(dirname: Path) -> list[tuple[int, int, int, Path]]:
+        """
+        Get all appended segments of a trades file, in the order they were written.
+        :return: List of (sequence, first timestamp, last timestamp, path) tuples
+        """
+        if not dirname.is_dir():
+            return []
+        segments = []
+        for p in dirname.iterdir():
+            if match := _SEGMENT_REGEX.match(p.name):
+                segments.append((int(match[1]), int(match[2]), int(match[3]), p))
+        return sorted(segments)
+
+    @staticmethod
+    def _trades_file_rows(filename: Path) -> int:
+        with pa.memory_map(str(filename)) as source:
+            reader = pa.ipc.open_file(source)
+            return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+    @staticmethod
+    def _trades_file_last_timestamp(filename: Path) -> int | None:
+        with pa.memory_map(str(filename)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in reversed(range(reader.num_record_batches)):
+                batch = reader.get_batch(i)
+                if batch.num_rows > 0:
+                    return batch.column("timestamp")[-1].as_py()
+        return None
+
+    def _write_trades_file(self, filename: Path, chunks: Iterable[DataFrame]) -> int:
+        """
+        Write trades chunks as record batches to a temporary file,
+        which replaces filename once complete. Nothing is written if there are no trades.
+        :return: Number of trades written
+        """
+        tmp_file = filename.with_name(f".tmp-{filename.name}")
+        count = 0
+        writer = None
+        try:
+            for chunk in chunks:
+                table = self._trades_to_arrow(chunk)
+                if writer is None:
+                    writer = pa.ipc.new_file(
+                        tmp_file,
+                        table.schema,
+                        options=pa.ipc.IpcWriteOptions(compression=pa.Codec("lz4", 9)),
+                    )
+                writer.write_table(table)
+                count += len(chunk)
+        except Exception:
+            if writer is not None:
+                writer.close()
+            tmp_file.unlink(missing_ok=True)
+            raise
+        if writer is None:
+            return 0
+        writer.close()
+        tmp_file.replace(filename)
+        return count
+
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -100,33 +175,190 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
+        shutil.rmtree(self._trades_segments_dir(filename), ignore_errors=True)
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def _trades_append(
+        self,
+        pair: str,
+        data: DataFrame,
+        trading_mode: TradingMode,
+        keep_since_ms: int | None,
+    ) -> None:
         """
-        Append data to existing files
+        Append trades data as a new segment, without rewriting existing data.
+        Small segments are merged once there are more than TRADES_MAX_SMALL_SEGMENTS of them.
+        Only complete segments (and the initial file) are dropped by keep_since_ms.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param keep_since_ms: Drop segments with only trades older than this timestamp
         """
-        raise NotImplementedError()
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        dirname = self._trades_segments_dir(filename)
+        segments = self._get_trades_segments(dirname)
+        last_ts: int | None
+        if segments:
+            last_ts = segments[-1][2]
+        elif filename.exists():
+            last_ts = self._trades_file_last_timestamp(filename)
+        else:
+            if keep_since_ms is not None:
+                data = data.loc[data["timestamp"] >= keep_since_ms]
+            self._trades_store(pair, data, trading_mode)
+            return
+
+        if last_ts is not None:
+            data = data.loc[data["timestamp"] >= last_ts]
+        if not data.empty:
+            dirname.mkdir(parents=True, exist_ok=True)
+            seq = segments[-1][0] + 1 if segments else 0
+            first, last = int(data["timestamp"].iat[0]), int(data["timestamp"].iat[-1])
+            segment = dirname / f"segment-{seq}-{first}-{last}.feather"
+            self._write_trades_file(segment, [data])
+            segments.append((seq, first, last, segment))
+
+        if keep_since_ms is not None:
+            if filename.exists():
+                file_last_ts = self._trades_file_last_timestamp(filename)
+                if file_last_ts is None or file_last_ts < keep_since_ms:
+                    filename.unlink()
+            for segment_info in [s for s in segments if s[2] < keep_since_ms]:
+                segment_info[3].unlink()
+                segments.remove(segment_info)
+
+        self._trades_compact(dirname, segments)
+
+    def _trades_compact(self, dirname: Path, segments: list[tuple[int, int, int, Path]]) -> None:
+        """
+        Merge the latest small segments (less than TRADES_CHUNK_SIZE trades) into one segment,
+        once there are more than TRADES_MAX_SMALL_SEGMENTS of them.
+        Segments which reached TRADES_CHUNK_SIZE trades are never rewritten.
+        """
+        small: list[tuple[int, int, int, Path]] = []
+        for segment_info in reversed(segments):
+            if self._trades_file_rows(segment_info[3]) >= TRADES_CHUNK_SIZE:
+                break
+            small.insert(0, segment_info)
+        if len(small) <= TRADES_MAX_SMALL_SEGMENTS:
+            return
+        seq, first, last = small[0][0], small[0][1], small[-1][2]
+        merged = dirname / f"segment-{seq}-{first}-{last}.feather"
+        self._write_trades_file(merged, (read_feather(segment_info[3]) for segment_info in small))
+        for segment_info in small:
+            if segment_info[3] != merged:
+                segment_info[3].unlink()
+        logger.debug(f"Merged {len(small)} trades segments into {merged}.")
+
+    def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
+        """
+        Remove data for this pair, including appended segments
+        :param pair: Delete data for this pair.
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        dirname = self._trades_segments_dir(filename)
+        deleted = False
+        if dirname.is_dir():
+            shutil.rmtree(dirname)
+            deleted = True
+        if filename.exists():
+            filename.unlink()
+            deleted = True
+        return deleted
+
+    def _trades_store_chunks(
+        self, pair: str, chunks: Iterable[DataFrame], trading_mode: TradingMode
+    ) -> int:
+        """
+        Store trades data from time-ordered chunks, replacing existing data.
+        Chunks are written as record batches to a temporary file, which replaces the
+        existing file once complete.
+        :param pair: Pair - used for filename
+        :param chunks: Dataframes containing trades
+                       column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: Number of trades stored
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self.create_dir_if_needed(filename)
+        tmp_file = filename.with_name(f".chunks-{filename.name}")
+        count = self._write_trades_file(tmp_file, chunks)
+        if count == 0:
+            self._trades_store(pair, DataFrame(columns=DEFAULT_TRADES_COLUMNS), trading_mode)
+            return 0
+        shutil.rmtree(self._trades_segments_dir(filename), ignore_errors=True)
+        tmp_file.replace(filename)
+        return count
+
+    def _trades_files(self, pair: str, trading_mode: TradingMode) -> list[Path]:
+        """
+        Files containing trades of this pair, in chronological order
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        files = [filename] if filename.exists() else []
+        files.extend(s[3] for s in self._get_trades_segments(self._trades_segments_dir(filename)))
+        return files
+
+    def _trades_load_chunks(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+        timerange: TimeRange | None = None,
+        chunk_size: int = TRADES_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair's trades from file in time-ordered chunks.
+        Files are memory-mapped, and only record batches overlapping the timerange are read.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        start_ms, stop_ms = self._trades_timerange_ms(timerange)
+        for filename in self._trades_files(pair, trading_mode):
+            with pa.memory_map(str(filename)) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    if batch.num_rows == 0:
+                        continue
+                    timestamps = batch.column("timestamp")
+                    if start_ms is not None and timestamps[-1].as_py() < start_ms:
+                        continue
+                    if stop_ms is not None and timestamps[0].as_py() > stop_ms:
+                        return
+                    for offset in range(0, batch.num_rows, chunk_size):
+                        chunk = self._trades_trim(
+                            batch.slice(offset, chunk_size).to_pandas(), timerange
+                        )
+                        if not chunk.empty:
+                            yield chunk
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
         Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: Dataframe containing trades
         """
-        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
-        if not filename.exists():
+        files = self._trades_files(pair, trading_mode)
+        if not files:
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_feather(filename)
+        if timerange or len(files) > 1:
+            chunks = list(self._trades_load_chunks(pair, trading_mode, timerange))
+            if not chunks:
+                return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+            return concat(chunks, ignore_index=True)
+
+        tradesdata = read_feather(files[0])
 
         return tradesdata
 
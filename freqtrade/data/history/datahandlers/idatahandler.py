@@ -7,17 +7,20 @@ It's subclasses handle and storing data from disk.
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from copy import deepcopy
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS, TRADES_DTYPES, ListPairsWithTimeframes
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
+    trades_chunks_remove_duplicates,
     trades_convert_types,
     trades_df_remove_duplicates,
     trim_dataframe,
@@ -27,12 +30,21 @@ from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_seconds
 
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
 logger = logging.getLogger(__name__)
 
+# Number of trades per chunk when streaming trades data.
+TRADES_CHUNK_SIZE = 500_000
+
 
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # Does this datahandler implement ohlcv_append()?
+    ohlcv_append_supported = False
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
@@ -198,17 +210,18 @@ class IDataHandler(ABC):
         :param trading_mode: Trading mode to use (used to determine the filename)
         :return: (min, max, len)
         """
-        df = self._trades_load(pair, trading_mode)
-        if df.empty:
-            return (
-                datetime.fromtimestamp(0, tz=UTC),
-                datetime.fromtimestamp(0, tz=UTC),
-                0,
-            )
+        first_ts, last_ts, count = 0, 0, 0
+        for chunk in self._trades_load_chunks(pair, trading_mode):
+            if chunk.empty:
+                continue
+            if not count:
+                first_ts = chunk.iloc[0]["timestamp"]
+            last_ts = chunk.iloc[-1]["timestamp"]
+            count += len(chunk)
         return (
-            to_datetime(df.iloc[0]["timestamp"], unit="ms", utc=True).to_pydatetime(),
-            to_datetime(df.iloc[-1]["timestamp"], unit="ms", utc=True).to_pydatetime(),
-            len(df),
+            to_datetime(first_ts, unit="ms", utc=True).to_pydatetime(),
+            to_datetime(last_ts, unit="ms", utc=True).to_pydatetime(),
+            count,
         )
 
     @classmethod
@@ -236,14 +249,32 @@ class IDataHandler(ABC):
         :param trading_mode: Trading mode to use (used to determine the filename)
         """
 
-    @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def _trades_append(
+        self,
+        pair: str,
+        data: DataFrame,
+        trading_mode: TradingMode,
+        keep_since_ms: int | None,
+    ) -> None:
         """
-        Append data to existing files
+        Append trades data to existing data.
+        Rewrites the whole file - handlers supporting real appends override this.
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param keep_since_ms: Drop stored trades older than this timestamp
         """
+        trades = self._trades_load(pair, trading_mode)
+        if not trades.empty:
+            data = data.loc[data["timestamp"] >= trades["timestamp"].iat[-1]]
+            if not data.empty:
+                trades = concat([trades, data], ignore_index=True)
+        else:
+            trades = data
+        if keep_since_ms is not None:
+            trades = trades.loc[trades["timestamp"] >= keep_since_ms]
+        self._trades_store(pair, trades.reset_index(drop=True), trading_mode)
 
     @abstractmethod
     def _trades_load(
@@ -253,10 +284,97 @@ class IDataHandler(ABC):
         Load a pair from file, either .json.gz or .json
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: Dataframe containing trades
         """
 
+    def _trades_load_chunks(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+        timerange: TimeRange | None = None,
+        chunk_size: int = TRADES_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair's trades from file in time-ordered chunks.
+        This default implementation loads the full file at once - datahandlers able to read
+        parts of a file should override this to keep memory usage bounded.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        trades = self._trades_load(pair, trading_mode, timerange=timerange)
+        for start in range(0, len(trades), chunk_size):
+            yield trades.iloc[start : start + chunk_size]
+
+    def _trades_store_chunks(
+        self, pair: str, chunks: Iterable[DataFrame], trading_mode: TradingMode
+    ) -> int:
+        """
+        Store trades data from time-ordered chunks, replacing existing data.
+        This default implementation combines all chunks before storing them.
+        :param pair: Pair - used for filename
+        :param chunks: Dataframes containing trades
+                       column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: Number of trades stored
+        """
+        parts = list(chunks)
+        data = (
+            concat(parts, ignore_index=True) if parts else DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+        )
+        self._trades_store(pair, data, trading_mode)
+        return len(data)
+
+    @staticmethod
+    def _trades_timerange_ms(timerange: TimeRange | None) -> tuple[int | None, int | None]:
+        """
+        Get the start and stop timestamps (in ms) of a timerange - None if unbounded.
+        """
+        start_ms, stop_ms = None, None
+        if timerange:
+            if timerange.starttype == "date":
+                start_ms = timerange.startts * 1000
+            if timerange.stoptype == "date":
+                stop_ms = timerange.stopts * 1000
+        return start_ms, stop_ms
+
+    @staticmethod
+    def _trades_to_arrow(trades: DataFrame) -> "pa.Table":
+        """
+        Convert trades to a pyarrow table with a fixed schema,
+        so chunks of the same file always share one schema.
+        """
+        import pyarrow as pa
+
+        schema = pa.schema(
+            [
+                ("timestamp", pa.int64()),
+                ("id", pa.string()),
+                ("type", pa.string()),
+                ("side", pa.string()),
+                ("price", pa.float64()),
+                ("amount", pa.float64()),
+                ("cost", pa.float64()),
+            ]
+        )
+        trades = trades[DEFAULT_TRADES_COLUMNS].astype(TRADES_DTYPES)
+        return pa.Table.from_pandas(trades, schema=schema, preserve_index=False)
+
+    @classmethod
+    def _trades_trim(cls, trades: DataFrame, timerange: TimeRange | None) -> DataFrame:
+        """
+        Remove trades outside of the timerange.
+        """
+        start_ms, stop_ms = cls._trades_timerange_ms(timerange)
+        if start_ms is not None:
+            trades = trades.loc[trades["timestamp"] >= start_ms]
+        if stop_ms is not None:
+            trades = trades.loc[trades["timestamp"] <= stop_ms]
+        return trades
+
     def trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -268,6 +386,26 @@ class IDataHandler(ABC):
         # Filter on expected columns (will remove the actual date column).
         self._trades_store(pair, data[DEFAULT_TRADES_COLUMNS], trading_mode)
 
+    def trades_append(
+        self,
+        pair: str,
+        data: DataFrame,
+        trading_mode: TradingMode,
+        *,
+        keep_since_ms: int | None = None,
+    ) -> None:
+        """
+        Append trades data to existing data.
+        Only trades not older than the last stored trade are appended.
+        :param pair: Pair - used for filename
+        :param data: Dataframe containing trades, in chronological order
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param keep_since_ms: Drop stored trades older than this timestamp.
+                              Handlers may keep some older trades to avoid rewriting data.
+        """
+        self._trades_append(pair, data[DEFAULT_TRADES_COLUMNS], trading_mode, keep_since_ms)
+
     def trades_purge(self, pair: str, trading_mode: TradingMode) -> bool:
         """
         Remove data for this pair
@@ -281,6 +419,47 @@ class IDataHandler(ABC):
             return True
         return False
 
+    def trades_store_chunks(
+        self, pair: str, chunks: Iterable[DataFrame], trading_mode: TradingMode
+    ) -> int:
+        """
+        Store trades data from time-ordered chunks, replacing existing data.
+        Chunks are consumed one by one - so they may be produced lazily
+        (e.g. by trades_load_chunks() of the same pair).
+        :param pair: Pair - used for filename
+        :param chunks: Dataframes containing trades
+                       column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: Number of trades stored
+        """
+        return self._trades_store_chunks(
+            pair,
+            (chunk[DEFAULT_TRADES_COLUMNS] for chunk in chunks if not chunk.empty),
+            trading_mode,
+        )
+
+    def trades_load_chunks(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+        timerange: TimeRange | None = None,
+        chunk_size: int = TRADES_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair's trades in time-ordered chunks, to keep memory usage bounded.
+        Removes duplicates (also across chunk boundaries) and converts types like trades_load().
+        Unlike trades_load(), errors while reading the data are raised.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of non-empty Dataframes containing trades
+        """
+        for chunk in trades_chunks_remove_duplicates(
+            self._trades_load_chunks(pair, trading_mode, timerange, chunk_size)
+        ):
+            yield trades_convert_types(chunk)
+
     def trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
@@ -289,7 +468,7 @@ class IDataHandler(ABC):
         Removes duplicates in the process.
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: List of trades
         """
         try:
@@ -565,6 +744,10 @@ def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
         from .parquetdatahandler import ParquetDataHandler
 
         return ParquetDataHandler
+    elif datatype == "parquetds":
+        from .parquetdatasetdatahandler import ParquetDatasetDataHandler
+
+        return ParquetDatasetDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
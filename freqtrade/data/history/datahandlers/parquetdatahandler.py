@@ -1,12 +1,14 @@
 import logging
+from collections.abc import Iterable, Iterator
 
+import pyarrow.parquet as pq
 from pandas import DataFrame, read_parquet, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType, TradingMode
 
-from .idatahandler import IDataHandler
+from .idatahandler import TRADES_CHUNK_SIZE, IDataHandler
 
 
 logger = logging.getLogger(__name__)
@@ -100,31 +102,100 @@ class ParquetDataHandler(IDataHandler):
         self.create_dir_if_needed(filename)
         data.reset_index(drop=True).to_parquet(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def _trades_store_chunks(
+        self, pair: str, chunks: Iterable[DataFrame], trading_mode: TradingMode
+    ) -> int:
         """
-        Append data to existing files
+        Store trades data from time-ordered chunks, replacing existing data.
+        Chunks are written as row groups to a temporary file, which replaces the
+        existing file once complete.
         :param pair: Pair - used for filename
-        :param data: Dataframe containing trades
-                     column sequence as in DEFAULT_TRADES_COLUMNS
+        :param chunks: Dataframes containing trades
+                       column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :return: Number of trades stored
         """
-        raise NotImplementedError()
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self.create_dir_if_needed(filename)
+        tmp_file = filename.with_name(f".tmp-{filename.name}")
+        count = 0
+        writer = None
+        try:
+            for chunk in chunks:
+                table = self._trades_to_arrow(chunk)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_file, table.schema)
+                writer.write_table(table)
+                count += len(chunk)
+        except Exception:
+            if writer is not None:
+                writer.close()
+            tmp_file.unlink(missing_ok=True)
+            raise
+        if writer is None:
+            self._trades_store(pair, DataFrame(columns=DEFAULT_TRADES_COLUMNS), trading_mode)
+            return 0
+        writer.close()
+        tmp_file.replace(filename)
+        return count
+
+    def _trades_load_chunks(
+        self,
+        pair: str,
+        trading_mode: TradingMode,
+        timerange: TimeRange | None = None,
+        chunk_size: int = TRADES_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Load a pair's trades from file in time-ordered chunks.
+        Row groups not overlapping the timerange are skipped based on their statistics.
+        :param pair: Load trades for this pair
+        :param trading_mode: Trading mode to use (used to determine the filename)
+        :param timerange: Timerange to load trades for
+        :param chunk_size: Maximum number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            return
+        start_ms, stop_ms = self._trades_timerange_ms(timerange)
+        with pq.ParquetFile(filename) as pf:
+            ts_idx = pf.metadata.schema.names.index("timestamp")
+            row_groups = []
+            for i in range(pf.metadata.num_row_groups):
+                stats = pf.metadata.row_group(i).column(ts_idx).statistics
+                if stats is not None and stats.has_min_max:
+                    if (start_ms is not None and stats.max < start_ms) or (
+                        stop_ms is not None and stats.min > stop_ms
+                    ):
+                        continue
+                row_groups.append(i)
+            for batch in pf.iter_batches(batch_size=chunk_size, row_groups=row_groups):
+                chunk = self._trades_trim(batch.to_pandas(), timerange)
+                if not chunk.empty:
+                    yield chunk
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
     ) -> DataFrame:
         """
         Load a pair from file, either .json.gz or .json
-        # TODO: respect timerange ...
         :param pair: Load trades for this pair
         :param trading_mode: Trading mode to use (used to determine the filename)
-        :param timerange: Timerange to load trades for - currently not implemented
+        :param timerange: Timerange to load trades for
         :return: List of trades
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         if not filename.exists():
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
-        tradesdata = read_parquet(filename)
+        start_ms, stop_ms = self._trades_timerange_ms(timerange)
+        filters = []
+        if start_ms is not None:
+            filters.append(("timestamp", ">=", start_ms))
+        if stop_ms is not None:
+            filters.append(("timestamp", "<=", stop_ms))
+        tradesdata = read_parquet(filename, filters=filters or None)
 
         return tradesdata
 
@@ -0,0 +1,213 @@
+import logging
+import re
+import shutil
+from datetime import UTC, datetime
+from itertools import pairwise
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import DataFrame, to_datetime
+
+from freqtrade.configuration import TimeRange
+from freqtrade.enums import CandleType
+
+from .parquetdatahandler import ParquetDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Candles per parquet row group. Loading a timerange only reads overlapping row groups.
+ROW_GROUP_SIZE = 10_000
+
+_PART_REGEX = re.compile(r"^part-(\d+)-(\d+)\.parquet$")
+
+
+class ParquetDatasetDataHandler(ParquetDataHandler):
+    """
+    Stores OHLCV data as a directory of parquet files ("parts").
+    The date range of each part is encoded in its filename, and every part is split into
+    row groups of ROW_GROUP_SIZE candles - so loading a timerange only reads the parts and
+    row groups overlapping this timerange.
+    Appending data adds a new part, without rewriting existing data. The new part may start
+    with the last stored candle - in which case this candle replaces the stored one.
+    Trades data is stored like for the parquet format.
+    """
+
+    ohlcv_append_supported = True
+
+    _schema = pa.schema(
+        [
+            ("date", pa.int64()),
+            ("open", pa.float64()),
+            ("high", pa.float64()),
+            ("low", pa.float64()),
+            ("close", pa.float64()),
+            ("volume", pa.float64()),
+        ]
+    )
+
+    @staticmethod
+    def _get_parts(dirname: Path) -> list[tuple[int, int, Path]]:
+        """
+        Get all parts of a dataset, sorted by date.
+        :return: List of (first date, last date, path) tuples, dates in ms.
+        """
+        if not dirname.is_dir():
+            return []
+        parts = []
+        for p in dirname.iterdir():
+            if match := _PART_REGEX.match(p.name):
+                parts.append((int(match[1]), int(match[2]), p))
+        return sorted(parts)
+
+    def _write_part(self, dirname: Path, data: DataFrame) -> None:
+        data = data.loc[:, self._columns].sort_values("date")
+        # Store date as int (ms)
+        data["date"] = data["date"].astype(np.int64) // 1000 // 1000
+        table = pa.Table.from_pandas(data, self._schema, preserve_index=False)
+        first, last = table["date"][0].as_py(), table["date"][-1].as_py()
+        dirname.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first - parts are only visible once complete.
+        tmp_file = dirname / f".tmp-{first}-{last}.parquet"
+        pq.write_table(table, tmp_file, row_group_size=ROW_GROUP_SIZE)
+        tmp_file.replace(dirname / f"part-{first}-{last}.parquet")
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store data as parquet dataset, replacing existing data.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(dirname)
+        if dirname.exists():
+            shutil.rmtree(dirname)
+        if data.empty:
+            dirname.mkdir()
+            return
+        self._write_part(dirname, data)
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Only the last stored candle and newer candles are appended. The last stored candle
+        (which may have been incomplete when it was stored) is replaced by the appended one.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        parts = self._get_parts(dirname)
+        if not parts:
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        last_date = datetime.fromtimestamp(parts[-1][1] / 1000, tz=UTC)
+        data = data[data["date"] >= last_date]
+        if not data.empty:
+            self._write_part(dirname, data)
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if dirname.is_dir():
+            shutil.rmtree(dirname)
+            return True
+        return False
+
+    def ohlcv_data_min_max(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime, int]:
+        """
+        Returns the min and max timestamp for the given pair and timeframe.
+        Uses the dataset metadata only - without loading the data.
+        :param pair: Pair to get min/max for
+        :param timeframe: Timeframe to get min/max for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: (min, max, len)
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        parts = self._get_parts(dirname)
+        if not parts:
+            return (
+                datetime.fromtimestamp(0, tz=UTC),
+                datetime.fromtimestamp(0, tz=UTC),
+                0,
+            )
+        return (
+            datetime.fromtimestamp(parts[0][0] / 1000, tz=UTC),
+            datetime.fromtimestamp(parts[-1][1] / 1000, tz=UTC),
+            sum(pq.read_metadata(p).num_rows for _, _, p in parts)
+            # Appended parts can overlap the previous part by one candle
+            - sum(1 for prev, cur in pairwise(parts) if cur[0] <= prev[1]),
+        )
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Only parts and row groups overlapping the timerange are read.
+        Exact timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        dirname = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        if not dirname.exists():
+            # Fallback mode for 1M files
+            dirname = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+        start_ms, stop_ms = None, None
+        if timerange:
+            if timerange.starttype == "date":
+                start_ms = timerange.startts * 1000
+            if timerange.stoptype == "date":
+                stop_ms = timerange.stopts * 1000
+        filters = []
+        if start_ms is not None:
+            filters.append(("date", ">=", start_ms))
+        if stop_ms is not None:
+            filters.append(("date", "<=", stop_ms))
+
+        try:
+            tables = [
+                pq.read_table(path, filters=filters or None, schema=self._schema)
+                for first, last, path in self._get_parts(dirname)
+                if (start_ms is None or last >= start_ms) and (stop_ms is None or first <= stop_ms)
+            ]
+            if not tables:
+                return DataFrame(columns=self._columns)
+            pairdata = pa.concat_tables(tables).to_pandas()
+            # Parts are sorted by date - candles from later parts replace overlapping candles.
+            pairdata = pairdata.drop_duplicates(subset="date", keep="last", ignore_index=True)
+            pairdata["date"] = to_datetime(pairdata["date"], unit="ms", utc=True)
+            return pairdata
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {dirname}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "parquetds"
@@ -1,22 +1,31 @@
 import logging
 import operator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DATETIME_PRINT_FORMAT, DL_DATA_TIMEFRAMES, DOCS_LINK, Config
+from freqtrade.constants import (
+    DATETIME_PRINT_FORMAT,
+    DEFAULT_TRADES_COLUMNS,
+    DL_DATA_TIMEFRAMES,
+    DOCS_LINK,
+    Config,
+)
 from freqtrade.data.converter import (
     clean_ohlcv_dataframe,
     convert_trades_to_ohlcv,
-    trades_df_remove_duplicates,
-    trades_list_to_df,
+    trades_chunks_remove_duplicates,
 )
 from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
+from freqtrade.misc import file_dump_json, file_load_json
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time, format_ms_time_det
 from freqtrade.util.migrations import migrate_data
@@ -25,6 +34,9 @@ from freqtrade.util.progress_tracker import CustomProgress, retrieve_progress_tr
 
 logger = logging.getLogger(__name__)
 
+# Keeps track of completed downloads, to resume interrupted downloads
+DOWNLOAD_MANIFEST_FILE = ".download_manifest.json"
+
 
 def load_pair_history(
     pair: str,
@@ -80,6 +92,8 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int = 1,
+    progress_callback: Callable[[int, int], None] | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -93,6 +107,9 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of threads used to load pairs concurrently.
+                    At most this many pairs are being loaded (decompressed / cleaned) at a time.
+    :param progress_callback: Called with (loaded pairs, total pairs) after each pair.
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -101,8 +118,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -112,13 +129,27 @@ def load_data(
             data_handler=data_handler,
             candle_type=candle_type,
         )
-        if not hist.empty:
-            result[pair] = hist
+
+    with ExitStack() as stack:
+        if workers > 1 and len(pairs) > 1:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            # Results are returned in the order of pairs.
+            loaded = executor.map(load_pair, pairs)
         else:
-            if candle_type is CandleType.FUNDING_RATE and user_futures_funding_rate is not None:
-                logger.warning(f"{pair} using user specified [{user_futures_funding_rate}]")
-            elif candle_type not in (CandleType.SPOT, CandleType.FUTURES):
-                result[pair] = DataFrame(columns=["date", "open", "close", "high", "low", "volume"])
+            loaded = map(load_pair, pairs)
+
+        for idx, (pair, hist) in enumerate(zip(pairs, loaded, strict=True), start=1):
+            if not hist.empty:
+                result[pair] = hist
+            else:
+                if candle_type is CandleType.FUNDING_RATE and user_futures_funding_rate is not None:
+                    logger.warning(f"{pair} using user specified [{user_futures_funding_rate}]")
+                elif candle_type not in (CandleType.SPOT, CandleType.FUTURES):
+                    result[pair] = DataFrame(
+                        columns=["date", "open", "close", "high", "low", "volume"]
+                    )
+            if progress_callback:
+                progress_callback(idx, len(pairs))
 
     if fail_without_data and not result:
         raise OperationalException("No data found. Terminating.")
@@ -286,6 +317,19 @@ def _download_pair_history(
             until_ms=until_ms if until_ms else None,
         )
         logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+        if not data.empty and not prepend and data_handler.ohlcv_append_supported:
+            # New candles start at the last stored candle - only append them.
+            if not new_dataframe.empty:
+                logger.debug(
+                    "Appending candles from %s to %s.",
+                    f"{new_dataframe.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+                    f"{new_dataframe.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
+                )
+                data_handler.ohlcv_append(
+                    pair, timeframe, data=new_dataframe, candle_type=candle_type
+                )
+            return True
+
         if data.empty:
             data = new_dataframe
         else:
@@ -318,6 +362,36 @@ def _download_pair_history(
         return False
 
 
+def _load_download_manifest(manifest_file: Path, params: dict) -> set[tuple[str, str, str]]:
+    """
+    Load completed downloads from the manifest of an interrupted download.
+    :param params: Download parameters - the manifest is ignored if they don't match.
+    :return: Set of completed (pair, timeframe, candle_type) jobs
+    """
+    try:
+        manifest = file_load_json(manifest_file)
+        if manifest is None:
+            return set()
+    except Exception:
+        logger.warning(f"Could not load download manifest {manifest_file}. Ignoring it.")
+        return set()
+    if manifest.get("params") != params:
+        logger.info(
+            "Download parameters changed since the interrupted download, "
+            "or it is outdated - not resuming."
+        )
+        return set()
+    return {(pair, timeframe, candle_type) for pair, timeframe, candle_type in manifest["done"]}
+
+
+def _store_download_manifest(
+    manifest_file: Path, params: dict, done: set[tuple[str, str, str]]
+) -> None:
+    tmp_file = manifest_file.with_name(f"{manifest_file.name}.tmp")
+    file_dump_json(tmp_file, {"params": params, "done": sorted(done)}, log=False)
+    tmp_file.replace(manifest_file)
+
+
 def refresh_backtest_ohlcv_data(
     exchange: Exchange,
     pairs: list[str],
@@ -330,10 +404,21 @@ def refresh_backtest_ohlcv_data(
     data_format: str | None = None,
     prepend: bool = False,
     progress_tracker: CustomProgress | None = None,
+    workers: int = 1,
+    track_progress: bool = False,
+    resume: bool = False,
 ) -> list[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param workers: Number of pair / timeframe downloads processed concurrently.
+        Requests to the exchange remain throttled by the exchange's rate limit - but loading,
+        cleaning and storing data of one download overlaps with downloading another one.
+    :param track_progress: Keep track of completed downloads in a manifest file in datadir.
+        The manifest is removed once all downloads were processed (successful or not) -
+        and is only kept if the download is interrupted.
+    :param resume: Skip downloads completed by a previous, interrupted call with the same
+        parameters on the same day.
     :return: List of pairs that are not available.
     """
     progress_tracker = retrieve_progress_tracker(progress_tracker)
@@ -341,69 +426,147 @@ def refresh_backtest_ohlcv_data(
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    with progress_tracker as progress:
-        tf_length = len(timeframes) if trading_mode != "futures" else len(timeframes) + 2
-        timeframe_task = progress.add_task("Timeframe", total=tf_length)
-        pair_task = progress.add_task("Downloading data...", total=len(pairs))
 
-        for pair in pairs:
-            progress.update(pair_task, description=f"Downloading {pair}")
-            progress.update(timeframe_task, completed=0)
+    futures_combs: list[tuple[CandleType, str]] = []
+    if trading_mode == "futures":
+        # Predefined candletype (and timeframe) depending on exchange
+        # Downloads what is necessary to backtest based on futures data.
+        tf_mark = exchange.get_option("mark_ohlcv_timeframe")
+        tf_funding_rate = exchange.get_option("funding_fee_timeframe")
 
-            if pair not in exchange.markets:
-                pairs_not_available.append(f"{pair}: Pair not available on exchange.")
-                logger.info(f"Skipping pair {pair}...")
-                continue
-            for timeframe in timeframes:
-                progress.update(timeframe_task, description=f"Timeframe {timeframe}")
-                logger.debug(f"Downloading pair {pair}, {candle_type}, interval {timeframe}.")
-                _download_pair_history(
-                    pair=pair,
-                    datadir=datadir,
-                    exchange=exchange,
-                    timerange=timerange,
-                    data_handler=data_handler,
-                    timeframe=str(timeframe),
-                    new_pairs_days=new_pairs_days,
-                    candle_type=candle_type,
-                    erase=erase,
-                    prepend=prepend,
-                )
-                progress.update(timeframe_task, advance=1)
-            if trading_mode == "futures":
-                # Predefined candletype (and timeframe) depending on exchange
-                # Downloads what is necessary to backtest based on futures data.
-                tf_mark = exchange.get_option("mark_ohlcv_timeframe")
-                tf_funding_rate = exchange.get_option("funding_fee_timeframe")
-
-                fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
-                # All exchanges need FundingRate for futures trading.
-                # The timeframe is aligned to the mark-price timeframe.
-                combs = ((CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark))
-                for candle_type_f, tf in combs:
-                    logger.debug(f"Downloading pair {pair}, {candle_type_f}, interval {tf}.")
-                    _download_pair_history(
-                        pair=pair,
-                        datadir=datadir,
-                        exchange=exchange,
-                        timerange=timerange,
-                        data_handler=data_handler,
-                        timeframe=str(tf),
-                        new_pairs_days=new_pairs_days,
-                        candle_type=candle_type_f,
-                        erase=erase,
-                        prepend=prepend,
-                    )
-                    progress.update(
-                        timeframe_task, advance=1, description=f"Timeframe {candle_type_f}, {tf}"
-                    )
+        fr_candle_type = CandleType.from_string(exchange.get_option("mark_ohlcv_price"))
+        # All exchanges need FundingRate for futures trading.
+        # The timeframe is aligned to the mark-price timeframe.
+        futures_combs = [(CandleType.FUNDING_RATE, tf_funding_rate), (fr_candle_type, tf_mark)]
 
-            progress.update(pair_task, advance=1)
-            progress.update(timeframe_task, description="Timeframe")
+    jobs: list[tuple[str, str, CandleType]] = []
+    for pair in pairs:
+        if pair not in exchange.markets:
+            pairs_not_available.append(f"{pair}: Pair not available on exchange.")
+            logger.info(f"Skipping pair {pair}...")
+            continue
+        jobs.extend((pair, str(timeframe), candle_type) for timeframe in timeframes)
+        jobs.extend((pair, str(tf), candle_type_f) for candle_type_f, tf in futures_combs)
+
+    manifest_file = datadir / DOWNLOAD_MANIFEST_FILE
+    manifest_params = {
+        # Downloads run up to "now" - so completed downloads are only valid on the same day.
+        "date": dt_now().strftime("%Y-%m-%d"),
+        # Day resolution - so relative timeranges (--days) still match when resuming
+        "timerange": timerange.timerange_str if timerange else None,
+        "new_pairs_days": new_pairs_days,
+        "erase": erase,
+        "data_format": data_handler._get_file_extension(),
+        "trading_mode": str(trading_mode),
+        "prepend": prepend,
+    }
+    done = _load_download_manifest(manifest_file, manifest_params) if resume else set()
+    if done:
+        logger.info(f"Resuming download - skipping {len(done)} completed downloads.")
+    jobs = [job for job in jobs if (job[0], job[1], job[2].value) not in done]
+
+    def download(job: tuple[str, str, CandleType]) -> bool:
+        pair, timeframe, candle_type_job = job
+        logger.debug(f"Downloading pair {pair}, {candle_type_job}, interval {timeframe}.")
+        return _download_pair_history(
+            pair=pair,
+            datadir=datadir,
+            exchange=exchange,
+            timerange=timerange,
+            data_handler=data_handler,
+            timeframe=timeframe,
+            new_pairs_days=new_pairs_days,
+            candle_type=candle_type_job,
+            erase=erase,
+            prepend=prepend,
+        )
+
+    with progress_tracker as progress, ExitStack() as stack:
+        dl_task = progress.add_task("Downloading data...", total=len(jobs))
+        if workers > 1 and len(jobs) > 1:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            # Don't start further downloads if interrupted.
+            stack.callback(executor.shutdown, wait=False, cancel_futures=True)
+            # Results are returned in the order of jobs.
+            results = executor.map(download, jobs)
+        else:
+            results = map(download, jobs)
+
+        for job, success in zip(jobs, results, strict=True):
+            pair, timeframe, candle_type_job = job
+            progress.update(
+                dl_task, advance=1, description=f"Downloaded {pair}, {timeframe}, {candle_type_job}"
+            )
+            if success and track_progress:
+                done.add((pair, timeframe, candle_type_job.value))
+                _store_download_manifest(manifest_file, manifest_params, done)
+
+    # Only reached if the download was not interrupted.
+    # Failed downloads are retried in full on the next call.
+    if track_progress:
+        manifest_file.unlink(missing_ok=True)
 
     return pairs_not_available
 
 
+def _trades_chunks_with_tail(
+    data_handler: IDataHandler,
+    pair: str,
+    trading_mode: TradingMode,
+    tail_chunks: Iterable[DataFrame],
+    tail_start: int,
+) -> Iterator[DataFrame]:
+    """
+    Stream stored trades older than tail_start, followed by the (updated) tail.
+    """
+    for chunk in data_handler.trades_load_chunks(pair, trading_mode):
+        yield chunk.loc[chunk["timestamp"] < tail_start]
+        if chunk.iloc[-1]["timestamp"] >= tail_start:
+            break
+    yield from tail_chunks
+
+
+def _trades_chunks_merge_tail(
+    tail: DataFrame, new_chunks: Iterable[DataFrame], first_date: datetime | None
+) -> Iterator[DataFrame]:
+    """
+    Merge the stored tail into the new trades overlapping it and remove duplicates.
+    Logs the range of the resulting data once all chunks have been consumed.
+    """
+
+    def merged_chunks() -> Iterator[DataFrame]:
+        merged = tail
+        tail_end = tail.iloc[-1]["timestamp"] if not tail.empty else None
+        for chunk in new_chunks:
+            if chunk.empty:
+                continue
+            if tail_end is not None:
+                merged = concat([merged, chunk], axis=0)
+                if chunk.iloc[-1]["timestamp"] <= tail_end:
+                    # Chunk is still within the stored tail
+                    continue
+                chunk, tail_end = merged, None
+            yield chunk
+        if tail_end is not None:
+            yield merged
+
+    new_start, new_end = first_date, None
+    for chunk in trades_chunks_remove_duplicates(merged_chunks()):
+        if new_start is None:
+            new_start = chunk.iloc[0]["date"]
+        new_end = chunk.iloc[-1]["date"]
+        yield chunk
+
+    logger.debug(
+        "New Start: %s",
+        "None" if new_start is None else f"{new_start:{DATETIME_PRINT_FORMAT}}",
+    )
+    logger.debug(
+        "New End: %s",
+        "None" if new_end is None else f"{new_end:{DATETIME_PRINT_FORMAT}}",
+    )
+
+
 def _download_trades_history(
     exchange: Exchange,
     pair: str,
@@ -425,64 +588,73 @@ def _download_trades_history(
         if timerange.stoptype == "date":
             until = timerange.stopts * 1000
 
-    trades = data_handler.trades_load(pair, trading_mode)
+    first_date, last_date, trades_count = data_handler.trades_data_min_max(pair, trading_mode)
+    first_ts, last_ts = dt_ts(first_date), dt_ts(last_date)
 
-    # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
-    # DEFAULT_TRADES_COLUMNS: 0 -> timestamp
-    # DEFAULT_TRADES_COLUMNS: 1 -> id
-
-    if not trades.empty and since > 0 and (since + 1000) < trades.iloc[0]["timestamp"]:
+    if trades_count and since > 0 and (since + 1000) < first_ts:
         # since is before the first trade
         raise ValueError(
             f"Start {format_ms_time_det(since)} earlier than "
-            f"available data ({format_ms_time_det(trades.iloc[0]['timestamp'])}). "
+            f"available data ({format_ms_time_det(first_ts)}). "
             f"Please use `--erase` if you'd like to redownload {pair}."
         )
 
-    from_id = trades.iloc[-1]["id"] if not trades.empty else None
-    if not trades.empty and since < trades.iloc[-1]["timestamp"]:
+    tail_start = since
+    if trades_count and since < last_ts:
         # Reset since to the last available point
         # - 5 seconds (to ensure we're getting all trades)
-        since = int(trades.iloc[-1]["timestamp"] - (5 * 1000))
+        since = int(last_ts - (5 * 1000))
+        tail_start = since
         logger.info(
             f"Using last trade date -5s - Downloading trades for {pair} "
             f"since: {format_ms_time(since)}."
         )
+    elif trades_count:
+        tail_start = last_ts
+    # Only the most recent stored trades are loaded - older trades are streamed
+    # from the existing file when storing.
+    tail_start = tail_start // 1000 * 1000
+    tail = DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+    if trades_count:
+        tail = data_handler.trades_load(
+            pair, trading_mode, timerange=TimeRange("date", None, tail_start // 1000, 0)
+        )
+
+    # TradesList columns are defined in constants.DEFAULT_TRADES_COLUMNS
+    # DEFAULT_TRADES_COLUMNS: 0 -> timestamp
+    # DEFAULT_TRADES_COLUMNS: 1 -> id
+    from_id = tail.iloc[-1]["id"] if not tail.empty else None
 
     if not since:
         since = dt_ts(dt_now() - timedelta(days=new_pairs_days))
 
     logger.debug(
         "Current Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not trades_count else f"{first_date:{DATETIME_PRINT_FORMAT}}",
     )
     logger.debug(
         "Current End: %s",
-        "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
+        "None" if not trades_count else f"{last_date:{DATETIME_PRINT_FORMAT}}",
     )
-    logger.info(f"Current Amount of trades: {len(trades)}")
+    logger.info(f"Current Amount of trades: {trades_count}")
 
-    new_trades = exchange.get_historic_trades(
+    new_chunks = exchange.get_historic_trades_chunks(
         pair=pair,
         since=since,
         until=until,
         from_id=from_id,
     )
-    new_trades_df = trades_list_to_df(new_trades[1])
-    trades = concat([trades, new_trades_df], axis=0)
-    # Remove duplicates to make sure we're not storing data we don't need
-    trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
+    if trades_count:
+        # Trades before the tail are part of the stored data already.
+        new_chunks = (chunk.loc[chunk["timestamp"] >= tail_start] for chunk in new_chunks)
 
-    logger.debug(
-        "New Start: %s",
-        "None" if trades.empty else f"{trades.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}",
-    )
-    logger.debug(
-        "New End: %s",
-        "None" if trades.empty else f"{trades.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}",
-    )
-    logger.info(f"New Amount of trades: {len(trades)}")
+    # New trades are stored while they're downloaded - so they're never all held in memory.
+    chunks = _trades_chunks_merge_tail(tail, new_chunks, first_date if trades_count else None)
+    if trades_count:
+        chunks = _trades_chunks_with_tail(data_handler, pair, trading_mode, chunks, tail_start)
+    trades_count = data_handler.trades_store_chunks(pair, chunks, trading_mode)
+
+    logger.info(f"New Amount of trades: {trades_count}")
     return True
 
 
@@ -665,12 +837,13 @@ def download_data(
             if config.get("convert_trades") or not exchange.get_option("ohlcv_has_history", True):
                 # Convert downloaded trade data to different timeframes
                 # Only auto-convert for exchanges without historic klines
-
+                # Downloaded trades are appended to existing trades, so the full history is
+                # converted - the stored candles would otherwise be cut to the timerange.
                 convert_trades_to_ohlcv(
                     pairs=expanded_pairs,
                     timeframes=config["timeframes"],
                     datadir=config["datadir"],
-                    timerange=timerange,
+                    timerange=TimeRange(),
                     erase=bool(config.get("erase")),
                     data_format_ohlcv=config["dataformat_ohlcv"],
                     data_format_trades=config["dataformat_trades"],
@@ -702,6 +875,9 @@ def download_data(
                 trading_mode=config.get("trading_mode", "spot"),
                 prepend=config.get("prepend_data", False),
                 progress_tracker=progress_tracker,
+                workers=config.get("download_workers", 1),
+                track_progress=True,
+                resume=config.get("download_resume", False),
             )
     finally:
         if pairs_not_available:
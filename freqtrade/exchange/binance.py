@@ -1,13 +1,16 @@
 """Binance exchange subclass"""
 
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
 import ccxt
+import numpy as np
 from pandas import DataFrame
 
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.data.converter import trades_convert_types, trades_list_to_df
 from freqtrade.enums import CandleType, MarginMode, PriceType, TradingMode
 from freqtrade.exceptions import DDosProtection, OperationalException, TemporaryError
 from freqtrade.exchange import Exchange
@@ -15,6 +18,7 @@ from freqtrade.exchange.binance_public_data import (
     concat_safe,
     download_archive_ohlcv,
     download_archive_trades,
+    iter_archive_trades,
 )
 from freqtrade.exchange.common import retrier
 from freqtrade.exchange.exchange_types import FtHas, Tickers
@@ -362,6 +366,74 @@ class Binance(Exchange):
                 "Freqtrade only supports isolated futures for leverage trading"
             )
 
+    def dry_run_liquidation_prices(
+        self,
+        trades: list,
+        wallet_balance: float,
+        open_trades: list,
+    ) -> list[float | None]:
+        """
+        Same result as dry_run_liquidation_price for every trade.
+        In cross margin mode, maintenance margin and unrealized PNL of the open trades are
+        calculated once per pair - instead of once for every position.
+        Important: Must be fetching data from cached values as this is used by backtesting!
+        :param trades: Trades to calculate the liquidation price for
+        :param wallet_balance: Amount of margin in the wallet being used to trade
+        :param open_trades: List of open trades in the same wallet
+        :return: Liquidation prices (without buffer), in the order of trades
+        """
+        if self.trading_mode != TradingMode.FUTURES:
+            raise OperationalException(
+                "Freqtrade only supports isolated futures for leverage trading"
+            )
+        # (UPNL - TMM) of the open trades, per pair
+        cross_vars_pair: dict[str, float] = {}
+        if self.margin_mode == MarginMode.CROSS and open_trades:
+            live = self._config["runmode"] in ("live", "dry_run")
+            if live:
+                funding_rates = self.fetch_funding_rates([t.pair for t in open_trades])
+            for pair, indexes in self._indexes_by_pair(open_trades).items():
+                pair_trades = [open_trades[i] for i in indexes]
+                amounts = np.array([t.amount for t in pair_trades], dtype=np.float64)
+                open_rates = np.array([t.open_rate for t in pair_trades], dtype=np.float64)
+                # Fall back to open rate for backtesting
+                mark_prices = funding_rates[pair]["markPrice"] if live else open_rates
+                mm_ratios, maint_amts = self.get_maintenance_ratios_and_amts(
+                    pair, np.array([t.stake_amount for t in pair_trades], dtype=np.float64)
+                )
+                maint_margin = amounts * mark_prices * mm_ratios - maint_amts
+                upnl = amounts * mark_prices - amounts * open_rates
+                cross_vars_pair[pair] = float(np.sum(upnl - maint_margin))
+        cross_vars_total = sum(cross_vars_pair.values())
+
+        mm_ratios = np.empty(len(trades))
+        maint_amts = np.empty(len(trades))
+        for pair, indexes in self._indexes_by_pair(trades).items():
+            mm_ratios[indexes], maint_amts[indexes] = self.get_maintenance_ratios_and_amts(
+                pair, np.array([trades[i].stake_amount for i in indexes], dtype=np.float64)
+            )
+        if np.isnan(maint_amts).any():
+            raise OperationalException(
+                "Parameter maintenance_amt is required by Binance.liquidation_price"
+                f"for {self.trading_mode}"
+            )
+        # Only "other" pairs are considered
+        cross_vars = np.array([cross_vars_total - cross_vars_pair.get(t.pair, 0.0) for t in trades])
+        side_1 = np.array([-1 if t.is_short else 1 for t in trades])
+        amounts = np.array([t.amount for t in trades], dtype=np.float64)
+        open_rates = np.array([t.open_rate for t in trades], dtype=np.float64)
+        liquidation_prices = (
+            (wallet_balance + cross_vars + maint_amts) - (side_1 * amounts * open_rates)
+        ) / ((amounts * mm_ratios) - (side_1 * amounts))
+        return liquidation_prices.tolist()
+
+    @staticmethod
+    def _indexes_by_pair(trades: list) -> dict[str, list[int]]:
+        grouped: dict[str, list[int]] = {}
+        for i, trade in enumerate(trades):
+            grouped.setdefault(trade.pair, []).append(i)
+        return grouped
+
     def load_leverage_tiers(self) -> dict[str, list[dict]]:
         if self.trading_mode == TradingMode.FUTURES:
             if self._config["dry_run"]:
@@ -389,6 +461,20 @@ class Binance(Exchange):
             return [], "0"
         return t, from_id
 
+    async def _async_get_trades_listing_since(self, pair: str, since: int) -> int:
+        """
+        Move since to the listing date of the pair (the first available trade).
+        """
+        trades = await self._api_async.fetch_trades(
+            pair,
+            params={
+                self._ft_has["trades_pagination_arg"]: "0",
+            },
+            limit=5,
+        )
+        listing_date: int = trades[0]["timestamp"]
+        return max(since, listing_date)
+
     async def _async_get_trade_history_id(
         self, pair: str, until: int, since: int, from_id: str | None = None
     ) -> tuple[str, list[list]]:
@@ -396,15 +482,7 @@ class Binance(Exchange):
 
         if not self._config["exchange"].get("only_from_ccxt", False):
             if from_id is None or not since:
-                trades = await self._api_async.fetch_trades(
-                    pair,
-                    params={
-                        self._ft_has["trades_pagination_arg"]: "0",
-                    },
-                    limit=5,
-                )
-                listing_date: int = trades[0]["timestamp"]
-                since = max(since, listing_date)
+                since = await self._async_get_trades_listing_since(pair, since)
 
             _, res = await download_archive_trades(
                 CandleType.FUTURES if self.trading_mode == "futures" else CandleType.SPOT,
@@ -433,3 +511,59 @@ class Binance(Exchange):
         return await super()._async_get_trade_history_id(
             pair, until=until, since=since, from_id=from_id
         )
+
+    def get_historic_trades_chunks(
+        self,
+        pair: str,
+        since: int,
+        until: int | None = None,
+        from_id: str | None = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Override to stream trades from https://data.binance.vision - one chunk per day,
+        followed by the remaining trades from the REST API.
+        """
+        if self._config["exchange"].get("only_from_ccxt", False):
+            yield from super().get_historic_trades_chunks(pair, since, until, from_id)
+            return
+        if not self.exchange_has("fetchTrades"):
+            raise OperationalException("This exchange does not support downloading Trades.")
+
+        if until is None:
+            until = ccxt.Exchange.milliseconds()
+        if from_id is None or not since:
+            with self._loop_lock:
+                since = self.loop.run_until_complete(
+                    self._async_get_trades_listing_since(pair, since)
+                )
+
+        archive = iter_archive_trades(
+            CandleType.FUTURES if self.trading_mode == "futures" else CandleType.SPOT,
+            pair,
+            since_ms=since,
+            until_ms=until,
+            markets=self.markets,
+        )
+        end_time, end_id = since, from_id
+        try:
+            while True:
+                with self._loop_lock:
+                    try:
+                        chunk = self.loop.run_until_complete(anext(archive))
+                    except StopAsyncIteration:
+                        break
+                end_time, end_id = int(chunk.iloc[-1]["timestamp"]), str(chunk.iloc[-1]["id"])
+                yield trades_convert_types(chunk)
+        finally:
+            with self._loop_lock:
+                self.loop.run_until_complete(archive.aclose())
+
+        if end_time < until:
+            # download the remaining data from rest API
+            with self._loop_lock:
+                _, trades = self.loop.run_until_complete(
+                    super()._async_get_trade_history_id(
+                        pair, until=until, since=end_time, from_id=end_id
+                    )
+                )
+            yield trades_list_to_df(trades)
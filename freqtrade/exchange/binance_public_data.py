@@ -6,9 +6,12 @@ Documentation can be found in https://github.com/binance/binance-public-data
 import asyncio
 import logging
 import zipfile
-from datetime import date, timedelta
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from datetime import date, datetime, timedelta
 from io import BytesIO
-from typing import Any
+from itertools import islice
+from typing import Any, TypeVar
 
 import aiohttp
 import numpy as np
@@ -23,6 +26,8 @@ from freqtrade.util.datetime_helpers import dt_from_ts, dt_now
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Http404(Exception):
     def __init__(self, msg, date, url):
@@ -303,6 +308,17 @@ async def get_daily_ohlcv(
                 raise
 
 
+def _archive_trades_range(since_ms: int, until_ms: int | None) -> tuple[datetime, datetime]:
+    """
+    Date range to download trades archives for - the most recent 2 days aren't archived yet.
+    """
+    last_available_date = dt_now() - timedelta(days=2)
+
+    start = dt_from_ts(since_ms)
+    end = dt_from_ts(until_ms) if until_ms else dt_now()
+    return start, min(end, last_available_date)
+
+
 async def download_archive_trades(
     candle_type: CandleType,
     pair: str,
@@ -315,11 +331,7 @@ async def download_archive_trades(
     try:
         symbol = markets[pair]["id"]
 
-        last_available_date = dt_now() - timedelta(days=2)
-
-        start = dt_from_ts(since_ms)
-        end = dt_from_ts(until_ms) if until_ms else dt_now()
-        end = min(end, last_available_date)
+        start, end = _archive_trades_range(since_ms, until_ms)
         if start >= end:
             return pair, []
         result_list = await _download_archive_trades(
@@ -336,7 +348,54 @@ async def download_archive_trades(
         return pair, []
 
 
-def parse_trades_from_zip(csvf):
+async def iter_archive_trades(
+    candle_type: CandleType,
+    pair: str,
+    *,
+    since_ms: int,
+    until_ms: int | None,
+    markets: dict[str, Any],
+    stop_on_404: bool = True,
+    prefetch_days: int = 3,
+) -> AsyncGenerator[DataFrame, None]:
+    """
+    Stream trades from https://data.binance.vision - one DataFrame per day, in date order.
+    Up to `prefetch_days` archives are downloaded and parsed ahead of the consumer,
+    so memory usage does not grow with the length of the date range.
+    Stops at the first day which can't be downloaded - the remaining data should be
+    downloaded from the REST API.
+    :return: Async generator of DataFrames with DEFAULT_TRADES_COLUMNS as columns
+    """
+    try:
+        symbol = markets[pair]["id"]
+
+        start, end = _archive_trades_range(since_ms, until_ms)
+        if start >= end:
+            return
+        connector = aiohttp.TCPConnector(limit=100)
+        async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
+            async for df in _iter_daily_archives(
+                lambda day: get_daily_trades_df(symbol, candle_type, day, session),
+                pair,
+                start,
+                end,
+                stop_on_404,
+                prefetch_days,
+            ):
+                yield df
+
+    except Exception as e:
+        logger.warning(
+            "An exception occurred during fast trades download from Binance, falling back to "
+            "the slower REST API, this can take a lot more time.",
+            exc_info=e,
+        )
+
+
+def parse_trades_df_from_zip(csvf) -> DataFrame:
+    """
+    Parse a binance aggTrades csv file into a DataFrame with DEFAULT_TRADES_COLUMNS as columns.
+    """
     # https://github.com/binance/binance-public-data/issues/283
     first_byte = csvf.read(1)[0]
     if chr(first_byte).isdigit():
@@ -370,32 +429,48 @@ def parse_trades_from_zip(csvf):
         csvf,
         names=names,
         header=header,
+        usecols=["id", "price", "amount", "timestamp", "is_buyer_maker"],
     )
-    df.loc[:, "cost"] = df["price"] * df["amount"]
-    # Side is reversed intentionally
-    # based on ccxt parseTrade logic.
-    df.loc[:, "side"] = np.where(df["is_buyer_maker"], "sell", "buy")
-    df.loc[:, "type"] = None
-    # Convert timestamp to ms
-    df.loc[:, "timestamp"] = np.where(
-        df["timestamp"] > 1e13,
-        df["timestamp"] // 1000,
-        df["timestamp"],
+    timestamp = df["timestamp"].to_numpy()
+    return DataFrame(
+        {
+            # Convert timestamp to ms
+            "timestamp": np.where(timestamp > 1e13, timestamp // 1000, timestamp),
+            "id": df["id"],
+            "type": None,
+            # Side is reversed intentionally
+            # based on ccxt parseTrade logic.
+            "side": np.where(df["is_buyer_maker"], "sell", "buy"),
+            "price": df["price"],
+            "amount": df["amount"],
+            "cost": df["price"] * df["amount"],
+        },
+        columns=DEFAULT_TRADES_COLUMNS,
     )
-    return df.loc[:, DEFAULT_TRADES_COLUMNS].to_records(index=False).tolist()
 
 
-async def get_daily_trades(
+def parse_trades_from_zip(csvf) -> list[tuple]:
+    return parse_trades_df_from_zip(csvf).to_records(index=False).tolist()
+
+
+def _parse_trades_zip(content: bytes) -> DataFrame:
+    with zipfile.ZipFile(BytesIO(content)) as zipf:
+        with zipf.open(zipf.namelist()[0]) as csvf:
+            return parse_trades_df_from_zip(csvf)
+
+
+async def get_daily_trades_df(
     symbol: str,
     candle_type: CandleType,
     date: date,
     session: aiohttp.ClientSession,
     retry_count: int = 3,
     retry_delay: float = 0.0,
-) -> list[list]:
+) -> DataFrame:
     """
-    Get daily OHLCV from https://data.binance.vision
+    Get daily trades from https://data.binance.vision
     See https://github.com/binance/binance-public-data
+    The archive is unzipped and parsed in a worker thread, so other downloads can continue.
 
     :symbol: binance symbol name, e.g. BTCUSDT
     :candle_type: SPOT or FUTURES
@@ -403,7 +478,7 @@ async def get_daily_trades(
     :session: an aiohttp.ClientSession instance
     :retry_count: times to retry before returning the exceptions
     :retry_delay: the time to wait before every retry
-    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    :return: a DataFrame containing trades with DEFAULT_TRADES_COLUMNS as columns
     """
 
     url = binance_vision_trades_zip_url(symbol, candle_type, date)
@@ -423,9 +498,7 @@ async def get_daily_trades(
                 if resp.status == 200:
                     content = await resp.read()
                     logger.debug(f"Successfully downloaded {url}")
-                    with zipfile.ZipFile(BytesIO(content)) as zipf:
-                        with zipf.open(zipf.namelist()[0]) as csvf:
-                            return parse_trades_from_zip(csvf)
+                    return await asyncio.to_thread(_parse_trades_zip, content)
                 elif resp.status == 404:
                     logger.debug(f"Failed to download {url}")
                     raise Http404(f"404: {url}", date, url)
@@ -439,6 +512,86 @@ async def get_daily_trades(
                 raise
 
 
+async def get_daily_trades(
+    symbol: str,
+    candle_type: CandleType,
+    date: date,
+    session: aiohttp.ClientSession,
+    retry_count: int = 3,
+    retry_delay: float = 0.0,
+) -> list[list]:
+    """
+    Get daily trades from https://data.binance.vision
+    See get_daily_trades_df() for details.
+    :return: a list containing trades in DEFAULT_TRADES_COLUMNS format
+    """
+    df = await get_daily_trades_df(symbol, candle_type, date, session, retry_count, retry_delay)
+    return df.to_records(index=False).tolist()
+
+
+async def _iter_daily_archives(
+    fetch: Callable[[date], Coroutine[Any, Any, T]],
+    pair: str,
+    start: date,
+    end: date,
+    stop_on_404: bool,
+    window: int,
+) -> AsyncGenerator[T, None]:
+    """
+    Download daily archives with up to `window` concurrent downloads, yielding results
+    in date order. Stops at the first failed download (days missing with `stop_on_404` False
+    are skipped), so no gaps are introduced in the data.
+    """
+    dates = date_range(start, end)
+    tasks: deque[asyncio.Task] = deque()
+    # the current day being processing, starting at 1.
+    current_day = 0
+    try:
+        while True:
+            for day in islice(dates, window - len(tasks)):
+                tasks.append(asyncio.create_task(fetch(day)))
+            if not tasks:
+                return
+            current_day += 1
+            try:
+                result = await tasks.popleft()
+            except Http404 as e:
+                if stop_on_404:
+                    logger.debug(f"Failed to download {e.url} due to 404.")
+
+                    # A 404 error on the first day indicates missing data
+                    # on https://data.binance.vision, we provide the warning and the advice.
+                    # https://github.com/freqtrade/freqtrade/blob/acc53065e5fa7ab5197073276306dc9dc3adbfa3/tests/exchange_online/test_binance_compare_ohlcv.py#L7
+                    if current_day == 1:
+                        logger.warning(
+                            f"Fast download is unavailable due to missing data: "
+                            f"{e.url}. Falling back to the slower REST API, "
+                            "which may take more time."
+                        )
+                        if pair in ["BTC/USDT:USDT", "ETH/USDT:USDT", "BCH/USDT:USDT"]:
+                            logger.warning(
+                                f"To avoid the delay, you can first download {pair} using "
+                                "`--timerange <start date>-20200101`, and then download the "
+                                "remaining data with `--timerange 20200101-<end date>`."
+                            )
+                    else:
+                        logger.warning(
+                            f"Binance fast download for {pair} stopped at {e.date} due to "
+                            f"missing data: {e.url}, falling back to rest API for the "
+                            "remaining data, this can take more time."
+                        )
+                    return
+            except Exception as e:
+                logger.warning(f"An exception raised: {e}")
+                # Directly return the existing data, do not allow the gap within the data
+                return
+            else:
+                # Happy case
+                yield result
+    finally:
+        await cancel_and_await_tasks(list(tasks))
+
+
 async def _download_archive_trades(
     symbol: str,
     pair: str,
@@ -447,57 +600,19 @@ async def _download_archive_trades(
     end: date,
     stop_on_404: bool,
 ) -> list[list]:
-    # daily dataframes, `None` indicates missing data in that day (when `stop_on_404` is False)
     results: list[list] = []
-    # the current day being processing, starting at 1.
-    current_day = 0
 
     connector = aiohttp.TCPConnector(limit=100)
     async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
         # the HTTP connections has been throttled by TCPConnector
-        for dates in chunks(list(date_range(start, end)), 30):
-            tasks = [
-                asyncio.create_task(get_daily_trades(symbol, candle_type, date, session))
-                for date in dates
-            ]
-            for task in tasks:
-                current_day += 1
-                try:
-                    result = await task
-                except Http404 as e:
-                    if stop_on_404:
-                        logger.debug(f"Failed to download {e.url} due to 404.")
-
-                        # A 404 error on the first day indicates missing data
-                        # on https://data.binance.vision, we provide the warning and the advice.
-                        # https://github.com/freqtrade/freqtrade/blob/acc53065e5fa7ab5197073276306dc9dc3adbfa3/tests/exchange_online/test_binance_compare_ohlcv.py#L7
-                        if current_day == 1:
-                            logger.warning(
-                                f"Fast download is unavailable due to missing data: "
-                                f"{e.url}. Falling back to the slower REST API, "
-                                "which may take more time."
-                            )
-                            if pair in ["BTC/USDT:USDT", "ETH/USDT:USDT", "BCH/USDT:USDT"]:
-                                logger.warning(
-                                    f"To avoid the delay, you can first download {pair} using "
-                                    "`--timerange <start date>-20200101`, and then download the "
-                                    "remaining data with `--timerange 20200101-<end date>`."
-                                )
-                        else:
-                            logger.warning(
-                                f"Binance fast download for {pair} stopped at {e.date} due to "
-                                f"missing data: {e.url}, falling back to rest API for the "
-                                "remaining data, this can take more time."
-                            )
-                        await cancel_and_await_tasks(tasks[tasks.index(task) + 1 :])
-                        return results
-                except Exception as e:
-                    logger.warning(f"An exception raised: {e}")
-                    # Directly return the existing data, do not allow the gap within the data
-                    await cancel_and_await_tasks(tasks[tasks.index(task) + 1 :])
-                    return results
-                else:
-                    # Happy case
-                    results.extend(result)
+        async for result in _iter_daily_archives(
+            lambda day: get_daily_trades(symbol, candle_type, day, session),
+            pair,
+            start,
+            end,
+            stop_on_404,
+            30,
+        ):
+            results.extend(result)
 
     return results
@@ -6,6 +6,7 @@ from functools import wraps
 from typing import Any, TypeVar, cast, overload
 
 from freqtrade.exceptions import DDosProtection, RetryableOrderError, TemporaryError
+from freqtrade.exchange.request_scheduler import report_rate_limited, report_retry
 from freqtrade.mixins import LoggingMixin
 
 
@@ -123,6 +124,7 @@ def retrier_async(f):
                 count -= 1
                 kwargs["count"] = count
                 if isinstance(ex, DDosProtection):
+                    report_rate_limited()
                     if kucoin and "429000" in str(ex):
                         # Temporary fix for 429000 error on kucoin
                         # see https://github.com/freqtrade/freqtrade/issues/5700 for details.
@@ -139,6 +141,7 @@ def retrier_async(f):
                         await asyncio.sleep(backoff_delay)
                 if msg:
                     logger.warning(msg)
+                report_retry()
                 return await wrapper(*args, **kwargs)
             else:
                 logger.warning(msg + "Giving up.")
@@ -7,7 +7,7 @@ import asyncio
 import inspect
 import logging
 import signal
-from collections.abc import Coroutine, Generator
+from collections.abc import Coroutine, Generator, Iterator
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from math import floor, isnan
@@ -16,12 +16,13 @@ from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
 import ccxt.pro as ccxt_pro
+import numpy as np
 from cachetools import TTLCache
 from ccxt import TICK_SIZE
 from dateutil import parser
 from pandas import DataFrame, concat
 
-from freqtrade.configuration import remove_exchange_credentials
+from freqtrade.configuration import TimeRange, remove_exchange_credentials
 from freqtrade.constants import (
     DEFAULT_AMOUNT_RESERVE_PERCENT,
     DEFAULT_TRADES_COLUMNS,
@@ -37,7 +38,7 @@ from freqtrade.constants import (
     PairWithTimeframe,
 )
 from freqtrade.data.converter import (
-    clean_ohlcv_dataframe,
+    ohlcv_append_candles,
     ohlcv_to_dataframe,
     trades_df_remove_duplicates,
     trades_dict_to_list,
@@ -99,6 +100,8 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.leverage_tiers import LeverageTierIndex
+from freqtrade.exchange.request_scheduler import RequestScheduler
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -193,10 +196,12 @@ class Exchange:
         self._markets: dict = {}
         self._trading_fees: dict[str, Any] = {}
         self._leverage_tiers: dict[str, list[dict]] = {}
+        self._leverage_tiers_index: dict[str, LeverageTierIndex] = {}
         # Lock event loop. This is necessary to avoid race-conditions when using force* commands
         # Due to funding fee fetching.
         self._loop_lock = Lock()
         self.loop = self._init_async_loop()
+        self._ohlcv_scheduler = RequestScheduler("ohlcv")
         self._config: Config = {}
 
         # Leverage properties
@@ -232,8 +237,12 @@ class Exchange:
         # Caching only applies to RPC methods, so prices for open trades are still
         # refreshed once every iteration.
         # Shouldn't be too high either, as it'll freeze UI updates in case of open orders.
-        self._exit_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
-        self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+        rate_cache_size = max(100, len(config.get("exchange", {}).get("pair_whitelist", [])))
+        self._exit_rate_cache: TTLCache = TTLCache(maxsize=rate_cache_size, ttl=300)
+        self._entry_rate_cache: TTLCache = TTLCache(maxsize=rate_cache_size, ttl=300)
+        # Tickers fetched in bulk by refresh_rate_tickers(), used by get_rate()
+        self._rate_tickers: Tickers = {}
+        self._rate_tickers_time: int = 0
 
         # Holds candles
         self._klines: dict[PairWithTimeframe, DataFrame] = {}
@@ -572,6 +581,14 @@ class Exchange:
             )
         )
 
+    def ohlcv_request_stats(self) -> dict[str, Any]:
+        """
+        State of the candle (OHLCV) request scheduler.
+        Contains the number of queued ("pending") and running requests, the current
+        concurrency limit and the average request latency.
+        """
+        return self._ohlcv_scheduler.stats()
+
     def klines(self, pair_interval: PairWithTimeframe, copy: bool = True) -> DataFrame:
         if pair_interval in self._klines:
             return self._klines[pair_interval].copy() if copy else self._klines[pair_interval]
@@ -2064,6 +2081,49 @@ class Exchange:
             price_side = price_map[(side, "short" if is_short else "long", price_side)]
         return price_side
 
+    def refresh_rate_tickers(self, pairs: list[str]) -> None:
+        """
+        Fetch tickers for all pairs with one call, so get_rate() / get_rates() don't need
+        to fetch the ticker for every pair individually.
+        Only active if exchange.tickers_max_age is configured and the exchange returns
+        bid / ask prices from fetch_tickers.
+        Called once per iteration by the bot.
+        :param pairs: Pairs which will need a rate in this iteration
+        """
+        if (
+            not self._config.get("exchange", {}).get("tickers_max_age")
+            or not pairs
+            or not self.exchange_has("fetchTickers")
+            or not self._ft_has["tickers_have_bid_ask"]
+            or (
+                self._config.get("entry_pricing", {}).get("use_order_book", False)
+                and self._config.get("exit_pricing", {}).get("use_order_book", False)
+            )
+        ):
+            return
+        try:
+            tickers = self.get_tickers()
+        except (ExchangeError, OperationalException) as e:
+            logger.warning(f"Could not refresh tickers for pricing: {e}")
+            return
+        with self._cache_lock:
+            self._rate_tickers = {pair: tickers[pair] for pair in pairs if pair in tickers}
+            self._rate_tickers_time = dt_ts()
+
+    def _get_rate_ticker(self, pair: str) -> Ticker:
+        """
+        Get the ticker to use for pricing - from the bulk tickers if they're recent enough,
+        otherwise by fetching the ticker for this pair.
+        """
+        max_age = self._config.get("exchange", {}).get("tickers_max_age")
+        if max_age:
+            with self._cache_lock:
+                ticker = self._rate_tickers.get(pair)
+                fresh = self._rate_tickers_time + max_age * 1000 >= dt_ts()
+            if ticker and fresh and ticker.get("bid") is not None and ticker.get("ask") is not None:
+                return ticker
+        return self.fetch_ticker(pair)
+
     def get_rate(
         self,
         pair: str,
@@ -2108,7 +2168,7 @@ class Exchange:
         else:
             logger.debug(f"Using Last {price_side.capitalize()} / Last Price")
             if ticker is None:
-                ticker = self.fetch_ticker(pair)
+                ticker = self._get_rate_ticker(pair)
             rate = self._get_rate_from_ticker(side, ticker, conf_strategy, price_side)
 
         if rate is None:
@@ -2187,7 +2247,7 @@ class Exchange:
             order_book = self.fetch_l2_order_book(pair, order_book_top)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, order_book=order_book)
         elif not entry_rate:
-            ticker = self.fetch_ticker(pair)
+            ticker = self._get_rate_ticker(pair)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, ticker=ticker)
         if not exit_rate:
             exit_rate = self.get_rate(
@@ -2470,7 +2530,7 @@ class Exchange:
             )
 
             if (
-                candles
+                len(candles)
                 and (
                     (len(candles) > 1 and candles[-1][0] >= prev_candle_ts)
                     # Edgecase on reconnect, where 1 candle is available but it's the current one
@@ -2554,14 +2614,26 @@ class Exchange:
             )
 
     def _build_ohlcv_dl_jobs(
-        self, pair_list: ListPairsWithTimeframes, since_ms: int | None, cache: bool
+        self,
+        pair_list: ListPairsWithTimeframes,
+        since_ms: int | None,
+        cache: bool,
+        priority_pairs: list[str] | None = None,
     ) -> tuple[list[Coroutine], list[PairWithTimeframe]]:
         """
         Build Coroutines to execute as part of refresh_latest_ohlcv
         """
         input_coroutines: list[Coroutine[Any, Any, OHLCVResponse]] = []
         cached_pairs = []
-        for pair, timeframe, candle_type in set(pair_list):
+        # Keep the order of pair_list (whitelist first), but request candles of priority pairs
+        # (pairs with open trades) first, and the strategy timeframe before informative
+        # timeframes.
+        main_timeframe = self._config.get("timeframe")
+        priority = set(priority_pairs or [])
+        pair_list = sorted(
+            dict.fromkeys(pair_list), key=lambda p: (p[0] not in priority, p[1] != main_timeframe)
+        )
+        for pair, timeframe, candle_type in pair_list:
             if timeframe not in self.timeframes and candle_type in (
                 CandleType.SPOT,
                 CandleType.FUTURES,
@@ -2595,14 +2667,14 @@ class Exchange:
         pair: str,
         timeframe: str,
         c_type: CandleType,
-        ticks: list[list],
+        ticks: list[list] | np.ndarray,
         cache: bool,
         drop_incomplete: bool,
     ) -> DataFrame:
         # keeping last candle time as last refreshed time of the pair
-        if ticks and cache:
+        if len(ticks) and cache:
             idx = -2 if drop_incomplete and len(ticks) > 1 else -1
-            self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0]
+            self._pairs_last_refresh_time[(pair, timeframe, c_type)] = int(ticks[idx][0])
         has_cache = cache and (pair, timeframe, c_type) in self._klines
         # in case of existing cache, fill_missing happens after concatenation
         ohlcv_df = ohlcv_to_dataframe(
@@ -2613,13 +2685,7 @@ class Exchange:
             if (pair, timeframe, c_type) in self._klines:
                 old = self._klines[(pair, timeframe, c_type)]
                 # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
+                ohlcv_df = ohlcv_append_candles(old, ohlcv_df, timeframe, pair)
                 candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
                 # Age out old candles
                 ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
@@ -2636,6 +2702,7 @@ class Exchange:
         since_ms: int | None = None,
         cache: bool = True,
         drop_incomplete: bool | None = None,
+        priority_pairs: list[str] | None = None,
     ) -> dict[PairWithTimeframe, DataFrame]:
         """
         Refresh in-memory OHLCV asynchronously and set `_klines` with the result
@@ -2646,35 +2713,33 @@ class Exchange:
         :param cache: Assign result to _klines. Useful for one-off downloads like for pairlists
         :param drop_incomplete: Control candle dropping.
             Specifying None defaults to _ohlcv_partial_candle
+        :param priority_pairs: Pairs to refresh first (e.g. pairs with open trades)
         :return: Dict of [{(pair, timeframe): Dataframe}]
         """
         logger.debug("Refreshing candle (OHLCV) data for %d pairs", len(pair_list))
 
         # Gather coroutines to run
-        ohlcv_dl_jobs, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
+        ohlcv_dl_jobs, cached_pairs = self._build_ohlcv_dl_jobs(
+            pair_list, since_ms, cache, priority_pairs
+        )
 
         results_df = {}
-        # Chunk requests into batches of 100 to avoid overwhelming ccxt Throttling
-        for dl_jobs_batch in chunks(ohlcv_dl_jobs, 100):
-
-            async def gather_coroutines(coro):
-                return await asyncio.gather(*coro, return_exceptions=True)
-
-            with self._loop_lock:
-                results = self.loop.run_until_complete(gather_coroutines(dl_jobs_batch))
+        # Requests are started in order, with concurrency adjusted to the exchange's rate limits
+        with self._loop_lock:
+            results = self.loop.run_until_complete(self._ohlcv_scheduler.run(ohlcv_dl_jobs))
 
-            for res in results:
-                if isinstance(res, Exception):
-                    logger.warning(f"Async code raised an exception: {repr(res)}")
-                    continue
-                # Deconstruct tuple (has 5 elements)
-                pair, timeframe, c_type, ticks, drop_hint = res
-                drop_incomplete_ = drop_hint if drop_incomplete is None else drop_incomplete
-                ohlcv_df = self._process_ohlcv_df(
-                    pair, timeframe, c_type, ticks, cache, drop_incomplete_
-                )
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning(f"Async code raised an exception: {repr(res)}")
+                continue
+            # Deconstruct tuple (has 5 elements)
+            pair, timeframe, c_type, ticks, drop_hint = res
+            drop_incomplete_ = drop_hint if drop_incomplete is None else drop_incomplete
+            ohlcv_df = self._process_ohlcv_df(
+                pair, timeframe, c_type, ticks, cache, drop_incomplete_
+            )
 
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
+            results_df[(pair, timeframe, c_type)] = ohlcv_df
 
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
@@ -2893,8 +2958,14 @@ class Exchange:
 
                 else:
                     until = int(timeframe_to_prev_date(timeframe).timestamp()) * 1000
+                    # Only the tail of the stored trades is needed - including one candle
+                    # before the first required candle, to verify they cover this candle.
                     all_stored_ticks_df = data_handler.trades_load(
-                        f"{pair}-cached", self.trading_mode
+                        f"{pair}-cached",
+                        self.trading_mode,
+                        timerange=TimeRange(
+                            "date", None, first_candle_ms // 1000 - timeframe_to_seconds(timeframe)
+                        ),
                     )
 
                     if not all_stored_ticks_df.empty:
@@ -2940,9 +3011,18 @@ class Exchange:
                     cache,
                     first_required_candle_date=first_candle_ms,
                 )
-                data_handler.trades_store(
-                    f"{pair}-cached", trades_df[DEFAULT_TRADES_COLUMNS], self.trading_mode
-                )
+                if is_in_cache or not all_stored_ticks_df.empty:
+                    # Stored trades are continued - only the new trades have to be written
+                    data_handler.trades_append(
+                        f"{pair}-cached",
+                        DataFrame(new_ticks, columns=DEFAULT_TRADES_COLUMNS),
+                        self.trading_mode,
+                        keep_since_ms=first_candle_ms,
+                    )
+                else:
+                    data_handler.trades_store(
+                        f"{pair}-cached", trades_df[DEFAULT_TRADES_COLUMNS], self.trading_mode
+                    )
                 return pairwt, trades_df
             else:
                 logger.error(f"No new ticks for {pair}")
@@ -3230,6 +3310,27 @@ class Exchange:
                     pass
             return self.loop.run_until_complete(task)
 
+    def get_historic_trades_chunks(
+        self,
+        pair: str,
+        since: int,
+        until: int | None = None,
+        from_id: str | None = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Get trade history data as time-ordered chunks, so it can be stored incrementally.
+        Exchanges with bulk archives can override this to avoid holding the whole
+        download in memory - by default, all trades are returned as one chunk.
+        :param pair: Pair to download
+        :param since: Timestamp in milliseconds to get history from
+        :param until: Timestamp in milliseconds. Defaults to current timestamp if not defined.
+        :param from_id: Download data starting with ID (if id is known)
+        :returns Iterator of trades DataFrames
+        """
+        yield trades_list_to_df(
+            self.get_historic_trades(pair=pair, since=since, until=until, from_id=from_id)[1]
+        )
+
     @retrier
     def _get_funding_fees_from_exchange(self, pair: str, since: datetime | int) -> float:
         """
@@ -3397,6 +3498,21 @@ class Exchange:
             for tier in tiers:
                 pair_tiers.append(self.parse_leverage_tier(tier))
             self._leverage_tiers[pair] = pair_tiers
+            self._leverage_tiers_index[pair] = LeverageTierIndex(pair_tiers)
+
+    def _get_leverage_tier_index(self, pair: str) -> LeverageTierIndex | None:
+        """
+        Get the lookup index for the leverage tiers of this pair.
+        Rebuilt if the tiers of this pair have been replaced since the index was built.
+        """
+        pair_tiers = self._leverage_tiers.get(pair)
+        if pair_tiers is None:
+            return None
+        index = self._leverage_tiers_index.get(pair)
+        if index is None or index.tiers is not pair_tiers:
+            index = LeverageTierIndex(pair_tiers)
+            self._leverage_tiers_index[pair] = index
+        return index
 
     def parse_leverage_tier(self, tier) -> dict:
         info = tier.get("info", {})
@@ -3425,43 +3541,32 @@ class Exchange:
                     f"{self.name}.get_max_leverage requires argument stake_amount"
                 )
 
-            if pair not in self._leverage_tiers:
+            tier_index = self._get_leverage_tier_index(pair)
+            if tier_index is None:
                 # Maybe raise exception because it can't be traded on futures?
                 return 1.0
 
-            pair_tiers = self._leverage_tiers[pair]
+            pair_tiers = tier_index.tiers
 
             if stake_amount == 0:
                 return pair_tiers[0]["maxLeverage"]  # Max lev for lowest amount
 
             # Find the appropriate tier based on stake_amount
-            prior_max_lev = None
-            for tier in pair_tiers:
-                # Adjust notional by leverage to do a proper comparison
-                min_stake = tier["minNotional"] / (prior_max_lev or tier["maxLeverage"])
-                max_stake = tier["maxNotional"] / tier["maxLeverage"]
-                prior_max_lev = tier["maxLeverage"]
-                if min_stake <= stake_amount <= max_stake:
-                    return tier["maxLeverage"]
-                if stake_amount < min_stake and stake_amount <= max_stake:
-                    # TODO: Remove this warning eventually
-                    # Code could be simplified by removing the check for min-stake in the above
-                    # condition, making this branch unnecessary.
-                    logger.warning(
-                        f"Fallback to next higher leverage tier for {pair}, stake: {stake_amount}, "
-                        f"min_stake: {min_stake}."
-                    )
-                    return tier["maxLeverage"]
-
-            #     else:  # if on the last tier
-            if stake_amount > max_stake:
+            # (first tier where stake_amount <= maxNotional / maxLeverage)
+            idx = tier_index.tier_index_for_stake(stake_amount)
+            if idx >= len(pair_tiers):
                 # If stake is > than max tradeable amount
                 raise InvalidOrderException(f"Stake amount {stake_amount} too high for {pair}")
 
-            raise OperationalException(
-                f"Looped through all tiers without finding a max leverage for {pair}. "
-                "Should never be reached."
-            )
+            # Adjust notional by leverage to do a proper comparison
+            min_stake = tier_index.min_stake[idx]
+            if stake_amount < min_stake:
+                # TODO: Remove this warning eventually
+                logger.warning(
+                    f"Fallback to next higher leverage tier for {pair}, stake: {stake_amount}, "
+                    f"min_stake: {min_stake}."
+                )
+            return pair_tiers[idx]["maxLeverage"]
 
         elif self.trading_mode == TradingMode.MARGIN:  # Search markets.limits for max lev
             market = self.markets[pair]
@@ -3481,13 +3586,11 @@ class Exchange:
         """
         if self.trading_mode != TradingMode.FUTURES:
             return None
-        if pair not in self._leverage_tiers:
+        tier_index = self._get_leverage_tier_index(pair)
+        if tier_index is None:
             return None
-        pair_tiers = self._leverage_tiers[pair]
-        for tier in reversed(pair_tiers):
-            if leverage <= tier["maxLeverage"]:
-                return tier["maxNotional"]
-        return None
+        tier = tier_index.tier_for_leverage(leverage)
+        return tier["maxNotional"] if tier else None
 
     @retrier
     def _set_leverage(
@@ -3762,6 +3865,11 @@ class Exchange:
                 pos = positions[0]
                 liquidation_price = pos["liquidationPrice"]
 
+        return self._apply_liquidation_buffer(open_rate, is_short, liquidation_price)
+
+    def _apply_liquidation_buffer(
+        self, open_rate: float, is_short: bool, liquidation_price: float | None
+    ) -> float | None:
         if liquidation_price is not None:
             buffer_amount = abs(open_rate - liquidation_price) * self.liquidation_buffer
             liquidation_price_buffer = (
@@ -3771,6 +3879,50 @@ class Exchange:
         else:
             return None
 
+    def get_liquidation_prices(
+        self,
+        trades: list,
+        wallet_balance: float,
+        open_trades: list,
+    ) -> list[float | None]:
+        """
+        Liquidation prices for multiple positions sharing one wallet (cross margin).
+        Same result as get_liquidation_price() for every trade - but dry-run calculations
+        evaluate the other open trades once for all positions, instead of once per position.
+        :param trades: Trades to calculate the liquidation price for
+        :param wallet_balance: Amount of margin in the wallet (crossWalletBalance)
+        :param open_trades: All open trades in the same wallet
+        :return: Liquidation prices, in the order of trades
+        """
+        if self.trading_mode == TradingMode.SPOT:
+            return [None] * len(trades)
+        elif self.trading_mode != TradingMode.FUTURES:
+            raise OperationalException(
+                f"{self.name} does not support {self.margin_mode} {self.trading_mode}"
+            )
+
+        if self._config["dry_run"] or not self.exchange_has("fetchPositions"):
+            liquidation_prices = self.dry_run_liquidation_prices(
+                trades, wallet_balance=wallet_balance, open_trades=open_trades
+            )
+            return [
+                self._apply_liquidation_buffer(t.open_rate, t.is_short, liquidation_price)
+                for t, liquidation_price in zip(trades, liquidation_prices, strict=True)
+            ]
+        return [
+            self.get_liquidation_price(
+                pair=t.pair,
+                open_rate=t.open_rate,
+                is_short=t.is_short,
+                amount=t.amount,
+                stake_amount=t.stake_amount,
+                leverage=t.leverage,
+                wallet_balance=wallet_balance,
+                open_trades=open_trades,
+            )
+            for t in trades
+        ]
+
     def dry_run_liquidation_price(
         self,
         pair: str,
@@ -3826,6 +3978,36 @@ class Exchange:
                 "Freqtrade only supports isolated futures for leverage trading"
             )
 
+    def dry_run_liquidation_prices(
+        self,
+        trades: list,
+        wallet_balance: float,
+        open_trades: list,
+    ) -> list[float | None]:
+        """
+        Dry-run liquidation prices for multiple positions in the same wallet.
+        Important: Must be fetching data from cached values as this is used by backtesting!
+        Exchanges which can evaluate all positions jointly override this method - the default
+        calls dry_run_liquidation_price for every position.
+        :param trades: Trades to calculate the liquidation price for
+        :param wallet_balance: Amount of margin in the wallet being used to trade
+        :param open_trades: List of open trades in the same wallet
+        :return: Liquidation prices (without buffer), in the order of trades
+        """
+        return [
+            self.dry_run_liquidation_price(
+                pair=t.pair,
+                open_rate=t.open_rate,
+                is_short=t.is_short,
+                amount=t.amount,
+                stake_amount=t.stake_amount,
+                leverage=t.leverage,
+                wallet_balance=wallet_balance,
+                open_trades=open_trades,
+            )
+            for t in trades
+        ]
+
     def get_maintenance_ratio_and_amt(
         self,
         pair: str,
@@ -3843,19 +4025,48 @@ class Exchange:
             or self.exchange_has("fetchLeverageTiers")
             or self.exchange_has("fetchMarketLeverageTiers")
         ):
-            if pair not in self._leverage_tiers:
+            tier_index = self._get_leverage_tier_index(pair)
+            if tier_index is None:
                 raise InvalidOrderException(
                     f"Maintenance margin rate for {pair} is unavailable for {self.name}"
                 )
 
-            pair_tiers = self._leverage_tiers[pair]
-
-            for tier in reversed(pair_tiers):
-                if notional_value >= tier["minNotional"]:
-                    return (tier["maintenanceMarginRate"], tier["maintAmt"])
+            tier = tier_index.tier_for_notional(notional_value)
+            if tier:
+                return (tier["maintenanceMarginRate"], tier["maintAmt"])
 
             raise ExchangeError("nominal value can not be lower than 0")
             # The lowest notional_floor for any pair in fetch_leverage_tiers is always 0 because it
             # describes the min amt for a tier, and the lowest tier will always go down to 0
         else:
             raise ExchangeError(f"Cannot get maintenance ratio using {self.name}")
+
+    def get_maintenance_ratios_and_amts(
+        self,
+        pair: str,
+        notional_values: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized version of get_maintenance_ratio_and_amt, for many notional values at once.
+        Important: Must be fetching data from cached values as this is used by backtesting!
+        :param pair: Market symbol
+        :param notional_values: Array of trade amounts in quote currency
+        :return: (maintenance margin ratios, maintenance amounts) - maintenance amounts are NaN
+            if the exchange doesn't provide them.
+        """
+        if (
+            self._config.get("runmode") in OPTIMIZE_MODES
+            or self.exchange_has("fetchLeverageTiers")
+            or self.exchange_has("fetchMarketLeverageTiers")
+        ):
+            tier_index = self._get_leverage_tier_index(pair)
+            if tier_index is None:
+                raise InvalidOrderException(
+                    f"Maintenance margin rate for {pair} is unavailable for {self.name}"
+                )
+            idx = tier_index.tiers_for_notionals(np.asarray(notional_values, dtype=np.float64))
+            if len(idx) and idx.min() < 0:
+                raise ExchangeError("nominal value can not be lower than 0")
+            return tier_index.mm_ratio_arr[idx], tier_index.maint_amt_arr[idx]
+        else:
+            raise ExchangeError(f"Cannot get maintenance ratio using {self.name}")
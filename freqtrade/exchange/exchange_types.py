@@ -1,5 +1,7 @@
 from typing import Any, Literal, TypedDict
 
+import numpy as np
+
 from freqtrade.enums import CandleType
 
 
@@ -106,4 +108,4 @@ class CcxtPosition(TypedDict):
 CcxtOrder = dict[str, Any]
 
 # pair, timeframe, candleType, OHLCV, drop last?,
-OHLCVResponse = tuple[str, str, CandleType, list, bool]
+OHLCVResponse = tuple[str, str, CandleType, list | np.ndarray, bool]
@@ -6,6 +6,7 @@ from functools import partial
 from threading import Thread
 
 import ccxt
+import numpy as np
 
 from freqtrade.constants import Config, PairWithTimeframe
 from freqtrade.enums.candletype import CandleType
@@ -29,6 +30,8 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+        # Read-only candle arrays per (pair, timeframe), replaced on every websocket update.
+        self._ohlcv_snapshots: dict[tuple[str, str], np.ndarray] = {}
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -74,6 +77,7 @@ class ExchangeWS:
             # Clear the cache.
             # Not doing this will cause problems on startup with dynamic pairlists
             self._ccxt_object.ohlcvs.clear()
+            self._ohlcv_snapshots.clear()
         except Exception:
             logger.exception("Exception in _cleanup_async")
         finally:
@@ -84,15 +88,59 @@ class ExchangeWS:
         Remove history for a pair/timeframe combination from ccxt cache
         """
         self._ccxt_object.ohlcvs.get(paircomb[0], {}).pop(paircomb[1], None)
+        self._ohlcv_snapshots.pop((paircomb[0], paircomb[1]), None)
         self.klines_last_refresh.pop(paircomb, None)
 
-    @retrier(retries=3)
-    def ohlcvs(self, pair: str, timeframe: str) -> list[list]:
+    def _update_ohlcv_snapshot(self, pair: str, timeframe: str, candles: list[list]) -> None:
+        """
+        Replace the candle snapshot for a pair/timeframe combination with ccxt's cache content.
+        Runs in the websocket thread, which is the only thread modifying ccxt's cache.
+        Only candles not older than the previous snapshot's last candle are converted,
+        older candles are reused from the previous snapshot.
         """
-        Returns a copy of the klines for a pair/timeframe combination
+        key = (pair, timeframe)
+        if not candles:
+            self._ohlcv_snapshots.pop(key, None)
+            return
+        prev = self._ohlcv_snapshots.get(key)
+        start = 0
+        if prev is not None and len(prev):
+            start = len(candles)
+            while start > 0 and candles[start - 1][0] >= prev[-1, 0]:
+                start -= 1
+        new = np.array(candles[start:], dtype=np.float64).reshape(-1, 6)
+        snapshot = None
+        if prev is not None and start > 0:
+            older = prev[prev[:, 0] < new[0, 0]] if len(new) else prev
+            if (
+                len(older) >= start
+                and older[-start, 0] == candles[0][0]
+                and older[-1, 0] == candles[start - 1][0]
+            ):
+                snapshot = np.concatenate([older[-start:], new])
+        if snapshot is None:
+            snapshot = np.array(candles, dtype=np.float64).reshape(-1, 6)
+        snapshot.flags.writeable = False
+        self._ohlcv_snapshots[key] = snapshot
+
+    def ohlcvs(self, pair: str, timeframe: str) -> np.ndarray | list[list]:
+        """
+        Returns the klines for a pair/timeframe combination.
+        Returns a read-only array (columns as DEFAULT_DATAFRAME_COLUMNS), which is replaced
+        (not modified) on updates - so it can be used without copying.
         Note: this will only contain the data received from the websocket
             so the data will build up over time.
         """
+        if (snapshot := self._ohlcv_snapshots.get((pair, timeframe))) is not None:
+            return snapshot
+        return self._ohlcvs_copy(pair, timeframe)
+
+    @retrier(retries=3)
+    def _ohlcvs_copy(self, pair: str, timeframe: str) -> list[list]:
+        """
+        Returns a copy of ccxt's klines cache for a pair/timeframe combination.
+        Only used until the first snapshot is available.
+        """
         try:
             return deepcopy(self._ccxt_object.ohlcvs.get(pair, {}).get(timeframe, []))
         except RuntimeError as e:
@@ -174,6 +222,9 @@ class ExchangeWS:
             while (pair, timeframe, candle_type) in self._klines_watching:
                 start = dt_ts()
                 data = await self._ccxt_object.watch_ohlcv(pair, timeframe)
+                self._update_ohlcv_snapshot(
+                    pair, timeframe, self._ccxt_object.ohlcvs.get(pair, {}).get(timeframe, [])
+                )
                 self.klines_last_refresh[(pair, timeframe, candle_type)] = dt_ts()
                 logger.debug(
                     f"watch done {pair}, {timeframe}, data {len(data)} "
@@ -207,10 +258,10 @@ class ExchangeWS:
         Returns cached klines from ccxt's "watch" cache.
         :param candle_ts: timestamp of the end-time of the candle we expect.
         """
-        # Deepcopy the response - as it might be modified in the background as new messages arrive
+        # Snapshots are never modified in the background - so no copy is necessary
         candles = self.ohlcvs(pair, timeframe)
         refresh_date = self.klines_last_refresh[(pair, timeframe, candle_type)]
-        received_ts = candles[-1][0] if candles else 0
+        received_ts = int(candles[-1][0]) if len(candles) else 0
         drop_hint = received_ts >= candle_ts
         if received_ts > refresh_date:
             logger.warning(
@@ -0,0 +1,68 @@
+"""
+Lookup index for leverage tiers
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+import numpy as np
+
+
+class LeverageTierIndex:
+    """
+    Leverage tiers of one pair, compiled for bisect lookups.
+    Lookups return the same tier as a linear scan over the tiers (in their original order)
+    would - running minimums / maximums are used as search keys, so the lookups don't rely
+    on the tiers being sorted.
+    """
+
+    def __init__(self, tiers: list[dict]) -> None:
+        self.tiers = tiers
+        min_notional = [t["minNotional"] for t in tiers]
+        max_leverage = [t["maxLeverage"] for t in tiers]
+
+        # Last tier with minNotional <= notional
+        self._min_notional_key = list(accumulate(reversed(min_notional), min))[::-1]
+        # Last tier with maxLeverage >= leverage (negated, as bisect needs ascending keys)
+        self._max_leverage_key = [-lev for lev in accumulate(reversed(max_leverage), max)][::-1]
+        # First tier with stake <= maxNotional / maxLeverage
+        max_stake = [t["maxNotional"] / t["maxLeverage"] for t in tiers]
+        self._max_stake_key = list(accumulate(max_stake, max))
+        self.min_stake = [
+            t["minNotional"] / (max_leverage[i - 1] if i > 0 else t["maxLeverage"])
+            for i, t in enumerate(tiers)
+        ]
+
+        self._min_notional_arr = np.array(self._min_notional_key, dtype=np.float64)
+        self.mm_ratio_arr = np.array([t["maintenanceMarginRate"] for t in tiers], dtype=np.float64)
+        self.maint_amt_arr = np.array(
+            [np.nan if t["maintAmt"] is None else t["maintAmt"] for t in tiers], dtype=np.float64
+        )
+
+    def tier_for_notional(self, notional_value: float) -> dict | None:
+        """
+        Get the tier for a notional value (last tier with minNotional <= notional_value)
+        """
+        idx = bisect_right(self._min_notional_key, notional_value) - 1
+        return self.tiers[idx] if idx >= 0 else None
+
+    def tiers_for_notionals(self, notional_values: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of tier_for_notional.
+        :return: Array of tier indexes, -1 where no tier matches.
+        """
+        return np.searchsorted(self._min_notional_arr, notional_values, side="right") - 1
+
+    def tier_for_leverage(self, leverage: float) -> dict | None:
+        """
+        Get the tier for a leverage (last tier with maxLeverage >= leverage)
+        """
+        idx = bisect_right(self._max_leverage_key, -leverage) - 1
+        return self.tiers[idx] if idx >= 0 else None
+
+    def tier_index_for_stake(self, stake_amount: float) -> int:
+        """
+        Get the index of the first tier with stake_amount <= maxNotional / maxLeverage.
+        :return: Tier index - or len(tiers) if stake_amount is too high for all tiers.
+        """
+        return bisect_left(self._max_stake_key, stake_amount)
@@ -0,0 +1,173 @@
+"""
+Adaptive scheduler for concurrent exchange requests.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Coroutine
+from contextvars import ContextVar
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+class _RequestState:
+    """
+    State of a single request run by a RequestScheduler.
+    """
+
+    __slots__ = ("attempt_start", "scheduler", "window")
+
+    def __init__(self, scheduler: "RequestScheduler") -> None:
+        self.scheduler = scheduler
+        # Congestion window the current attempt was sent in
+        self.window = scheduler._window
+        self.attempt_start = time.monotonic()
+
+
+_current_request: ContextVar[_RequestState | None] = ContextVar("_current_request", default=None)
+
+
+def report_rate_limited() -> None:
+    """
+    Report a rate limit (DDosProtection) error to the scheduler running the current request.
+    No-op if the current request was not started by a RequestScheduler.
+    """
+    if request := _current_request.get():
+        request.scheduler.rate_limited(request)
+
+
+def report_retry() -> None:
+    """
+    Report that the current request is about to be retried.
+    Only the last attempt counts towards the request latency - so failed attempts and
+    backoff delays don't slow down recovery of the concurrency limit.
+    No-op if the current request was not started by a RequestScheduler.
+    """
+    if request := _current_request.get():
+        request.window = request.scheduler._window
+        request.attempt_start = time.monotonic()
+
+
+class RequestScheduler:
+    """
+    Runs request coroutines with an adaptive concurrency limit.
+    Requests are started in the order they're provided - as soon as a running request
+    finishes, the next one is started (no fixed batches).
+    The limit is halved when the exchange signals rate limiting - at most once per congestion
+    window, so a burst of rate limited requests which were all sent before the decrease only
+    halves the limit once. While the average latency stays below the target latency, it's
+    increased again by one once as many requests as the current limit finished without rate
+    limiting - so recovering from 50 to 100 takes several refreshes, not 50 requests.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 100,
+        min_concurrency: int = 1,
+        target_latency: float = 5.0,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.target_latency = target_latency
+        self.concurrency = max_concurrency
+        self.latency: float | None = None
+        self._pending = 0
+        self._running = 0
+        # Requests finished since the concurrency limit last changed
+        self._finished_since_change = 0
+        # Congestion window - increased on every decrease of the concurrency limit
+        self._window = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of requests waiting to be started.
+        """
+        return self._pending
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "pending": self._pending,
+            "running": self._running,
+            "concurrency": self.concurrency,
+            "latency": self.latency,
+        }
+
+    def rate_limited(self, request: _RequestState | None = None) -> None:
+        """
+        Halve the concurrency limit.
+        :param request: Rate limited request. Ignored if the limit was already decreased
+            after this request was sent.
+        """
+        if request is not None and request.window != self._window:
+            return
+        self._window += 1
+        new_concurrency = max(self.min_concurrency, self.concurrency // 2)
+        if new_concurrency != self.concurrency:
+            logger.info(
+                f"Rate limit hit for {self.name} requests, "
+                f"reducing concurrency to {new_concurrency}."
+            )
+        self.concurrency = new_concurrency
+        self._finished_since_change = 0
+
+    def _request_done(self, latency: float) -> None:
+        # Exponential moving average of the request latency
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        if self.latency < self.target_latency and self.concurrency < self.max_concurrency:
+            self._finished_since_change += 1
+            if self._finished_since_change >= self.concurrency:
+                self.concurrency += 1
+                self._finished_since_change = 0
+
+    async def _run_request(self, coro: Coroutine, request: _RequestState) -> Any:
+        self._running += 1
+        request.attempt_start = time.monotonic()
+        try:
+            return await coro
+        except Exception as e:
+            return e
+        finally:
+            self._running -= 1
+            self._request_done(time.monotonic() - request.attempt_start)
+
+    async def run(self, coros: list[Coroutine]) -> list[Any]:
+        """
+        Run all coroutines, respecting the concurrency limit.
+        :param coros: Coroutines to run, in order of priority
+        :return: List of results (or exceptions) in the order of coros
+        """
+        results: list[Any] = [None] * len(coros)
+        queue = list(enumerate(coros))
+        queue.reverse()
+        self._pending += len(queue)
+        running: dict[asyncio.Task, int] = {}
+        try:
+            while queue or running:
+                while queue and len(running) < self.concurrency:
+                    idx, coro = queue.pop()
+                    self._pending -= 1
+                    request = _RequestState(self)
+                    token = _current_request.set(request)
+                    try:
+                        running[asyncio.create_task(self._run_request(coro, request))] = idx
+                    finally:
+                        _current_request.reset(token)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[running.pop(task)] = task.result()
+        finally:
+            self._pending -= len(queue)
+            for _, coro in queue:
+                # Avoid "coroutine was never awaited" warnings
+                coro.close()
+            for task in running:
+                task.cancel()
+        logger.debug(f"{self.name} requests done: {self.stats()}")
+        return results
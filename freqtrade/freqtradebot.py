@@ -263,7 +263,10 @@ class FreqtradeBot(LoggingMixin):
         self.dataprovider.refresh(
             self.pairlists.create_pair_list(self.active_pair_whitelist),
             self.strategy.gather_informative_pairs(),
+            priority_pairs=[trade.pair for trade in trades],
         )
+        # Refresh tickers used for entry / exit pricing in one go
+        self.exchange.refresh_rate_tickers(self.active_pair_whitelist)
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
             current_time=datetime.now(UTC)
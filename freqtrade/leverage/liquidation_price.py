@@ -34,21 +34,12 @@ def update_liquidation_prices(
                 )
 
             open_trades: list[Trade] = Trade.get_open_trades()
-            for t in open_trades:
-                if t.has_open_position:
-                    # TODO: This should be done in a batch update
-                    t.set_liquidation_price(
-                        exchange.get_liquidation_price(
-                            pair=t.pair,
-                            open_rate=t.open_rate,
-                            is_short=t.is_short,
-                            amount=t.amount,
-                            stake_amount=t.stake_amount,
-                            leverage=t.leverage,
-                            wallet_balance=total_wallet_stake,
-                            open_trades=open_trades,
-                        )
-                    )
+            positions = [t for t in open_trades if t.has_open_position]
+            liquidation_prices = exchange.get_liquidation_prices(
+                positions, wallet_balance=total_wallet_stake, open_trades=open_trades
+            )
+            for t, liquidation_price in zip(positions, liquidation_prices, strict=True):
+                t.set_liquidation_price(liquidation_price)
         elif trade:
             trade.set_liquidation_price(
                 exchange.get_liquidation_price(
@@ -8,7 +8,9 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta
+from heapq import heappop, heappush
 
+import numpy as np
 from numpy import isnan, nan
 from pandas import DataFrame, Series
 
@@ -49,6 +51,14 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.bt_detail_index import DetailCandles
+from freqtrade.optimize.bt_fast_path import (
+    FastPathPair,
+    build_fast_path_pairs,
+    fast_path_unsupported_reason,
+    merge_entry_steps,
+    roi_table,
+)
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -257,6 +267,7 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        self._detail_candles: dict[str, DetailCandles] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -282,6 +293,15 @@ class Backtesting:
         # Update can_short flag
         self._can_short = self.trading_mode != TradingMode.SPOT and strategy.can_short
 
+        self._use_fast_path = False
+        if self.config.get("backtest_fast_path", False):
+            reason = fast_path_unsupported_reason(strategy, self.config)
+            if reason:
+                logger.info(f"Backtest fast path disabled: {reason}. Using regular loop.")
+            else:
+                logger.info("Using backtest fast path.")
+                self._use_fast_path = True
+
         self.strategy.ft_bot_start()
 
     def _load_protections(self, strategy: IStrategy):
@@ -304,6 +324,8 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            workers=self.config.get("dataload_workers", 1),
+            progress_callback=lambda done, total: self.progress.set_new_value(done / total),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -443,7 +465,7 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, list]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
 
@@ -452,8 +474,24 @@ class Backtesting:
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
         optimize memory usage!
         """
+        return self._signal_dataframes_to_lists(self._get_signal_dataframes(processed))
+
+    @staticmethod
+    def _signal_dataframes_to_lists(data: dict[str, DataFrame]) -> dict[str, list]:
+        # Convert from Pandas to list for performance reasons
+        # (Looping Pandas is slow.)
+        return {
+            pair: df[HEADERS].values.tolist() if not df.empty else [] for pair, df in data.items()
+        }
 
-        data: dict = {}
+    def _get_signal_dataframes(self, processed: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Populate entry / exit signals and shift them by one candle.
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :return: dict of dataframes, with the startup period and the first candle removed.
+        """
+        data: dict[str, DataFrame] = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -493,11 +531,7 @@ class Backtesting:
                 elif not df_analyzed.empty:
                     df_analyzed[col] = 0 if not tag_col else None
 
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
-
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            data[pair] = df_analyzed.drop(df_analyzed.head(1).index)
         return data
 
     def _get_close_rate(
@@ -686,7 +720,7 @@ class Backtesting:
                     entry_tag1=order_tag,
                 )
                 if pos_trade is not None:
-                    self.wallets.update()
+                    self.wallets.update_trade(pos_trade)
                     return pos_trade
 
         if stake_amount is not None and stake_amount < 0.0:
@@ -782,7 +816,7 @@ class Backtesting:
                 trade.close(order.ft_price, show_msg=False)
 
                 LocalTrade.close_bt_trade(trade)
-            self.wallets.update()
+            self.wallets.update_trade(trade)
             self.run_protections(pair, current_time, trade.trade_direction)
 
     def _get_exit_for_signal(
@@ -1457,7 +1491,7 @@ class Backtesting:
             if self.manage_open_orders(t, current_time, row):
                 # Remove trade (initial open order never filled)
                 LocalTrade.remove_bt_trade(t)
-                self.wallets.update()
+                self.wallets.update_trade(t)
 
         # 2. Process entries.
         # without positionstacking, we can only have one open trade per pair.
@@ -1473,7 +1507,7 @@ class Backtesting:
             if self.trade_slot_available(LocalTrade.bt_open_open_trade_count):
                 trade = self._enter_trade(pair, row, trade_dir)
                 if trade:
-                    self.wallets.update()
+                    self.wallets.update_trade(trade)
             else:
                 self._collate_rejected(pair, row)
 
@@ -1481,7 +1515,7 @@ class Backtesting:
             # 3. Process entry orders.
             order = trade.select_order(trade.entry_side, is_open=True)
             if self._try_close_open_order(order, trade, current_time, row):
-                self.wallets.update()
+                self.wallets.update_trade(trade)
 
             # 4. Create exit orders (if any)
             if trade.has_open_position:
@@ -1496,26 +1530,30 @@ class Backtesting:
             return exiting_dir
         return None
 
+    def _get_detail_candles(self, pair: str) -> DetailCandles:
+        """
+        Detail candles of the pair - converted once per detail dataframe.
+        """
+        detail = self._detail_candles.get(pair)
+        if detail is None or detail.source is not self.detail_data[pair]:
+            detail = DetailCandles(self.detail_data[pair], self.timeframe_td)
+            self._detail_candles[pair] = detail
+        return detail
+
+    def _index_detail_data(self, data: dict[str, list[tuple]]) -> None:
+        """
+        Precompute the detail candle positions of all main candles.
+        """
+        for pair, rows in data.items():
+            if pair in self.detail_data:
+                dates = np.array([row[DATE_IDX].value for row in rows], dtype=np.int64)
+                self._get_detail_candles(pair).index_main_candles(dates)
+
     def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
         """
         Spread into detail data
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
-
-        if len(detail_data) == 0:
-            return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        return self._get_detail_candles(pair).rows(row[DATE_IDX], row[LONG_IDX : EXIT_TAG_IDX + 1])
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1566,6 +1604,8 @@ class Backtesting:
         )
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
+        if self.timeframe_detail:
+            self._index_detail_data(data)
 
         for current_time in self._time_generator(start_date, end_date):
             # Loop for each main candle.
@@ -1656,6 +1696,156 @@ class Backtesting:
                 yield current_time_det, pair, row, is_last_row, trade_dir
             self.progress.increment()
 
+    def _process_candle(
+        self,
+        row: tuple,
+        pair: str,
+        current_time: datetime,
+        trade_dir: LongShort | None,
+        is_last_row: bool,
+    ) -> None:
+        if not self._can_short or trade_dir is None:
+            # No need to reverse position if shorting is disabled or there's no new signal
+            self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+        else:
+            # Conditionally call backtest_loop a 2nd time if shorting is enabled,
+            # a position closed and a new signal in the other direction is available.
+
+            for _ in (0, 1):
+                a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                if not a or a == trade_dir:
+                    # the trade didn't close or position change is in the same direction
+                    break
+
+    def _backtest_fast_path(
+        self, data: dict[str, FastPathPair], start_date: datetime, end_date: datetime
+    ) -> dict[str, list]:
+        """
+        Vectorized replacement for the time_pair_generator loop.
+        Only candles on which an entry or an exit can happen are processed (using the regular
+        backtest_loop). All other candles can't change the backtest state, so results are
+        identical to the regular loop.
+        :return: dict with the last row per pair (as required by handle_left_open()).
+        """
+        nsteps = int((end_date - start_date) / self.timeframe_td)
+        self.progress.init_step(BacktestState.BACKTEST, nsteps)
+        step0_ts = int((start_date + self.timeframe_td).timestamp())
+        roi_keys, roi_values = roi_table(self.strategy.minimal_roi)
+        use_exit_signal = self.strategy.use_exit_signal
+
+        pairs = list(data.keys())
+        pair_order = {pair: idx for idx, pair in enumerate(pairs)}
+        # Keep the pair order of bt_trades_open_pp identical to the regular loop,
+        # which initializes pairs once their first candle is processed.
+        for pair in sorted(pairs, key=lambda p: (data[p].offset, pair_order[p])):
+            LocalTrade.bt_trades_open_pp[pair]
+        entry_steps, entry_pairs = merge_entry_steps([data[pair] for pair in pairs])
+        entry_pos = 0
+
+        # Next step on which the open trades of a pair may exit.
+        exit_heap: list[tuple[int, int]] = []
+        scheduled: dict[str, int] = {}
+        # First step which has not been processed for a pair.
+        next_unprocessed: dict[str, int] = {}
+
+        while True:
+            next_entry = int(entry_steps[entry_pos]) if entry_pos < len(entry_steps) else nsteps
+            step = min(next_entry, exit_heap[0][0] if exit_heap else nsteps)
+            if step >= nsteps:
+                break
+            self.check_abort()
+            self.progress.set_new_value(step)
+
+            active: set[str] = set()
+            while entry_pos < len(entry_steps) and entry_steps[entry_pos] == step:
+                active.add(pairs[entry_pairs[entry_pos]])
+                entry_pos += 1
+            while exit_heap and exit_heap[0][0] == step:
+                pair = pairs[heappop(exit_heap)[1]]
+                if scheduled.get(pair) == step:
+                    active.add(pair)
+
+            current_time = start_date + (step + 1) * self.timeframe_td
+            self.dataprovider._set_dataframe_max_date(current_time)
+            # Pairs that have open trades should be processed first
+            ordered_pairs = dict.fromkeys(
+                [t.pair for t in LocalTrade.bt_trades_open if t.pair in active]
+                + sorted(active, key=pair_order.__getitem__)
+            )
+            for pair in ordered_pairs:
+                pair_data = data[pair]
+                row_index = step - pair_data.offset
+                if row_index >= len(pair_data):
+                    continue
+                for trade in LocalTrade.bt_trades_open_pp[pair]:
+                    pair_data.adjust_min_max_rates(trade, next_unprocessed.get(pair, step), step)
+                row = pair_data.row(step)
+                self.dataprovider._set_dataframe_max_index(
+                    pair, self.required_startup + row_index + 1
+                )
+                trade_dir = self.check_for_trade_entry(row)
+                self._process_candle(row, pair, current_time, trade_dir, step == nsteps - 1)
+                next_unprocessed[pair] = step + 1
+
+                next_step = self._fast_path_next_step(
+                    pair_data, step + 1, step0_ts, roi_keys, roi_values, use_exit_signal
+                )
+                if next_step is not None and next_step < nsteps:
+                    scheduled[pair] = next_step
+                    heappush(exit_heap, (next_step, pair_order[pair]))
+                else:
+                    scheduled.pop(pair, None)
+
+        # Apply skipped candles to trades which remain open until the end
+        for trade in LocalTrade.bt_trades_open:
+            pair_data = data[trade.pair]
+            pair_data.adjust_min_max_rates(
+                trade,
+                next_unprocessed.get(trade.pair, nsteps),
+                min(nsteps, pair_data.offset + len(pair_data)),
+            )
+        self.progress.set_new_value(nsteps)
+        return {
+            pair: [pair_data.row(pair_data.offset + len(pair_data) - 1)]
+            for pair, pair_data in data.items()
+        }
+
+    def _fast_path_next_step(
+        self,
+        pair_data: FastPathPair,
+        step: int,
+        step0_ts: int,
+        roi_keys,
+        roi_values,
+        use_exit_signal: bool,
+    ) -> int | None:
+        """
+        Next step on which one of the open trades of this pair may exit.
+        """
+        trades = LocalTrade.bt_trades_open_pp[pair_data.pair]
+        if not trades:
+            return None
+        if self.strategy.trailing_stop or any(t.has_open_orders for t in trades):
+            # Stoploss moves (or orders may fill) on every candle.
+            return step
+        steps = [
+            s
+            for trade in trades
+            if (
+                s := pair_data.next_exit_candidate(
+                    trade,
+                    step,
+                    step0_ts,
+                    self.timeframe_secs,
+                    roi_keys,
+                    roi_values,
+                    use_exit_signal,
+                )
+            )
+            is not None
+        ]
+        return min(steps, default=None)
+
     def backtest(
         self, processed: dict, start_date: datetime, end_date: datetime
     ) -> BacktestContentTypeIcomplete:
@@ -1675,30 +1865,31 @@ class Backtesting:
         self.prepare_backtest(self.enable_protections)
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        signal_data = self._get_signal_dataframes(processed)
+        fast_path_data = None
+        if self._use_fast_path:
+            fast_path_data = build_fast_path_pairs(
+                signal_data, HEADERS, start_date, self.timeframe_secs, self._can_short
+            )
+            if fast_path_data is None:
+                logger.info("Data not suitable for the backtest fast path, using regular loop.")
 
-        # Loop timerange and get candle for each pair at that point in time
-        for (
-            current_time,
-            pair,
-            row,
-            is_last_row,
-            trade_dir,
-        ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
-            if not self._can_short or trade_dir is None:
-                # No need to reverse position if shorting is disabled or there's no new signal
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-            else:
-                # Conditionally call backtest_loop a 2nd time if shorting is enabled,
-                # a position closed and a new signal in the other direction is available.
-
-                for _ in (0, 1):
-                    a = self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-                    if not a or a == trade_dir:
-                        # the trade didn't close or position change is in the same direction
-                        break
+        if fast_path_data is not None:
+            data = self._backtest_fast_path(fast_path_data, start_date, end_date)
+        else:
+            # Use dict of lists with data for performance
+            # (looping lists is a lot faster than pandas DataFrames)
+            data = self._signal_dataframes_to_lists(signal_data)
+
+            # Loop timerange and get candle for each pair at that point in time
+            for (
+                current_time,
+                pair,
+                row,
+                is_last_row,
+                trade_dir,
+            ) in self.time_pair_generator(start_date, end_date, list(data.keys()), data):
+                self._process_candle(row, pair, current_time, trade_dir, is_last_row)
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
@@ -0,0 +1,82 @@
+"""
+Lookup index for backtesting with --timeframe-detail.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Timestamp
+
+
+class DetailCandles:
+    """
+    Detail (smaller timeframe) candles of one pair.
+    Main candles are mapped to the (start, end) positions of their detail candles, so
+    getting the detail candles of a main candle is a slice.
+    Columns are read as views of the source dataframe - candle data is not copied.
+    """
+
+    __slots__ = (
+        "_columns",
+        "_dates",
+        "_dates_ns",
+        "_ends",
+        "_main_dates_ns",
+        "_starts",
+        "_timeframe_ns",
+        "source",
+    )
+
+    def __init__(self, df: DataFrame, timeframe_td: timedelta) -> None:
+        """
+        :param df: Detail candles of the pair, sorted by date
+        :param timeframe_td: Duration of one main candle
+        """
+        self.source = df
+        self._dates = DatetimeIndex(df["date"])
+        if self._dates.unit != "ns":
+            self._dates = self._dates.as_unit("ns")
+        self._dates_ns = self._dates.asi8
+        self._columns = tuple(
+            df[col].to_numpy(dtype=np.float64, copy=False)
+            for col in ("open", "high", "low", "close")
+        )
+        self._timeframe_ns = int(timeframe_td.total_seconds() * 1e9)
+        self._main_dates_ns = np.empty(0, dtype=np.int64)
+        self._starts = np.empty(0, dtype=np.int64)
+        self._ends = np.empty(0, dtype=np.int64)
+
+    def index_main_candles(self, dates_ns: np.ndarray) -> None:
+        """
+        Precompute the detail candle positions of the main candles starting at dates_ns.
+        :param dates_ns: Sorted start dates of the main candles, as int64 nanoseconds
+        """
+        self._main_dates_ns = dates_ns
+        self._starts = np.searchsorted(self._dates_ns, dates_ns, side="left")
+        self._ends = np.searchsorted(self._dates_ns, dates_ns + self._timeframe_ns, side="left")
+
+    def _bounds(self, date_ns: int) -> tuple[int, int]:
+        idx = int(np.searchsorted(self._main_dates_ns, date_ns, side="left"))
+        if idx < len(self._main_dates_ns) and self._main_dates_ns[idx] == date_ns:
+            return int(self._starts[idx]), int(self._ends[idx])
+        start = int(np.searchsorted(self._dates_ns, date_ns, side="left"))
+        end = int(np.searchsorted(self._dates_ns, date_ns + self._timeframe_ns, side="left"))
+        return start, end
+
+    def rows(self, date: Timestamp, signals: tuple) -> list[tuple] | None:
+        """
+        Detail candles of the main candle starting at date, as backtesting rows.
+        :param signals: Signal columns of the main candle, appended to every detail candle
+        :return: List of (date, open, high, low, close, *signals) - or None without candles
+        """
+        start, end = self._bounds(date.value)
+        if start == end:
+            return None
+        return [
+            (d, *ohlc, *signals)
+            for d, *ohlc in zip(
+                self._dates[start:end].tolist(),
+                *(col[start:end].tolist() for col in self._columns),
+                strict=True,
+            )
+        ]
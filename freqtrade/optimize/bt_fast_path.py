@@ -0,0 +1,231 @@
+"""
+Helpers for the vectorized backtesting fast path.
+
+The fast path uses NumPy to find the few candles on which something can happen
+(entry signals, possible stoploss / ROI / exit-signal hits) and only runs the regular
+backtesting logic on these candles. All other candles are skipped, as they can't change
+the state of the backtest for strategies without per-candle callbacks.
+"""
+
+import logging
+from datetime import datetime
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.constants import Config
+from freqtrade.enums import TradingMode
+from freqtrade.persistence import LocalTrade
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+# Strategy callbacks which can influence a trade on every candle.
+# Strategies overriding one of these can't use the fast path.
+PER_CANDLE_CALLBACKS = (
+    "bot_loop_start",
+    "check_buy_timeout",
+    "check_entry_timeout",
+    "check_sell_timeout",
+    "check_exit_timeout",
+    "confirm_trade_entry",
+    "confirm_trade_exit",
+    "order_filled",
+    "custom_stoploss",
+    "custom_roi",
+    "custom_entry_price",
+    "custom_exit_price",
+    "custom_sell",
+    "custom_exit",
+    "custom_stake_amount",
+    "adjust_trade_position",
+    "adjust_entry_price",
+    "adjust_exit_price",
+    "adjust_order_price",
+    "leverage",
+)
+
+# Initial window (in candles) used when searching for the next exit candidate.
+_SEARCH_WINDOW = 128
+# Relative tolerance to make sure rounding never hides a potential exit.
+_TOLERANCE = 1e-6
+
+
+def fast_path_unsupported_reason(strategy: IStrategy, config: Config) -> str | None:
+    """
+    Check if the strategy / configuration combination can use the fast path.
+    :return: None if the fast path can be used, the reason why it can't otherwise.
+    """
+    if config.get("trading_mode", TradingMode.SPOT) != TradingMode.SPOT:
+        return "only spot markets are supported"
+    if config.get("timeframe_detail"):
+        return "--timeframe-detail is not supported"
+    if strategy.position_adjustment_enable:
+        return "position adjustment is not supported"
+    if strategy.use_custom_stoploss or strategy.use_custom_roi:
+        return "custom stoploss / custom roi are not supported"
+    overridden = [
+        cb
+        for cb in PER_CANDLE_CALLBACKS
+        if getattr(type(strategy), cb, None) is not getattr(IStrategy, cb)
+    ]
+    if overridden:
+        return f"strategy implements {', '.join(overridden)}"
+    return None
+
+
+class FastPathPair:
+    """
+    Columnar representation of the analyzed (signal-shifted) dataframe of one pair.
+    Row ``i`` is processed at backtest step ``offset + i``.
+    """
+
+    __slots__ = ("entry_steps", "exit_idx", "high", "low", "offset", "pair", "rows")
+
+    def __init__(self, pair: str, rows: np.ndarray, df: DataFrame, offset: int, can_short: bool):
+        self.pair = pair
+        self.rows = rows
+        self.high = df["high"].to_numpy(dtype=np.float64)
+        self.low = df["low"].to_numpy(dtype=np.float64)
+        self.offset = offset
+
+        enter_long = (df["enter_long"] == 1).to_numpy()
+        exit_long = (df["exit_long"] == 1).to_numpy()
+        enter_short = (df["enter_short"] == 1).to_numpy() & can_short
+        exit_short = (df["exit_short"] == 1).to_numpy() & can_short
+        # Mirrors Backtesting.check_for_trade_entry()
+        entries = (enter_long & ~(exit_long | enter_short)) | (
+            enter_short & ~(exit_short | enter_long)
+        )
+        self.entry_steps = np.flatnonzero(entries) + offset
+        self.exit_idx = np.flatnonzero(exit_long)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def row(self, step: int) -> tuple:
+        return tuple(self.rows[step - self.offset].tolist())
+
+    def adjust_min_max_rates(self, trade: LocalTrade, start: int, end: int) -> None:
+        """
+        Apply the candles between steps ``start`` (inclusive) and ``end`` (exclusive),
+        which were skipped, to the trade's min / max rates.
+        """
+        start_idx = start - self.offset
+        end_idx = end - self.offset
+        if end_idx > start_idx:
+            trade.adjust_min_max_rates(
+                float(self.high[start_idx:end_idx].max()), float(self.low[start_idx:end_idx].min())
+            )
+
+    def next_exit_candidate(
+        self,
+        trade: LocalTrade,
+        step: int,
+        start_ts: int,
+        timeframe_secs: int,
+        roi_keys: np.ndarray,
+        roi_values: np.ndarray,
+        use_exit_signal: bool,
+    ) -> int | None:
+        """
+        Find the first step >= ``step`` on which the trade may exit.
+        The result is a superset of the real exit condition - the regular backtesting logic
+        decides if the trade exits on that candle.
+        :param start_ts: timestamp (seconds) of backtest step 0.
+        :param roi_keys: sorted minimal_roi keys (minutes)
+        :param roi_values: running minimum of the minimal_roi values, matching roi_keys
+        :return: step, or None if the trade can't exit until the end of the data.
+        """
+        first = step - self.offset
+        if first >= len(self.rows):
+            return None
+        found = len(self.rows)
+        if use_exit_signal:
+            pos = np.searchsorted(self.exit_idx, first)
+            if pos < len(self.exit_idx):
+                found = int(self.exit_idx[pos])
+
+        open_ts = trade.open_date_utc.timestamp()
+        fee = max(abs(trade.fee_open or 0.0), abs(trade.fee_close or 0.0))
+        # Upper bound of the profit ratio for a given rate
+        profit_factor = (1 + fee) / (1 - fee) * (1 + _TOLERANCE) / trade.open_rate
+        stop_loss = trade.stop_loss * (1 + _TOLERANCE)
+
+        window = _SEARCH_WINDOW
+        start = first
+        while start < found:
+            end = min(start + window, found)
+            candidate = self.low[start:end] <= stop_loss
+            if len(roi_keys):
+                idx = np.arange(start, end)
+                # Backtest time of each candle (candle open + 1 timeframe)
+                trade_dur = (start_ts + (idx + self.offset) * timeframe_secs - open_ts) // 60
+                roi_pos = np.searchsorted(roi_keys, trade_dur, side="right") - 1
+                roi = np.where(roi_pos >= 0, roi_values[np.maximum(roi_pos, 0)], np.inf)
+                candidate |= self.high[start:end] * profit_factor - 1 >= roi - _TOLERANCE
+            hits = np.flatnonzero(candidate)
+            if len(hits):
+                return int(start + hits[0]) + self.offset
+            start = end
+            window *= 4
+        return found + self.offset if found < len(self.rows) else None
+
+
+def build_fast_path_pairs(
+    data: dict[str, DataFrame],
+    headers: list[str],
+    start_date: datetime,
+    timeframe_secs: int,
+    can_short: bool,
+) -> dict[str, FastPathPair] | None:
+    """
+    Convert the analyzed dataframes to their columnar representation.
+    :return: dict of FastPathPair objects, or None if the data has gaps and can't be used.
+    """
+    result: dict[str, FastPathPair] = {}
+    start_ts = int(start_date.timestamp())
+    for pair, df in data.items():
+        if df.empty:
+            continue
+        dates = df["date"].to_numpy(dtype="datetime64[s]").astype(np.int64)
+        if len(dates) > 1 and not (np.diff(dates) == timeframe_secs).all():
+            logger.info(f"Data for {pair} is not contiguous.")
+            return None
+        delta = dates[0] - start_ts
+        if delta % timeframe_secs != 0:
+            logger.info(f"Data for {pair} is not aligned to the backtest start date.")
+            return None
+        # The first row is processed once the backtest time reaches its candle date.
+        # Steps start at start_date + 1 timeframe.
+        offset = max(int(delta // timeframe_secs) - 1, 0)
+        result[pair] = FastPathPair(pair, df[headers].to_numpy(), df, offset, can_short)
+    return result
+
+
+def merge_entry_steps(data: list[FastPathPair]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merge the entry steps of all pairs into one step-ordered array.
+    :return: tuple of (steps, pair index) arrays, sorted by step and pair index.
+    """
+    steps = np.concatenate([np.array([], dtype=np.int64)] + [p.entry_steps for p in data])
+    pair_idx = np.concatenate(
+        [np.array([], dtype=np.int64)]
+        + [np.full(len(p.entry_steps), idx, dtype=np.int64) for idx, p in enumerate(data)]
+    )
+    sort_idx = np.argsort(steps, kind="stable")
+    return steps[sort_idx], pair_idx[sort_idx]
+
+
+def roi_table(minimal_roi: dict[int, float]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Prepare the minimal_roi table for vectorized lookups.
+    Values are replaced with the running minimum, so every lookup returns the lowest ROI
+    that could be active for that trade duration.
+    """
+    keys = np.array(sorted(minimal_roi.keys()), dtype=np.float64)
+    values = np.minimum.accumulate(
+        np.array([minimal_roi[k] for k in sorted(minimal_roi.keys())], dtype=np.float64)
+    )
+    return keys, values
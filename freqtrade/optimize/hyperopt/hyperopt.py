@@ -7,6 +7,7 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+import shutil
 from datetime import datetime
 from math import ceil
 from multiprocessing import Manager
@@ -14,7 +15,9 @@ from pathlib import Path
 from typing import Any
 
 import rapidjson
-from joblib import Parallel, cpu_count
+from joblib import Parallel, cpu_count, effective_n_jobs
+from joblib.externals import cloudpickle
+from joblib.externals.loky import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from optuna.trial import FrozenTrial, Trial, TrialState
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
@@ -37,6 +40,19 @@ logger = logging.getLogger(__name__)
 
 log_queue: Any
 
+# Optimizer of a persistent worker process - initialized once per worker.
+_worker_hyperopter: HyperOptimizer
+
+
+def _init_persistent_worker(hyperopter: bytes, queue: Any, log_level: int) -> None:
+    global _worker_hyperopter
+    logging_mp_setup(queue, log_level)
+    _worker_hyperopter = cloudpickle.loads(hyperopter)
+
+
+def _run_persistent_worker(params_dict: dict[str, Any]) -> dict[str, Any]:
+    return _worker_hyperopter.generate_optimizer(params_dict)
+
 
 class Hyperopt:
     """
@@ -69,7 +85,7 @@ class Hyperopt:
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
         self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         )
         self.total_epochs = config.get("epochs", 0)
 
@@ -85,6 +101,7 @@ class Hyperopt:
             self.config["use_exit_signal"] = True
 
         self.print_all = self.config.get("print_all", False)
+        self.persistent_workers = self.config.get("hyperopt_persistent_workers", False)
         self.hyperopt_table_header = 0
         self.print_json = self.config.get("print_json", False)
 
@@ -97,13 +114,15 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt pickle files and the candle data store to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
-            p = Path(f)
-            if p.is_file():
-                logger.info(f"Removing `{p}`.")
-                p.unlink()
+        if self.data_pickle_file.is_dir():
+            logger.info(f"Removing `{self.data_pickle_file}`.")
+            shutil.rmtree(self.data_pickle_file)
+        p = Path(self.results_file)
+        if p.is_file():
+            logger.info(f"Removing `{p}`.")
+            p.unlink()
 
     def _save_result(self, epoch: dict) -> None:
         """
@@ -245,6 +264,56 @@ class Hyperopt:
         m = Manager()
         log_queue = m.Queue()
 
+    def run_optimizer_persistent(self, config_jobs: int, pbar, task, start: int) -> None:
+        """
+        Run the optimizer using a persistent worker pool.
+        Every worker receives the optimizer once, and afterwards only the parameters per epoch.
+        New points are asked as soon as a worker becomes idle, so workers don't have to wait
+        for the slowest epoch of a batch.
+        """
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of persistent workers used: {jobs}")
+        log_level = logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG
+        early_stop = self.hyperopter.es_epochs > 0
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_persistent_worker,
+            initargs=(cloudpickle.dumps(self.hyperopter), log_queue, log_level),
+        ) as executor:
+            pending: dict[Future, tuple[FrozenTrial, bool]] = {}
+            current = start
+            submitted = start
+            while pending or submitted < self.total_epochs:
+                n_points = min(jobs - len(pending), self.total_epochs - submitted)
+                if n_points > 0:
+                    asked, is_random = self.get_asked_points(
+                        n_points=n_points, dimensions=self.hyperopter.o_dimensions
+                    )
+                    for o_ask, random_point in zip(asked, is_random, strict=True):
+                        future = executor.submit(_run_persistent_worker, o_ask.params)
+                        pending[future] = (o_ask, random_point)
+                    submitted += n_points
+                    if not pending:
+                        continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    o_ask, random_point = pending.pop(future)
+                    val = future.result()
+                    self.opt.tell(o_ask, val["loss"])
+                    # Use human-friendly indexes here (starting from 1)
+                    current += 1
+                    self.evaluate_result(val, current, random_point)
+                    pbar.update(task, advance=1)
+                logging_mp_handle(log_queue)
+
+                if early_stop and self.hyperopter.es_terminator.should_terminate(self.opt):
+                    logger.info(f"Early stopping after {current} epochs")
+                    for future in pending:
+                        future.cancel()
+                    break
+
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get("hyperopt_random_state"))
         logger.info(f"Using optimizer random state: {self.random_state}")
@@ -259,63 +328,65 @@ class Hyperopt:
         self.opt = self.hyperopter.get_optimizer(self.random_state)
         self._setup_logging_mp_workaround()
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-
-                # Define progressbar
-                with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(
-                            n_points=1, dimensions=self.hyperopter.o_dimensions
-                        )
-                        f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
-                        self.opt.tell(asked[0], [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
-                        )
-
-                        f_val = self.run_optimizer_parallel(
-                            parallel,
-                            [asked1.params for asked1 in asked],
-                        )
-
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        logging_mp_handle(log_queue)
-                        gc.collect()
-
-                        if (
-                            self.hyperopter.es_epochs > 0
-                            and self.hyperopter.es_terminator.should_terminate(self.opt)
-                        ):
-                            logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
-                            break
+            # Define progressbar
+            with get_progress_tracker(cust_callables=[self._hyper_out]) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(
+                        n_points=1, dimensions=self.hyperopter.o_dimensions
+                    )
+                    f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
+                    self.opt.tell(asked[0], [f_val0["loss"]])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(task, advance=1)
+                    start += 1
+
+                if self.persistent_workers:
+                    self.run_optimizer_persistent(config_jobs, pbar, task, start)
+                else:
+                    with Parallel(n_jobs=config_jobs) as parallel:
+                        jobs = parallel._effective_n_jobs()
+                        logger.info(f"Effective number of parallel workers used: {jobs}")
+                        evals = ceil((self.total_epochs - start) / jobs)
+                        for i in range(evals):
+                            # Correct the number of epochs to be processed for the last
+                            # iteration (should not exceed self.total_epochs in total)
+                            n_rest = (i + 1) * jobs - (self.total_epochs - start)
+                            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                            asked, is_random = self.get_asked_points(
+                                n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+                            )
+
+                            f_val = self.run_optimizer_parallel(
+                                parallel,
+                                [asked1.params for asked1 in asked],
+                            )
+
+                            f_val_loss = [v["loss"] for v in f_val]
+                            for o_ask, v in zip(asked, f_val_loss, strict=False):
+                                self.opt.tell(o_ask, v)
+
+                            for j, val in enumerate(f_val):
+                                # Use human-friendly indexes here (starting from 1)
+                                current = i * jobs + j + 1 + start
+
+                                self.evaluate_result(val, current, is_random[j])
+                                pbar.update(task, advance=1)
+                            logging_mp_handle(log_queue)
+                            gc.collect()
+
+                            if (
+                                self.hyperopter.es_epochs > 0
+                                and self.hyperopter.es_terminator.should_terminate(self.opt)
+                            ):
+                                logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
+                                break
 
         except KeyboardInterrupt:
             print("User interrupted..")
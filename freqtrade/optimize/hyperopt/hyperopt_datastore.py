@@ -0,0 +1,125 @@
+"""
+Columnar, memory-mapped storage for the candle data used by hyperopt workers.
+
+Data is written once by the main process. Workers attach to the stored arrays via
+memory-mapping, so all workers share the same (page-cache backed) memory, and the data
+is only attached once per worker process instead of once per epoch.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load
+from pandas import DataFrame
+
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = "metadata.pkl"
+
+# Data attached in the current (worker) process - keyed by store path.
+_attached_data: dict[Path, tuple[int, dict[str, DataFrame]]] = {}
+
+
+def _column_kind(series: pd.Series) -> str:
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or series.dtype.kind == "M":
+        return "date"
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        return "array"
+    return "object"
+
+
+def store_columnar_data(data: dict[str, DataFrame], path: Path) -> None:
+    """
+    Store dataframes as columnar, memory-mappable arrays.
+    Numeric columns of the same dtype are stored as one 2d array per pair (one row per column),
+    so every column is a contiguous slice of the file.
+    Columns which can't be memory-mapped (strings, categories, ...) are pickled instead.
+    :param data: dict of dataframes, keyed by pair
+    :param path: Directory to store the data in. Will be replaced if it exists.
+    """
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+    metadata: dict[str, dict] = {}
+    for idx, (pair, df) in enumerate(data.items()):
+        columns: list[tuple] = []
+        arrays: dict[str, list[np.ndarray]] = {}
+        objects: dict = {}
+        for col in df.columns:
+            series = df[col]
+            kind = _column_kind(series)
+            if kind == "array":
+                dtype_name = series.dtype.name
+                arrays.setdefault(dtype_name, []).append(series.to_numpy())
+                columns.append((col, kind, dtype_name, len(arrays[dtype_name]) - 1))
+            elif kind == "date":
+                dates = pd.DatetimeIndex(series)
+                arrays.setdefault("date", []).append(dates.as_unit("ns").asi8)
+                columns.append(
+                    (col, kind, str(dates.tz) if dates.tz else None, len(arrays["date"]) - 1)
+                )
+            else:
+                objects[col] = series
+                columns.append((col, kind, None, None))
+
+        for dtype_name, values in arrays.items():
+            np.save(path / f"{idx}_{dtype_name}.npy", np.stack(values))
+        if objects:
+            dump(objects, path / f"{idx}_objects.pkl")
+        metadata[pair] = {"idx": idx, "columns": columns}
+
+    # Metadata is written last - it marks the store as complete.
+    dump(metadata, path / METADATA_FILE)
+
+
+def _attach_pair(path: Path, idx: int, columns: list[tuple]) -> DataFrame:
+    arrays: dict[str, np.ndarray] = {}
+    objects: dict = {}
+    parts: list[pd.Series] = []
+    for col, kind, detail, row in columns:
+        if kind == "array":
+            if detail not in arrays:
+                arrays[detail] = np.load(path / f"{idx}_{detail}.npy", mmap_mode="r")
+            parts.append(pd.Series(np.asarray(arrays[detail][row]), name=col, copy=False))
+        elif kind == "date":
+            if "date" not in arrays:
+                arrays["date"] = np.load(path / f"{idx}_date.npy", mmap_mode="r")
+            dates = pd.DatetimeIndex(arrays["date"][row].view("M8[ns]"))
+            if detail:
+                # Stored values are UTC epoch values, independent of the timezone.
+                dates = dates.tz_localize("UTC").tz_convert(detail)
+            parts.append(pd.Series(dates, name=col))
+        else:
+            if not objects:
+                objects = load(path / f"{idx}_objects.pkl")
+            parts.append(objects[col].reset_index(drop=True))
+    if not parts:
+        return DataFrame()
+    return pd.concat(parts, axis=1, copy=False)
+
+
+def load_columnar_data(path: Path) -> dict[str, DataFrame]:
+    """
+    Attach to data stored via `store_columnar_data()`.
+    Numeric columns are memory-mapped (read-only) without copying.
+    Data is attached once per process and reused for subsequent calls, as long as the store
+    has not been rewritten.
+    :param path: Directory containing the data.
+    :return: dict of dataframes, keyed by pair. Dataframes are shallow copies, so columns can be
+        added without affecting other callers.
+    """
+    token = (path / METADATA_FILE).stat().st_mtime_ns
+    cached = _attached_data.get(path)
+    if cached is None or cached[0] != token:
+        metadata = load(path / METADATA_FILE)
+        data = {
+            pair: _attach_pair(path, meta["idx"], meta["columns"])
+            for pair, meta in metadata.items()
+        }
+        cached = _attached_data[path] = (token, data)
+    return {pair: df.copy(deep=False) for pair, df in cached[1].items()}
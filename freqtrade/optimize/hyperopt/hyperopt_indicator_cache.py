@@ -0,0 +1,138 @@
+"""
+Indicator cache for hyperopt runs using --analyze-per-epoch.
+
+populate_indicators() usually only depends on a few of the strategy's hyperoptable parameters.
+This module records which parameters are read while indicators are calculated for a pair,
+and memoizes the resulting dataframe for these parameter values.
+Epochs which only change other parameters (sell space, roi, stoploss, ...) can then reuse the
+cached indicators instead of recalculating them.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from pandas import DataFrame
+
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+# Memory budget of the cache (per process).
+DEFAULT_MEMORY_BUDGET = 512 * 1024 * 1024
+
+# Parameter reads recorded while indicators are calculated. None if not recording.
+_recorded_reads: dict[str, Any] | None = None
+# Tracking subclasses of the parameter classes in use.
+_tracking_classes: dict[type, type] = {}
+
+
+def _tracking_class(cls: type) -> type:
+    """
+    Create (or reuse) a subclass of the given parameter class, which records reads of `.value`.
+    """
+    if cls not in _tracking_classes:
+
+        def get_value(self):
+            value = self.__dict__["value"]
+            if _recorded_reads is not None:
+                _recorded_reads.setdefault(self.name, value)
+            return value
+
+        def set_value(self, value):
+            self.__dict__["value"] = value
+
+        _tracking_classes[cls] = type(
+            cls.__name__,
+            (cls,),
+            {"value": property(get_value, set_value), "__module__": cls.__module__},
+        )
+    return _tracking_classes[cls]
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator dataframes, keyed by pair and the values of the parameters
+    the calculation depended on.
+    """
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> None:
+        self.memory_budget = memory_budget
+        self.memory_usage = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[DataFrame, int]] = OrderedDict()
+        # Parameter names each cached calculation depended on, per pair and data.
+        self._dependencies: dict[tuple, list[tuple[str, ...]]] = {}
+
+    @staticmethod
+    def _data_key(pair: str, dataframe: DataFrame) -> tuple:
+        if dataframe.empty:
+            return (pair, 0)
+        return (pair, len(dataframe), dataframe["date"].iloc[0], dataframe["date"].iloc[-1])
+
+    def _lookup(self, data_key: tuple, strategy: IStrategy) -> DataFrame | None:
+        values = {name: param.value for name, param in strategy.enumerate_parameters()}
+        for names in self._dependencies.get(data_key, []):
+            entry_key = (data_key, names, tuple(values[n] for n in names))
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+                return self._entries[entry_key][0]
+        return None
+
+    def _store(self, data_key: tuple, reads: dict[str, Any], dataframe: DataFrame) -> None:
+        names = tuple(sorted(reads))
+        entry_key = (data_key, names, tuple(reads[n] for n in names))
+        try:
+            hash(entry_key)
+        except TypeError:
+            # Unhashable parameter values - can't cache this calculation.
+            return
+        size = int(dataframe.memory_usage(index=True, deep=False).sum())
+        if size > self.memory_budget:
+            return
+        dependencies = self._dependencies.setdefault(data_key, [])
+        if names not in dependencies:
+            dependencies.append(names)
+        self._entries[entry_key] = (dataframe, size)
+        self.memory_usage += size
+        while self.memory_usage > self.memory_budget:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.memory_usage -= evicted_size
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Cached version of strategy.advise_all_indicators().
+        :param strategy: Strategy, with the parameter values of the current epoch assigned.
+        :param data: dict of (non-analyzed) dataframes, keyed by pair.
+        :return: dict of dataframes with indicators, keyed by pair.
+        """
+        global _recorded_reads
+        res = {}
+        for pair, pair_data in data.items():
+            data_key = self._data_key(pair, pair_data)
+            cached = self._lookup(data_key, strategy)
+            if cached is not None:
+                self.hits += 1
+                res[pair] = cached.copy()
+                continue
+
+            self.misses += 1
+            params = [param for _, param in strategy.enumerate_parameters()]
+            original_classes = [type(param) for param in params]
+            for param in params:
+                param.__class__ = _tracking_class(type(param))
+            _recorded_reads = {}
+            try:
+                res[pair] = strategy.advise_all_indicators({pair: pair_data})[pair]
+                reads = _recorded_reads
+            finally:
+                _recorded_reads = None
+                for param, cls in zip(params, original_classes, strict=True):
+                    param.__class__ = cls
+            self._store(data_key, reads, res[pair].copy())
+        logger.debug(f"Indicator cache: {self.hits} hits, {self.misses} misses.")
+        return res
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Any
 
 import optuna
-from joblib import delayed, dump, load, wrap_non_picklable_objects
+from joblib import delayed, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
 from optuna.exceptions import ExperimentalWarning
 from optuna.terminator import BestValueStagnationEvaluator, Terminator
@@ -29,6 +29,11 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_datastore import (
+    load_columnar_data,
+    store_columnar_data,
+)
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import IndicatorCache
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -49,6 +54,9 @@ INITIAL_POINTS = 30
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Indicators calculated with --analyze-per-epoch - kept per (worker) process.
+_indicator_cache = IndicatorCache()
+
 optuna_samplers_dict = {
     "TPESampler": optuna.samplers.TPESampler,
     "GPSampler": optuna.samplers.GPSampler,
@@ -321,8 +329,8 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        # Attached once per worker process, shared between all epochs.
+        processed = load_columnar_data(self.data_pickle_file)
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
             processed = self.advise_and_trim(processed)
@@ -448,7 +456,10 @@ class HyperOptimizer:
         return optuna.create_study(sampler=sampler, direction="minimize")
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        if self.analyze_per_epoch:
+            preprocessed = _indicator_cache.advise_all_indicators(self.backtesting.strategy, data)
+        else:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -478,6 +489,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            store_columnar_data(preprocessed, self.data_pickle_file)
         else:
-            dump(data, self.data_pickle_file)
+            store_columnar_data(data, self.data_pickle_file)
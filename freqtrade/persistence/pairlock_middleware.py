@@ -1,6 +1,8 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime
+from heapq import heappop, heappush
+from itertools import count
 
 from sqlalchemy import select
 
@@ -11,6 +13,82 @@ from freqtrade.persistence.models import PairLock
 logger = logging.getLogger(__name__)
 
 
+class PairLockIndex:
+    """
+    In-memory lock store for backtesting (PairLocks.use_db = False).
+    Locks are indexed by pair and side, in heaps ordered by lock end time.
+    Expired and released locks are removed from the heaps once they reach the top,
+    so lookups only look at locks which are still active.
+    Removing locks assumes time moves forward - queries for an earlier time than
+    a previous query of the same pair fall back to scanning all locks.
+    """
+
+    def __init__(self, locks: list[PairLock]) -> None:
+        """
+        :param locks: List of all locks, in the order they were created.
+            New locks are appended to this list.
+        """
+        self.locks = locks
+        self._heaps: dict[str, dict[str, list[tuple[datetime, int, PairLock]]]] = {}
+        # Latest time the heaps of a pair were cleaned up for
+        self._cleaned_until: dict[str, datetime] = {}
+        self._seq = count()
+        # Number of indexed locks
+        self.size = 0
+        for lock in locks:
+            self._push(lock)
+
+    def add(self, lock: PairLock) -> None:
+        self.locks.append(lock)
+        self._push(lock)
+
+    def _push(self, lock: PairLock) -> None:
+        seq = next(self._seq)
+        self.size += 1
+        heappush(
+            self._heaps.setdefault(lock.pair, {}).setdefault(lock.side, []),
+            (lock.lock_end_time, seq, lock),
+        )
+
+    def _scan(self, pair: str | None, now: datetime, side: str | None) -> list[PairLock]:
+        return [
+            lock
+            for lock in self.locks
+            if (
+                lock.lock_end_time >= now
+                and lock.active is True
+                and (pair is None or lock.pair == pair)
+                and (side is None or lock.side == "*" or lock.side == side)
+            )
+        ]
+
+    def get_locks(self, pair: str | None, now: datetime, side: str | None) -> list[PairLock]:
+        """
+        Get all active locks for this pair (all pairs if pair is None), in creation order
+        """
+        cleaned_until = self._cleaned_until.get(pair) if pair is not None else None
+        if pair is None or (cleaned_until is not None and now < cleaned_until):
+            return self._scan(pair, now, side)
+        self._cleaned_until[pair] = now
+
+        side_heaps = self._heaps.get(pair, {})
+        if side is None:
+            sides: Iterable[str] = side_heaps.keys()
+        else:
+            sides = ("*",) if side == "*" else ("*", side)
+        locks: list[tuple[int, PairLock]] = []
+        for lock_side in sides:
+            heap = side_heaps.get(lock_side)
+            if not heap:
+                continue
+            while heap and (heap[0][0] < now or heap[0][2].active is not True):
+                heappop(heap)
+            locks.extend((seq, lock) for _, seq, lock in heap if lock.active is True)
+        if len(locks) > 1:
+            locks.sort(key=lambda x: x[0])
+        return [lock for _, lock in locks]
+
+
 class PairLocks:
     """
     Pairlocks middleware class
@@ -20,6 +98,7 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    _index = PairLockIndex([])
 
     timeframe: str = ""
 
@@ -62,9 +141,19 @@ class PairLocks:
             PairLock.session.add(lock)
             PairLock.session.commit()
         else:
-            PairLocks.locks.append(lock)
+            PairLocks._lock_index().add(lock)
         return lock
 
+    @staticmethod
+    def _lock_index() -> PairLockIndex:
+        """
+        Index of PairLocks.locks - rebuilt if the list was replaced or modified directly.
+        """
+        index = PairLocks._index
+        if index.locks is not PairLocks.locks or len(PairLocks.locks) != index.size:
+            index = PairLocks._index = PairLockIndex(PairLocks.locks)
+        return index
+
     @staticmethod
     def get_pair_locks(
         pair: str | None, now: datetime | None = None, side: str | None = None
@@ -82,17 +171,7 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
-            locks = [
-                lock
-                for lock in PairLocks.locks
-                if (
-                    lock.lock_end_time >= now
-                    and lock.active is True
-                    and (pair is None or lock.pair == pair)
-                    and (side is None or lock.side == "*" or lock.side == side)
-                )
-            ]
-            return locks
+            return PairLocks._lock_index().get_locks(pair, now, side)
 
     @staticmethod
     def get_pair_longest_lock(
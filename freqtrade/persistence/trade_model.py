@@ -3,8 +3,10 @@ This module contains the class to persist trades into SQLite
 """
 
 import logging
+from bisect import bisect_right
 from collections import defaultdict
 from collections.abc import Sequence
+from copy import copy
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from math import isclose
@@ -186,6 +188,19 @@ class Order(ModelBase):
             / FtPrecise(self.trade.leverage)
         )
 
+    def copy_bt(self, trade: "LocalTrade") -> "Order":
+        """
+        Copy of this backtesting order, belonging to trade.
+        Order attributes are immutable values, so copying the attribute dict
+        is equivalent to a deepcopy - without copying the sqlalchemy instance state.
+        """
+        order = Order.__mapper__.class_manager.new_instance()
+        order.__dict__.update(
+            (key, value) for key, value in self.__dict__.items() if key != "_sa_instance_state"
+        )
+        order._trade_bt = trade
+        return order
+
     def __repr__(self):
         return (
             f"Order(id={self.id}, trade={self.ft_trade_id}, order_id={self.order_id}, "
@@ -378,6 +393,60 @@ class Order(ModelBase):
         return Order.session.scalars(select(Order).filter(Order.order_id == order_id)).first()
 
 
+class ClosedTradeIndex:
+    """
+    Closed backtesting trades, ordered by close_date - for all pairs and per pair.
+    Getting the trades closed after a date is a bisect plus a slice.
+    """
+
+    def __init__(self, trades: list["LocalTrade"]) -> None:
+        """
+        :param trades: List of closed trades (LocalTrade.bt_trades).
+            New trades are appended to this list.
+        """
+        self.trades = trades
+        self._dates: list[datetime] = []
+        self._sorted: list[LocalTrade] = []
+        self._dates_pp: dict[str, list[datetime]] = defaultdict(list)
+        self._sorted_pp: dict[str, list[LocalTrade]] = defaultdict(list)
+        # Closed trades without close_date - never match a close_date filter
+        self._undated: list[LocalTrade] = []
+        # Number of indexed trades
+        self.size = 0
+        for trade in trades:
+            self._insert(trade)
+
+    def add(self, trade: "LocalTrade") -> None:
+        self.trades.append(trade)
+        self._insert(trade)
+
+    def _insert(self, trade: "LocalTrade") -> None:
+        self.size += 1
+        if trade.close_date is None:
+            self._undated.append(trade)
+            return
+        for dates, trades in (
+            (self._dates, self._sorted),
+            (self._dates_pp[trade.pair], self._sorted_pp[trade.pair]),
+        ):
+            # Trades close in chronological order during backtesting - so this usually appends
+            idx = bisect_right(dates, trade.close_date)
+            dates.insert(idx, trade.close_date)
+            trades.insert(idx, trade)
+
+    def closed_after(self, close_date: datetime, pair: str | None = None) -> list["LocalTrade"]:
+        """
+        Get trades with trade.close_date > close_date, ordered by close_date.
+        :param pair: Limit to trades of this pair
+        """
+        if pair is None:
+            dates, trades = self._dates, self._sorted
+        else:
+            dates = self._dates_pp.get(pair, [])
+            trades = self._sorted_pp.get(pair, [])
+        return trades[bisect_right(dates, close_date) :]
+
+
 class LocalTrade:
     """
     Trade database model.
@@ -390,6 +459,8 @@ class LocalTrade:
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
+    # Copy of trades - but ordered by close_date
+    bt_trades_closed_index: ClosedTradeIndex = ClosedTradeIndex([])
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
     realized_profit: float = 0
@@ -648,6 +719,16 @@ class LocalTrade:
                 f"{self.trading_mode} trading requires param interest_rate on trades"
             )
 
+    def copy_bt(self) -> Self:
+        """
+        Copy of this backtesting trade and its orders - passed to strategy callbacks,
+        so the strategy can't modify the trade by accident.
+        All other trade attributes are immutable values.
+        """
+        trade = copy(self)
+        trade.orders = [order.copy_bt(trade) for order in self.orders]
+        return trade
+
     def __repr__(self):
         open_since = (
             self.open_date_utc.strftime(DATETIME_PRINT_FORMAT) if self.is_open else "closed"
@@ -767,6 +848,7 @@ class LocalTrade:
         LocalTrade.bt_trades = []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade.bt_trades_closed_index = ClosedTradeIndex(LocalTrade.bt_trades)
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
 
@@ -1452,9 +1534,18 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Protections - only look at trades closed within their lookback period
+            sel_trades = LocalTrade._closed_trade_index().closed_after(close_date, pair or None)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
+                if pair:
+                    sel_trades = LocalTrade.bt_trades_open_pp.get(pair, [])
             else:
                 sel_trades = LocalTrade.bt_trades
 
@@ -1473,12 +1564,22 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def _closed_trade_index() -> ClosedTradeIndex:
+        """
+        Index of LocalTrade.bt_trades - rebuilt if the list was replaced or modified directly.
+        """
+        index = LocalTrade.bt_trades_closed_index
+        if index.trades is not LocalTrade.bt_trades or len(LocalTrade.bt_trades) != index.size:
+            index = LocalTrade.bt_trades_closed_index = ClosedTradeIndex(LocalTrade.bt_trades)
+        return index
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
-        LocalTrade.bt_trades.append(trade)
+        LocalTrade._closed_trade_index().add(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1488,7 +1589,7 @@ class LocalTrade:
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
         else:
-            LocalTrade.bt_trades.append(trade)
+            LocalTrade._closed_trade_index().add(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -50,12 +50,17 @@ class MaxDrawdown(IProtection):
 
         trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
 
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
-
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return None
 
+        trades_df = pd.DataFrame(
+            {
+                "close_date": [trade.close_date for trade in trades],
+                "close_profit": [trade.close_profit for trade in trades],
+            }
+        )
+
         # Drawdown is always positive
         try:
             # TODO: This should use absolute profit calculation, considering account balance.
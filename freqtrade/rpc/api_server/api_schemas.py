@@ -643,6 +643,8 @@ class Health(BaseModel):
     bot_start_ts: int | None = None
     bot_startup: datetime | None = None
     bot_startup_ts: int | None = None
+    ohlcv_requests_pending: int | None = None
+    ohlcv_request_concurrency: int | None = None
 
 
 class CustomDataEntry(BaseModel):
@@ -1610,6 +1610,13 @@ class RPC:
             "bot_startup_loc": None,
             "bot_startup_ts": None,
         }
+        ohlcv_stats = self._freqtrade.exchange.ohlcv_request_stats()
+        res.update(
+            {
+                "ohlcv_requests_pending": ohlcv_stats["pending"],
+                "ohlcv_request_concurrency": ohlcv_stats["concurrency"],
+            }
+        )
 
         if last_p is not None:
             res.update(
@@ -5,14 +5,15 @@ This module defines the interface to apply for strategies
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
-from pandas import DataFrame
+from pandas import DataFrame, concat
 from pydantic import ValidationError
 
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
-from freqtrade.data.converter import populate_dataframe_with_trades
+from freqtrade.data.converter import OrderflowCache, populate_dataframe_with_trades
 from freqtrade.data.converter.converter import reduce_dataframe_footprint
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (
@@ -107,6 +108,10 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
 
+    # Only analyze new candles (plus startup_candle_count candles) in dry / live runs.
+    # Requires all indicators and signals to only depend on the last startup_candle_count candles.
+    incremental_analysis: bool = False
+
     use_exit_signal: bool
     exit_profit_only: bool
     exit_profit_offset: float
@@ -146,12 +151,17 @@ class IStrategy(ABC, HyperStrategyMixin):
     market_direction: MarketDirection = MarketDirection.NONE
 
     # Global cache dictionary
-    _cached_grouped_trades_per_pair: dict[str, DataFrame] = {}
+    _cached_grouped_trades_per_pair: dict[str, OrderflowCache | None] = {}
 
     def __init__(self, config: Config) -> None:
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Last analyzed dataframe per pair - only used with incremental_analysis
+        self._analyzed_df_per_pair: dict[str, DataFrame] = {}
+        # Analyzed dataframes not yet stored in the dataprovider - used for parallel analysis
+        self._pending_analyzed_dfs: dict[str, tuple[DataFrame, bool]] | None = None
+        self._analyze_executor: ThreadPoolExecutor | None = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -221,7 +231,12 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         Clean up FreqAI and child threads
         """
-        self.freqai.shutdown()
+        try:
+            if self._analyze_executor is not None:
+                self._analyze_executor.shutdown(wait=True)
+                self._analyze_executor = None
+        finally:
+            self.freqai.shutdown()
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -1197,6 +1212,58 @@ class IStrategy(ABC, HyperStrategyMixin):
         logger.debug("TA Analysis Ended")
         return dataframe
 
+    def _get_incremental_candle_count(self, pair: str, dataframe: DataFrame) -> int | None:
+        """
+        Determine how many candles were added since the last analysis of this pair.
+        :return: Number of new candles, or None if the previous analysis can't be extended.
+        """
+        previous = self._analyzed_df_per_pair.get(pair)
+        if previous is None or previous.empty or self.startup_candle_count <= 0:
+            return None
+        positions = (dataframe["date"] == previous["date"].iloc[-1]).to_numpy().nonzero()[0]
+        if len(positions) != 1:
+            return None
+        pos = int(positions[0])
+        new_candles = len(dataframe) - pos - 1
+        if (
+            new_candles < 1
+            or new_candles + self.startup_candle_count > len(dataframe)
+            or len(previous) < pos + 1
+            or previous["date"].iloc[-(pos + 1)] != dataframe["date"].iloc[0]
+        ):
+            return None
+        # Candles which were already analyzed must not have changed.
+        ohlcv = ["open", "high", "low", "close", "volume"]
+        if previous[ohlcv].iloc[-1].tolist() != dataframe[ohlcv].iloc[pos].tolist():
+            return None
+        return new_candles
+
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze only the candles added since the last analysis (plus `startup_candle_count`
+        candles to warm up indicators) and append them to the previously analyzed dataframe.
+        Falls back to a full analysis if the previous result can't be extended.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        pair = str(metadata.get("pair"))
+        new_candles = self._get_incremental_candle_count(pair, dataframe)
+        result = None
+        if new_candles is not None:
+            previous = self._analyzed_df_per_pair[pair]
+            window = dataframe.iloc[-(new_candles + self.startup_candle_count) :]
+            analyzed = self.analyze_ticker(window.reset_index(drop=True), metadata)
+            kept = previous.iloc[len(previous) - (len(dataframe) - new_candles) :]
+            if list(analyzed.columns) == list(kept.columns):
+                result = concat([kept, analyzed.iloc[-new_candles:]], ignore_index=True)
+            else:
+                logger.debug(f"Columns changed for {pair}, running full analysis.")
+        if result is None:
+            result = self.analyze_ticker(dataframe, metadata)
+        self._analyzed_df_per_pair[pair] = result
+        return result
+
     def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
@@ -1213,13 +1280,18 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            if self.incremental_analysis and self.process_only_new_candles:
+                dataframe = self._analyze_ticker_incremental(dataframe, metadata)
+            else:
+                dataframe = self.analyze_ticker(dataframe, metadata)
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
 
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            if self._pending_analyzed_dfs is not None:
+                # Parallel analysis - stored once all pairs are analyzed.
+                self._pending_analyzed_dfs[pair] = (dataframe, new_candle)
+            else:
+                self._store_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1261,13 +1333,41 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    def _store_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `internals.analyze_threads` > 1, pairs are analyzed concurrently. Results are
+        stored in the dataprovider in the order of `pairs` once all pairs have been analyzed.
         :param pairs: List of pairs to analyze
         """
+        threads = self.config.get("internals", {}).get("analyze_threads", 1)
+        if threads <= 1 or len(pairs) <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        if self._analyze_executor is None:
+            self._analyze_executor = ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix="ft_analyze"
+            )
+        pending: dict[str, tuple[DataFrame, bool]] = {}
+        self._pending_analyzed_dfs = pending
+        try:
+            futures = [self._analyze_executor.submit(self.analyze_pair, pair) for pair in pairs]
+            wait(futures)
+        finally:
+            self._pending_analyzed_dfs = None
         for pair in pairs:
-            self.analyze_pair(pair)
+            if pair in pending:
+                self._store_analyzed_df(pair, *pending[pair])
+        for future in futures:
+            # Raise exceptions from analyze_pair
+            future.result()
 
     def get_latest_candle(
         self,
@@ -1770,14 +1870,10 @@ class IStrategy(ABC, HyperStrategyMixin):
             trades = self.dp.trades(pair=pair, copy=False)
 
             # TODO: slice trades to size of dataframe for faster backtesting
-            cached_grouped_trades: DataFrame | None = self._cached_grouped_trades_per_pair.get(pair)
+            cached_grouped_trades = self._cached_grouped_trades_per_pair.get(pair)
             dataframe, cached_grouped_trades = populate_dataframe_with_trades(
                 cached_grouped_trades, self.config, dataframe, trades
             )
-
-            # dereference old cache
-            if pair in self._cached_grouped_trades_per_pair:
-                del self._cached_grouped_trades_per_pair[pair]
             self._cached_grouped_trades_per_pair[pair] = cached_grouped_trades
 
             logger.debug("Populated dataframe with trades.")
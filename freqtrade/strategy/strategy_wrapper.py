@@ -5,6 +5,7 @@ from functools import wraps
 from typing import Any, TypeVar, cast
 
 from freqtrade.exceptions import StrategyError
+from freqtrade.persistence import LocalTrade
 
 
 logger = logging.getLogger(__name__)
@@ -27,7 +28,12 @@ def strategy_safe_wrapper(f: F, message: str = "", default_retval=None, supress_
                 # Don't deep-copy if the function is not implemented in the user strategy.``
                 if "trade" in kwargs:
                     # Protect accidental modifications from within the strategy
-                    kwargs["trade"] = deepcopy(kwargs["trade"])
+                    trade = kwargs["trade"]
+                    if type(trade) is LocalTrade:
+                        # Backtesting - cheaper than a deepcopy
+                        kwargs["trade"] = trade.copy_bt()
+                    else:
+                        kwargs["trade"] = deepcopy(trade)
             return f(*args, **kwargs)
         except ValueError as error:
             logger.warning(f"{message}Strategy caused the following exception: {error}{f}")
@@ -33,6 +33,22 @@ class PositionWallet(NamedTuple):
     side: str = "long"
 
 
+class _TradeBalance(NamedTuple):
+    """
+    Wallet relevant values of one open trade - see Wallets._trade_balance()
+    """
+
+    # Trade state the balance was calculated for - see Wallets._trade_key()
+    key: tuple
+    realized_profit: float
+    stake_amount: float
+    # Stake in open entry orders (spot)
+    used_stake: float
+    # Base currency wallet (spot) / position (futures)
+    wallet: Wallet | None
+    position: PositionWallet | None
+
+
 class Wallets:
     def __init__(self, config: Config, exchange: Exchange, is_backtest: bool = False) -> None:
         self._config = config
@@ -49,6 +65,13 @@ class Wallets:
         else:
             self._start_cap = _start_cap
 
+        # Backtesting: balances of open trades by trade id - see update_trade()
+        self._bt_balances: dict[int, _TradeBalance] = {}
+        # Debug mode - compare update_trade() results with a full update
+        self._bt_check_wallets = bool(
+            config.get("internals", {}).get("backtest_wallet_check", False)
+        )
+
         self._last_wallet_refresh: datetime | None = None
         self.update()
 
@@ -96,6 +119,61 @@ class Wallets:
             return pos.position
         return 0
 
+    def _trade_balance(self, trade: LocalTrade) -> _TradeBalance:
+        """
+        Wallet relevant values of one open trade
+        """
+        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+            curr = self._exchange.get_pair_base_currency(trade.pair)
+            open_orders = trade.open_orders
+            used_stake = sum(
+                o.stake_amount for o in open_orders if o.ft_order_side == trade.entry_side
+            )
+            pending = sum(
+                o.amount for o in open_orders if o.amount and o.ft_order_side == trade.exit_side
+            )
+            curr_wallet_bal = self._start_cap.get(curr, 0)
+            wallet = Wallet(
+                curr,
+                curr_wallet_bal + trade.amount - pending,
+                pending,
+                trade.amount + curr_wallet_bal,
+            )
+            return _TradeBalance(
+                self._trade_key(trade),
+                trade.realized_profit,
+                trade.stake_amount,
+                used_stake,
+                wallet,
+                None,
+            )
+        position = PositionWallet(
+            trade.pair,
+            position=trade.amount,
+            leverage=trade.leverage,
+            collateral=trade.stake_amount,
+            side=trade.trade_direction,
+        )
+        return _TradeBalance(
+            self._trade_key(trade), trade.realized_profit, trade.stake_amount, 0.0, None, position
+        )
+
+    @staticmethod
+    def _trade_key(trade: LocalTrade) -> tuple:
+        """
+        Values the balance of a trade depends on.
+        Open orders are covered by the number of orders and the last order - as orders are only
+        added or removed, and order fills update the trade amount.
+        """
+        orders = trade.orders
+        return (
+            trade.amount,
+            trade.stake_amount,
+            trade.realized_profit,
+            len(orders),
+            orders[-1] if orders else None,
+        )
+
     def _update_dry(self) -> None:
         """
         Update from database in dry-run mode
@@ -103,9 +181,6 @@ class Wallets:
         - Subtract currently tied up stake_amount in open trades
         - update balances for currencies currently in trades
         """
-        # Recreate _wallets to reset closed trade balances
-        _wallets = {}
-        _positions = {}
         open_trades = Trade.get_trades_proxy(is_open=True)
         if not self._is_backtest:
             # Live / Dry-run mode
@@ -113,38 +188,35 @@ class Wallets:
         else:
             # Backtest mode
             tot_profit = LocalTrade.bt_total_profit
-        tot_profit += sum(trade.realized_profit for trade in open_trades)
-        tot_in_trades = sum(trade.stake_amount for trade in open_trades)
+        balances = [self._trade_balance(trade) for trade in open_trades]
+        if self._is_backtest:
+            self._bt_balances = {
+                trade.id: balance for trade, balance in zip(open_trades, balances, strict=True)
+            }
+        self._apply_balances(tot_profit, balances)
+
+    def _apply_balances(self, tot_profit: float, balances: list[_TradeBalance]) -> None:
+        """
+        Recreate _wallets and _positions from the balances of all open trades
+        :param tot_profit: Profit of closed trades
+        :param balances: Balances of the open trades, in the order of the trades
+        """
+        # Recreate _wallets to reset closed trade balances
+        _wallets = {}
+        _positions = {}
+        tot_profit += sum(balance.realized_profit for balance in balances)
+        tot_in_trades = sum(balance.stake_amount for balance in balances)
         used_stake = 0.0
 
         if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
-            for trade in open_trades:
-                curr = self._exchange.get_pair_base_currency(trade.pair)
-                used_stake += sum(
-                    o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
-                )
-                pending = sum(
-                    o.amount
-                    for o in trade.open_orders
-                    if o.amount and o.ft_order_side == trade.exit_side
-                )
-                curr_wallet_bal = self._start_cap.get(curr, 0)
-
-                _wallets[curr] = Wallet(
-                    curr,
-                    curr_wallet_bal + trade.amount - pending,
-                    pending,
-                    trade.amount + curr_wallet_bal,
-                )
+            for balance in balances:
+                used_stake += balance.used_stake
+                if balance.wallet:
+                    _wallets[balance.wallet.currency] = balance.wallet
         else:
-            for position in open_trades:
-                _positions[position.pair] = PositionWallet(
-                    position.pair,
-                    position=position.amount,
-                    leverage=position.leverage,
-                    collateral=position.stake_amount,
-                    side=position.trade_direction,
-                )
+            for balance in balances:
+                if balance.position:
+                    _positions[balance.position.symbol] = balance.position
 
             used_stake = tot_in_trades
 
@@ -176,6 +248,40 @@ class Wallets:
         self._wallets = _wallets
         self._positions = _positions
 
+    def update_trade(self, trade: LocalTrade) -> None:
+        """
+        Update wallets after a change of one trade (entry, order fill, exit or removal).
+        In backtesting, the balance of this trade is recalculated - the balances of all other
+        open trades are reused from previous updates, unless their state changed.
+        Falls back to a full update outside of backtesting.
+        """
+        if not self._is_backtest:
+            self.update()
+            return
+        self._bt_balances[trade.id] = self._trade_balance(trade)
+        open_trades = LocalTrade.bt_trades_open
+        balances = []
+        for open_trade in open_trades:
+            balance = self._bt_balances.get(open_trade.id)
+            if balance is None or balance.key != self._trade_key(open_trade):
+                balance = self._bt_balances[open_trade.id] = self._trade_balance(open_trade)
+            balances.append(balance)
+        if len(self._bt_balances) != len(balances):
+            # Drop closed or removed trades
+            self._bt_balances = {
+                t.id: balance for t, balance in zip(open_trades, balances, strict=True)
+            }
+        self._apply_balances(LocalTrade.bt_total_profit, balances)
+
+        if self._bt_check_wallets:
+            wallets, positions = self._wallets, self._positions
+            self._update_dry()
+            if wallets != self._wallets or positions != self._positions:
+                logger.warning(
+                    f"Backtest wallets out of sync after update of {trade}: "
+                    f"{wallets}, {positions} != {self._wallets}, {self._positions}"
+                )
+
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
         _wallets = {}
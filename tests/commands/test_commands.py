@@ -1019,6 +1019,14 @@ def test_start_convert_trades(mocker):
     ]
     start_convert_trades(get_args(args))
     assert convert_mock.call_count == 1
+    assert convert_mock.call_args[1]["timerange"].starttype is None
+
+    convert_mock.reset_mock()
+    start_convert_trades(get_args([*args, "--timerange", "20240101-20240201"]))
+    assert convert_mock.call_count == 1
+    timerange = convert_mock.call_args[1]["timerange"]
+    assert timerange.startts == int(dt_utc(2024, 1, 1).timestamp())
+    assert timerange.stopts == int(dt_utc(2024, 2, 1).timestamp())
 
 
 def test_start_list_strategies(capsys):
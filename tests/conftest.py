@@ -374,7 +374,7 @@ def patch_get_signal(
     # returns (enter, exit)
     freqtrade.strategy.get_exit_signal = patched_get_exit_signal
 
-    freqtrade.exchange.refresh_latest_ohlcv = lambda p: None
+    freqtrade.exchange.refresh_latest_ohlcv = lambda p, **kwargs: None
 
 
 def create_mock_trades(fee, is_short: bool | None = False, use_db: bool = True):
@@ -5,16 +5,20 @@ from shutil import copyfile
 import numpy as np
 import pandas as pd
 import pytest
+from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (
+    clean_ohlcv_dataframe,
     convert_ohlcv_format,
     convert_trades_format,
     convert_trades_to_ohlcv,
+    ohlcv_append_candles,
     ohlcv_fill_up_missing_data,
     ohlcv_to_dataframe,
     reduce_dataframe_footprint,
+    trades_chunks_to_ohlcv,
     trades_df_remove_duplicates,
     trades_dict_to_list,
     trades_to_ohlcv,
@@ -26,8 +30,8 @@ from freqtrade.data.history import (
     load_pair_history,
     validate_backtest_data,
 )
-from freqtrade.data.history.datahandlers import IDataHandler
-from freqtrade.enums import CandleType
+from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from tests.conftest import generate_test_data, generate_trades_history, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -191,6 +195,62 @@ def test_ohlcv_fill_up_missing_data2(caplog):
     )
 
 
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h", "1d", "3d"])
+def test_ohlcv_fill_up_missing_data_gaps(mocker, timeframe):
+    data = generate_test_data(timeframe, 200)
+    resample_mock = mocker.spy(DataFrame, "resample")
+    # Without gaps, no resampling is necessary
+    assert ohlcv_fill_up_missing_data(data, timeframe, "UNITTEST/BTC") is data
+    assert resample_mock.call_count == 0
+
+    data = data.drop(index=[0, 5, 6, 7, 100]).reset_index(drop=True)
+    filled = ohlcv_fill_up_missing_data(data, timeframe, "UNITTEST/BTC")
+    assert resample_mock.call_count == 0
+    assert len(filled) == 199
+
+    # Result must match the resampled result
+    mocker.patch("freqtrade.data.converter.converter._ohlcv_fill_gaps", return_value=None)
+    resampled = ohlcv_fill_up_missing_data(data, timeframe, "UNITTEST/BTC")
+    assert resample_mock.call_count == 1
+    assert_frame_equal(filled, resampled, check_dtype=False)
+
+
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h", "1w", "1M"])
+@pytest.mark.parametrize(
+    "existing,new",
+    [
+        # Update of the last candle, new candles
+        (slice(0, 100), slice(99, 102)),
+        # New candles only
+        (slice(0, 100), slice(100, 120)),
+        # Gap to the existing candles
+        (slice(0, 100), slice(105, 110)),
+        # Large overlap
+        (slice(0, 100), slice(50, 110)),
+        # New candles with gaps
+        (slice(0, 100), [90, 95, 100, 103]),
+        # New candles before existing candles
+        (slice(10, 100), slice(0, 5)),
+    ],
+)
+def test_ohlcv_append_candles(timeframe, existing, new):
+    data = generate_test_data(timeframe, 120)
+    df_existing = data.iloc[existing].reset_index(drop=True)
+    df_new = data.iloc[new].reset_index(drop=True)
+    df_new["high"] = df_new["high"] * 1.01
+    df_new["volume"] = df_new["volume"] / 2
+
+    res = ohlcv_append_candles(df_existing, df_new, timeframe, "UNITTEST/BTC")
+    expected = clean_ohlcv_dataframe(
+        pd.concat([df_existing, df_new]),
+        timeframe,
+        "UNITTEST/BTC",
+        fill_missing=True,
+        drop_incomplete=False,
+    )
+    assert_frame_equal(res, expected)
+
+
 @pytest.mark.parametrize(
     "timeframe",
     ["1s", "1m", "5m", "15m", "1h", "2h", "4h", "8h", "12h", "1d", "7d", "1w", "1M", "3M", "1y"],
@@ -541,6 +601,20 @@ def test_reduce_dataframe_footprint():
     assert df2["close_copy"].dtype == np.float32
 
 
+def test_trades_chunks_to_ohlcv(testdatadir):
+    dh = get_datahandler(testdatadir, "jsongz")
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+    # Chunk boundaries within candles
+    chunks = [trades.iloc[i : i + 333] for i in range(0, len(trades), 333)]
+    res = trades_chunks_to_ohlcv(iter(chunks), ["1m", "5m", "1h"])
+    assert list(res) == ["1m", "5m", "1h"]
+    for timeframe, ohlcv in res.items():
+        assert_frame_equal(ohlcv, trades_to_ohlcv(trades, timeframe), check_freq=False)
+
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        trades_chunks_to_ohlcv(iter([]), ["1m"])
+
+
 def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
     pair = "XRP/ETH"
     file1 = tmp_path / "XRP_ETH-1m.feather"
@@ -554,7 +628,7 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
     dfbak_1m = load_pair_history(datadir=tmp_path, timeframe="1m", pair=pair)
     dfbak_5m = load_pair_history(datadir=tmp_path, timeframe="5m", pair=pair)
 
-    tr = TimeRange.parse_timerange("20191011-20191012")
+    tr = TimeRange.parse_timerange("20191011-20191014")
 
     convert_trades_to_ohlcv(
         [pair],
@@ -588,3 +662,24 @@ def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
         candle_type=CandleType.SPOT,
     )
     assert log_has(msg, caplog)
+
+    # Only trades within the timerange are converted
+    tr = TimeRange.parse_timerange("20191012-20191013")
+    convert_trades_to_ohlcv(
+        [pair],
+        timeframes=["1m", "5m"],
+        data_format_trades="jsongz",
+        datadir=tmp_path,
+        timerange=tr,
+        erase=True,
+        data_format_ohlcv="feather",
+        candle_type=CandleType.SPOT,
+    )
+    for timeframe, dfbak in (("1m", dfbak_1m), ("5m", dfbak_5m)):
+        df = load_pair_history(datadir=tmp_path, timeframe=timeframe, pair=pair)
+        assert df["date"].min() == tr.startdt
+        assert df["date"].max() <= tr.stopdt
+        expected = dfbak.loc[(dfbak["date"] >= tr.startdt) & (dfbak["date"] < tr.stopdt)]
+        assert_frame_equal(
+            df.loc[df["date"] < tr.stopdt], expected.reset_index(drop=True), check_exact=True
+        )
@@ -1,12 +1,14 @@
 import pandas as pd
 import pytest
 
+import freqtrade.data.converter.orderflow as orderflow_module
 from freqtrade.constants import DEFAULT_TRADES_COLUMNS
-from freqtrade.data.converter import populate_dataframe_with_trades
+from freqtrade.data.converter import OrderflowCache, populate_dataframe_with_trades
 from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
     stacked_imbalance,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -45,6 +47,39 @@ def candles(testdatadir):
     return pd.read_json(testdatadir / "orderflow/candles.json").copy()
 
 
+@pytest.fixture
+def orderflow_config():
+    return {
+        "timeframe": "1m",
+        "orderflow": {
+            "cache_size": 10,
+            "max_candles": 10,
+            "scale": 0.05,
+            "imbalance_volume": 0,
+            "imbalance_ratio": 1.5,
+            "stacked_imbalance_range": 2,
+        },
+    }
+
+
+@pytest.fixture
+def orderflow_candles():
+    # Factory - every call returns a fresh dataframe of 1m candles
+    def candles():
+        return pd.DataFrame(
+            {
+                "date": pd.date_range("2023-02-02 09:19", periods=6, freq="1min", tz="UTC"),
+                "open": 1.0,
+                "high": 1.0,
+                "low": 1.0,
+                "close": 1.0,
+                "volume": 1.0,
+            }
+        )
+
+    return candles
+
+
 @pytest.fixture
 def public_trades_list(testdatadir):
     return read_csv(testdatadir / "orderflow/public_trades_list.csv").copy()
@@ -181,8 +216,8 @@ def test_public_trades_mock_populate_dataframe_with_trades__check_orderflow(
     # Assert delta value from the first row
     assert pytest.approx(results["delta"]) == -50.519
     # Assert min and max delta values from the first row
-    assert results["min_delta"] == -79.469
-    assert results["max_delta"] == 17.298
+    assert pytest.approx(results["min_delta"]) == -79.469
+    assert pytest.approx(results["max_delta"]) == 17.298
 
     # Assert that stacked imbalances are NaN (not applicable in this test)
     assert results["stacked_imbalances_bid"] == []
@@ -192,14 +227,14 @@ def test_public_trades_mock_populate_dataframe_with_trades__check_orderflow(
     results = df.iloc[-2]
     assert pytest.approx(results["delta"]) == -20.862
     assert pytest.approx(results["min_delta"]) == -54.559999
-    assert 82.842 == results["max_delta"]
+    assert pytest.approx(results["max_delta"]) == 82.842
     assert results["stacked_imbalances_bid"] == [234.97]
     assert results["stacked_imbalances_ask"] == [234.94]
 
     # Repeat assertions for the last row
     results = df.iloc[-1]
     assert pytest.approx(results["delta"]) == -49.302
-    assert results["min_delta"] == -70.222
+    assert pytest.approx(results["min_delta"]) == -70.222
     assert pytest.approx(results["max_delta"]) == 11.213
     assert results["stacked_imbalances_bid"] == []
     assert results["stacked_imbalances_ask"] == []
@@ -277,8 +312,8 @@ def test_public_trades_trades_mock_populate_dataframe_with_trades__check_trades(
     ]
     # Assert delta, bid, and ask values
     assert pytest.approx(row["delta"]) == -50.519
-    assert row["bid"] == 219.961
-    assert row["ask"] == 169.442
+    assert pytest.approx(row["bid"]) == 219.961
+    assert pytest.approx(row["ask"]) == 169.442
 
     # Assert the number of trades
     assert len(row["trades"]) == 151
@@ -389,6 +424,103 @@ def test_public_trades_binned_big_sample_list(public_trades_list):
     assert 52.7199999 == pytest.approx(df["delta"].iat[0])  # delta
 
 
+def test_populate_dataframe_with_trades_per_candle(
+    public_trades_list, orderflow_config, orderflow_candles
+):
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    df, cache = populate_dataframe_with_trades(
+        None, orderflow_config, orderflow_candles(), trades.copy()
+    )
+    # Candles without trades
+    assert df["total_trades"].isna().tolist() == [True, False, False, False, False, True]
+    assert df["total_trades"].sum() == len(trades)
+
+    # Same results as calculating each candle on its own
+    for idx in range(1, 5):
+        candle_trades = trades.loc[trades["date"].dt.floor("1min") == df.at[idx, "date"]]
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.05)
+        assert df.at[idx, "orderflow"] == orderflow.to_dict(orient="index")
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=1.5, imbalance_volume=0
+        )
+        assert df.at[idx, "imbalances"] == imbalances.to_dict(orient="index")
+        for label in ("bid", "ask"):
+            assert df.at[idx, f"stacked_imbalances_{label}"] == stacked_imbalance(
+                imbalances, label=label, stacked_imbalance_range=2
+            )
+        assert len(df.at[idx, "trades"]) == len(candle_trades)
+        assert df.at[idx, "trades"][0]["id"] == candle_trades.iloc[0]["id"]
+        assert df.at[idx, "total_trades"] == len(candle_trades)
+        assert pytest.approx(df.at[idx, "delta"]) == orderflow["delta"].sum()
+    assert any(df["stacked_imbalances_bid"].iloc[1:5])
+
+    # Candles from the cache
+    df_cached, _ = populate_dataframe_with_trades(
+        cache, orderflow_config, orderflow_candles(), trades.copy()
+    )
+    pd.testing.assert_frame_equal(df_cached, df)
+
+    # Trade records are optional
+    orderflow_config["orderflow"]["store_trades"] = False
+    df_no_trades, _ = populate_dataframe_with_trades(
+        None, orderflow_config, orderflow_candles(), trades.copy()
+    )
+    assert df_no_trades["trades"].isna().all()
+    pd.testing.assert_frame_equal(df_no_trades.drop(columns="trades"), df.drop(columns="trades"))
+
+
+def test_populate_dataframe_with_trades_incremental(
+    public_trades_list, orderflow_config, orderflow_candles, mocker
+):
+    trades = trades_list_to_df(public_trades_list[DEFAULT_TRADES_COLUMNS].values.tolist())
+    spy = mocker.spy(orderflow_module, "trades_to_orderflow")
+    df_full, _ = populate_dataframe_with_trades(None, orderflow_config, orderflow_candles(), trades)
+    assert spy.call_count == 1
+    # Trades are not modified
+    assert trades.columns.tolist() == DEFAULT_TRADES_COLUMNS + ["date"]
+
+    # Trades up to the 09:22 candle
+    _, cache = populate_dataframe_with_trades(
+        None, orderflow_config, orderflow_candles(), trades.iloc[:600]
+    )
+    assert isinstance(cache, OrderflowCache)
+    assert len(cache) == 6
+    assert len(cache.results) == 3
+
+    spy.reset_mock()
+    df, cache = populate_dataframe_with_trades(cache, orderflow_config, orderflow_candles(), trades)
+    # Only the candle of the last known trade and the following candles are recalculated
+    assert spy.call_count == 1
+    candle_trades = spy.call_args[0][0]
+    assert candle_trades["candle_start"].unique().tolist() == [
+        pd.Timestamp("2023-02-02 09:22", tz="UTC"),
+        pd.Timestamp("2023-02-02 09:23", tz="UTC"),
+    ]
+    pd.testing.assert_frame_equal(df, df_full)
+
+    # No new trades - nothing to recalculate
+    spy.reset_mock()
+    df, cache = populate_dataframe_with_trades(cache, orderflow_config, orderflow_candles(), trades)
+    assert spy.call_count == 0
+    pd.testing.assert_frame_equal(df, df_full)
+
+    # Old candles are evicted
+    orderflow_config["orderflow"]["cache_size"] = 2
+    df, cache = populate_dataframe_with_trades(cache, orderflow_config, orderflow_candles(), trades)
+    assert spy.call_count == 0
+    pd.testing.assert_frame_equal(df, df_full)
+    assert cache.candles.tolist() == [
+        pd.Timestamp("2023-02-02 09:23", tz="UTC"),
+        pd.Timestamp("2023-02-02 09:24", tz="UTC"),
+    ]
+    assert len(cache.results) == 1
+
+    # Evicted candles within max_candles are recalculated
+    df, cache = populate_dataframe_with_trades(cache, orderflow_config, orderflow_candles(), trades)
+    assert spy.call_count == 1
+    pd.testing.assert_frame_equal(df, df_full)
+
+
 def test_public_trades_config_max_trades(
     default_conf, populate_dataframe_with_trades_dataframe, populate_dataframe_with_trades_trades
 ):
@@ -500,9 +632,7 @@ def test_analyze_with_orderflow(
     strategy.dp = DataProvider(default_conf_usdt, None, None)
 
     mocker.patch.object(strategy.dp, "trades", return_value=populate_dataframe_with_trades_trades)
-    import freqtrade.data.converter.orderflow as orderflow_module
-
-    spy = mocker.spy(orderflow_module, "trades_to_volumeprofile_with_total_delta_bid_ask")
+    spy = mocker.spy(orderflow_module, "trades_to_orderflow")
 
     pair = "ETH/BTC"
     df = strategy.advise_indicators(ohlcv_history, {"pair:": pair})
@@ -529,7 +659,8 @@ def test_analyze_with_orderflow(
     df1 = strategy.advise_indicators(ohlcv_history, {"pair": pair})
     assert len(df1) == len(ohlcv_history)
     assert "open" in df1.columns
-    assert spy.call_count == 5
+    # All candles are calculated at once
+    assert spy.call_count == 1
 
     for col in ORDERFLOW_ADDED_COLUMNS:
         assert col in df1.columns, f"Column {col} not found in df.columns"
@@ -2,12 +2,14 @@
 
 import re
 from datetime import UTC, datetime
+from math import ceil
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
-from pandas import DataFrame, Timestamp
+from pandas import DataFrame, Timestamp, concat
 from pandas.testing import assert_frame_equal
+from pyarrow import parquet as pq
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
@@ -19,6 +21,9 @@ from freqtrade.data.history.datahandlers.idatahandler import (
 )
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
+from freqtrade.data.history.datahandlers.parquetdatasetdatahandler import (
+    ParquetDatasetDataHandler,
+)
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from tests.conftest import log_has, log_has_re
@@ -290,7 +295,7 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", [d for d in AVAILABLE_DATAHANDLERS if d != "parquetds"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
@@ -303,10 +308,24 @@ def test_datahandler_ohlcv_append(
 
 
 @pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
-def test_datahandler_trades_append(datahandler, testdatadir):
-    dh = get_datahandler(testdatadir, datahandler)
-    with pytest.raises(NotImplementedError):
-        dh.trades_append("UNITTEST/ETH", DataFrame())
+def test_datahandler_trades_append(datahandler, testdatadir, tmp_path):
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.trades_append("XRP/NEW", trades.iloc[:1000], TradingMode.SPOT)
+    # Overlapping trades are skipped
+    dh.trades_append("XRP/NEW", trades.iloc[900:5000], TradingMode.SPOT)
+    dh.trades_append("XRP/NEW", trades.iloc[5000:], TradingMode.SPOT)
+    assert_frame_equal(dh.trades_load("XRP/NEW", TradingMode.SPOT).reset_index(drop=True), trades)
+
+    # Old trades are dropped
+    keep_since = trades.iloc[6000]["timestamp"]
+    dh.trades_append("XRP/NEW", trades.iloc[:0], TradingMode.SPOT, keep_since_ms=keep_since)
+    trades_new = dh.trades_load("XRP/NEW", TradingMode.SPOT)
+    assert trades_new.iloc[0]["timestamp"] <= keep_since
+    assert len(trades_new) < len(trades)
+    assert trades_new.iloc[-1]["id"] == trades.iloc[-1]["id"]
+    kept = trades.loc[trades["timestamp"] >= keep_since]
+    assert (trades_new["timestamp"] >= keep_since).sum() == len(kept)
 
 
 @pytest.mark.parametrize(
@@ -403,6 +422,71 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+def test_parquetdatasetdatahandler_ohlcv(testdatadir, tmp_path, mocker, caplog):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.parquetdatasetdatahandler.ROW_GROUP_SIZE", 500
+    )
+    dh = get_datahandler(tmp_path, "parquetds")
+    assert isinstance(dh, ParquetDatasetDataHandler)
+    dirname = tmp_path / "UNITTEST_NEW-5m.parquetds"
+
+    dh.ohlcv_store("UNITTEST/NEW", "5m", ohlcv.iloc[:3000], candle_type=CandleType.SPOT)
+    assert dirname.is_dir()
+    assert len(list(dirname.glob("part-*.parquet"))) == 1
+    assert dh.ohlcv_get_pairs(tmp_path, "5m", CandleType.SPOT) == ["UNITTEST/NEW"]
+
+    # Append - including already stored candles
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[2000:], candle_type=CandleType.SPOT)
+    assert len(list(dirname.glob("part-*.parquet"))) == 2
+    # Nothing new to append
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[4000:-1], candle_type=CandleType.SPOT)
+    assert len(list(dirname.glob("part-*.parquet"))) == 2
+    # The last stored candle is replaced
+    last_candle = ohlcv.iloc[-1:].copy()
+    last_candle["close"] = 42.0
+    dh.ohlcv_append("UNITTEST/NEW", "5m", last_candle, candle_type=CandleType.SPOT)
+    assert len(list(dirname.glob("part-*.parquet"))) == 3
+    assert dh.ohlcv_load("UNITTEST/NEW", "5m", candle_type=CandleType.SPOT).iloc[-1]["close"] == 42
+    dh.ohlcv_append("UNITTEST/NEW", "5m", ohlcv.iloc[-1:], candle_type=CandleType.SPOT)
+
+    loaded = dh.ohlcv_load("UNITTEST/NEW", "5m", candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, ohlcv)
+    assert dh.ohlcv_data_min_max("UNITTEST/NEW", "5m", CandleType.SPOT) == (
+        ohlcv.iloc[0]["date"].to_pydatetime(),
+        ohlcv.iloc[-1]["date"].to_pydatetime(),
+        len(ohlcv),
+    )
+
+    # Only overlapping parts / row groups are read
+    read_table = mocker.spy(pq, "read_table")
+    timerange = TimeRange.parse_timerange("20180115-20180116")
+    loaded = dh.ohlcv_load(
+        "UNITTEST/NEW", "5m", CandleType.SPOT, timerange=timerange, startup_candles=20
+    )
+    expected = get_datahandler(testdatadir, "feather").ohlcv_load(
+        "UNITTEST/BTC", "5m", CandleType.SPOT, timerange=timerange, startup_candles=20
+    )
+    assert_frame_equal(loaded, expected)
+    assert read_table.call_count == 1
+    raw = dh._ohlcv_load("UNITTEST/NEW", "5m", timerange, candle_type=CandleType.SPOT)
+    assert len(raw) <= 2 * 500
+
+    assert dh.ohlcv_data_min_max("UNITTEST/NONEXIST", "5m", CandleType.SPOT)[2] == 0
+    assert dh.ohlcv_load("UNITTEST/NONEXIST", "5m", candle_type=CandleType.SPOT).empty
+
+    # Loading data that errors
+    read_table.side_effect = Exception("Test")
+    assert dh.ohlcv_load("UNITTEST/NEW", "5m", candle_type=CandleType.SPOT).empty
+    assert log_has_re("Error loading data from", caplog)
+
+    assert dh.ohlcv_purge("UNITTEST/NEW", "5m", CandleType.SPOT)
+    assert not dirname.exists()
+    assert not dh.ohlcv_purge("UNITTEST/NEW", "5m", CandleType.SPOT)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -433,6 +517,99 @@ def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     assert len(trades_new) == len(trades)
 
 
+@pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
+def test_datahandler_trades_chunks(testdatadir, tmp_path, datahandler):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load("XRP/ETH", TradingMode.SPOT)
+
+    chunks = list(dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT, chunk_size=100))
+    assert len(chunks) == ceil(len(trades) / 100)
+    assert_frame_equal(concat(chunks, ignore_index=True), trades.reset_index(drop=True))
+    assert list(dh.trades_load_chunks("UNITTEST/NONEXIST", TradingMode.SPOT)) == []
+
+    # Timerange is applied while loading
+    start_ts, stop_ts = trades.iloc[500]["timestamp"], trades.iloc[800]["timestamp"]
+    timerange = TimeRange("date", "date", start_ts // 1000, stop_ts // 1000)
+    expected = trades.loc[
+        (trades["timestamp"] >= start_ts // 1000 * 1000)
+        & (trades["timestamp"] <= stop_ts // 1000 * 1000)
+    ].reset_index(drop=True)
+    trades_tr = dh.trades_load("XRP/ETH", TradingMode.SPOT, timerange=timerange)
+    assert_frame_equal(trades_tr.reset_index(drop=True), expected)
+    chunks = list(
+        dh.trades_load_chunks("XRP/ETH", TradingMode.SPOT, timerange=timerange, chunk_size=100)
+    )
+    assert_frame_equal(concat(chunks, ignore_index=True), expected)
+
+    # Store chunks, duplicates across chunk boundaries are removed when loading
+    dh1 = get_datahandler(tmp_path, datahandler)
+    duplicated = [trades.iloc[:1000], trades.iloc[999:]]
+    assert dh1.trades_store_chunks("XRP/NEW", iter(duplicated), TradingMode.SPOT) == len(trades) + 1
+    chunks = list(dh1.trades_load_chunks("XRP/NEW", TradingMode.SPOT, chunk_size=1000))
+    assert_frame_equal(concat(chunks, ignore_index=True), trades.reset_index(drop=True))
+    assert not list(tmp_path.glob(".tmp-*"))
+
+    assert dh1.trades_store_chunks("XRP/NEW", iter([]), TradingMode.SPOT) == 0
+    assert dh1.trades_load("XRP/NEW", TradingMode.SPOT).empty
+
+
+def test_featherdatahandler_trades_segments(testdatadir, tmp_path, mocker):
+    mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.TRADES_MAX_SMALL_SEGMENTS", 3
+    )
+    trades = get_datahandler(testdatadir, "feather").trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = FeatherDataHandler(tmp_path)
+    file = tmp_path / "XRP_NEW-trades.feather"
+    segments_dir = tmp_path / "XRP_NEW-trades-segments"
+
+    dh.trades_append("XRP/NEW", trades.iloc[:2000], TradingMode.SPOT)
+    assert file.is_file()
+    assert not segments_dir.exists()
+
+    for start in range(2000, 6000, 1000):
+        dh.trades_append("XRP/NEW", trades.iloc[start : start + 1000], TradingMode.SPOT)
+    # 4 small segments were merged into one
+    segments = FeatherDataHandler._get_trades_segments(segments_dir)
+    assert len(segments) == 1
+    assert segments[0][:3] == (0, trades.iloc[2000]["timestamp"], trades.iloc[5999]["timestamp"])
+    assert not list(segments_dir.glob(".tmp-*"))
+
+    dh.trades_append("XRP/NEW", trades.iloc[6000:], TradingMode.SPOT)
+    assert len(FeatherDataHandler._get_trades_segments(segments_dir)) == 2
+    assert_frame_equal(dh.trades_load("XRP/NEW", TradingMode.SPOT).reset_index(drop=True), trades)
+
+    # Tail reads skip old segments
+    timerange = TimeRange("date", None, trades.iloc[7000]["timestamp"] // 1000, 0)
+    assert_frame_equal(
+        dh.trades_load("XRP/NEW", TradingMode.SPOT, timerange=timerange),
+        dh.trades_load("XRP/NEW", TradingMode.SPOT)
+        .pipe(lambda df: df.loc[df["timestamp"] >= timerange.startts * 1000])
+        .reset_index(drop=True),
+    )
+
+    # Only complete segments are dropped
+    dh.trades_append(
+        "XRP/NEW",
+        trades.iloc[:0],
+        TradingMode.SPOT,
+        keep_since_ms=trades.iloc[3000]["timestamp"],
+    )
+    assert not file.exists()
+    assert len(dh.trades_load("XRP/NEW", TradingMode.SPOT)) == len(trades) - 2000
+
+    # Storing replaces all segments
+    dh.trades_store("XRP/NEW", trades.iloc[:100], TradingMode.SPOT)
+    assert not segments_dir.exists()
+    assert_frame_equal(dh.trades_load("XRP/NEW", TradingMode.SPOT), trades.iloc[:100])
+
+    dh.trades_append("XRP/NEW", trades.iloc[100:200], TradingMode.SPOT)
+    assert segments_dir.is_dir()
+    assert dh.trades_purge("XRP/NEW", TradingMode.SPOT)
+    assert not segments_dir.exists()
+    assert not file.exists()
+    assert not dh.trades_purge("XRP/NEW", TradingMode.SPOT)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_purge(mocker, testdatadir, datahandler):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
@@ -495,6 +672,10 @@ def test_gethandlerclass():
     assert cl == ParquetDataHandler
     assert issubclass(cl, IDataHandler)
 
+    cl = get_datahandlerclass("parquetds")
+    assert cl == ParquetDatasetDataHandler
+    assert issubclass(cl, IDataHandler)
+
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass("DeadBeef")
 
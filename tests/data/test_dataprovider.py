@@ -300,6 +300,11 @@ def test_refresh(mocker, default_conf):
     assert len(refresh_mock.call_args[0]) == 1
     assert len(refresh_mock.call_args[0][0]) == len(pairs) + len(pairs_non_trad)
     assert refresh_mock.call_args[0][0] == pairs + pairs_non_trad
+    assert refresh_mock.call_args[1]["priority_pairs"] is None
+
+    refresh_mock.reset_mock()
+    dp.refresh(pairs, pairs_non_trad, priority_pairs=["UNITTEST/BTC"])
+    assert refresh_mock.call_args[1]["priority_pairs"] == ["UNITTEST/BTC"]
 
     # Test with public trades
     refresh_mock.reset_mock()
@@ -383,6 +383,59 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
     assert json_dump_mock.call_count == 3
 
 
+def test_download_pair_history_append(mocker, default_conf, testdatadir, tmp_path) -> None:
+    ohlcv = get_datahandler(testdatadir, "feather").ohlcv_load(
+        "UNITTEST/BTC", "5m", candle_type=CandleType.SPOT
+    )
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "parquetds")
+    dirname = tmp_path / "UNITTEST_BTC-5m.parquetds"
+    store_mock = mocker.spy(dh, "ohlcv_store")
+    append_mock = mocker.spy(dh, "ohlcv_append")
+    get_historic_ohlcv = mocker.patch.object(
+        exchange, "get_historic_ohlcv", return_value=ohlcv.iloc[:3000]
+    )
+
+    def download(**kwargs):
+        return _download_pair_history(
+            datadir=tmp_path,
+            exchange=exchange,
+            pair="UNITTEST/BTC",
+            timeframe="5m",
+            data_handler=dh,
+            candle_type=CandleType.SPOT,
+            **kwargs,
+        )
+
+    assert download()
+    assert store_mock.call_count == 1
+    assert append_mock.call_count == 0
+
+    # Incremental download - new candles are appended, existing data isn't rewritten
+    store_mock.reset_mock()
+    corrected = ohlcv.iloc[2998:].copy()
+    corrected.loc[2999, "close"] = 42.0
+    get_historic_ohlcv.return_value = corrected
+    assert download()
+    # The last stored candle is dropped as incomplete when loading - so it's downloaded again
+    assert get_historic_ohlcv.call_args[1]["since_ms"] == dt_ts(ohlcv.iloc[2998]["date"])
+    assert store_mock.call_count == 0
+    assert append_mock.call_count == 1
+    assert len(list(dirname.glob("part-*.parquet"))) == 2
+
+    expected = ohlcv.copy()
+    expected.loc[2999, "close"] = 42.0
+    loaded = dh.ohlcv_load("UNITTEST/BTC", "5m", candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected)
+
+    # Erase rewrites all data
+    get_historic_ohlcv.return_value = ohlcv
+    assert download(erase=True)
+    assert store_mock.call_count == 1
+    assert append_mock.call_count == 1
+    assert len(list(dirname.glob("part-*.parquet"))) == 1
+
+
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
     mocker.patch(f"{EXMS}.get_historic_ohlcv", side_effect=Exception("File Error"))
     exchange = get_patched_exchange(mocker, default_conf)
@@ -435,6 +488,20 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
     )
 
 
+def test_load_data_workers(testdatadir) -> None:
+    pairs = ["UNITTEST/BTC", "ETH/BTC", "XLM/BTC", "NOPAIR/XXX", "TRX/BTC"]
+    progress = MagicMock()
+    expected = load_data(testdatadir, "5m", pairs)
+    data = load_data(testdatadir, "5m", pairs, workers=3, progress_callback=progress)
+
+    assert list(data) == list(expected)
+    assert "NOPAIR/XXX" not in data
+    for pair, df in expected.items():
+        assert_frame_equal(data[pair], df)
+    assert progress.call_count == len(pairs)
+    assert progress.call_args_list[-1][0] == (len(pairs), len(pairs))
+
+
 def test_init(default_conf) -> None:
     assert {} == load_data(datadir=Path(), pairs=[], timeframe=default_conf["timeframe"])
 
@@ -571,6 +638,121 @@ def test_refresh_backtest_ohlcv_data(
         assert log_has_re(r"Downloading pair ETH/BTC, mark, interval 4h\.", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 3])
+def test_refresh_backtest_ohlcv_data_resume(
+    mocker, default_conf, markets, tmp_path, time_machine, workers
+):
+    time_machine.move_to("2024-03-01 10:00:00 +00:00", tick=False)
+    interrupt = {("XRP/BTC", "5m")}
+
+    def download(pair, timeframe, **kwargs):
+        if (pair, timeframe) in interrupt:
+            raise KeyboardInterrupt()
+        return True
+
+    dl_mock = mocker.patch(
+        "freqtrade.data.history.history_utils._download_pair_history", side_effect=download
+    )
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    manifest_file = tmp_path / ".download_manifest.json"
+    kwargs = {
+        "exchange": ex,
+        "pairs": ["ETH/BTC", "XRP/BTC"],
+        "timeframes": ["1m", "5m"],
+        "datadir": tmp_path,
+        "timerange": TimeRange.parse_timerange("20190101-"),
+        "trading_mode": "spot",
+        "workers": workers,
+        "track_progress": True,
+    }
+    # Interrupted download keeps the manifest
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs)
+    assert manifest_file.is_file()
+
+    # Resume - completed downloads are skipped
+    dl_mock.reset_mock()
+    interrupt.clear()
+    refresh_backtest_ohlcv_data(**kwargs, resume=True)
+    assert dl_mock.call_count == 1
+    assert dl_mock.call_args[1]["pair"] == "XRP/BTC"
+    assert dl_mock.call_args[1]["timeframe"] == "5m"
+    # All downloads completed
+    assert not manifest_file.is_file()
+
+    # Different parameters don't resume
+    interrupt.add(("XRP/BTC", "5m"))
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs)
+    assert manifest_file.is_file()
+    kwargs["erase"] = True
+    dl_mock.reset_mock()
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs, resume=True)
+    assert dl_mock.call_count == 4
+
+    # Without --resume, nothing is skipped
+    interrupt.clear()
+    dl_mock.reset_mock()
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+    assert not manifest_file.is_file()
+
+
+def test_refresh_backtest_ohlcv_data_failed_download(
+    mocker, default_conf, markets, tmp_path, time_machine
+):
+    time_machine.move_to("2024-03-01 10:00:00 +00:00", tick=False)
+    failing = {("XRP/BTC", "5m")}
+    interrupt = set()
+
+    def download(pair, timeframe, **kwargs):
+        if (pair, timeframe) in interrupt:
+            raise KeyboardInterrupt()
+        return (pair, timeframe) not in failing
+
+    dl_mock = mocker.patch(
+        "freqtrade.data.history.history_utils._download_pair_history", side_effect=download
+    )
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    manifest_file = tmp_path / ".download_manifest.json"
+    kwargs = {
+        "exchange": ex,
+        "pairs": ["ETH/BTC", "XRP/BTC"],
+        "timeframes": ["1m", "5m"],
+        "datadir": tmp_path,
+        "timerange": None,
+        "trading_mode": "spot",
+        "track_progress": True,
+        "resume": True,
+    }
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+    # The download finished - failed downloads don't keep the manifest
+    assert not manifest_file.is_file()
+
+    # Next run on a later day refreshes all data up to now
+    time_machine.move_to("2024-03-02 10:00:00 +00:00", tick=False)
+    dl_mock.reset_mock()
+    failing.clear()
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+
+    # A manifest of an interrupted download on an earlier day is outdated
+    interrupt.add(("XRP/BTC", "5m"))
+    with pytest.raises(KeyboardInterrupt):
+        refresh_backtest_ohlcv_data(**kwargs)
+    assert manifest_file.is_file()
+    time_machine.move_to("2024-03-03 10:00:00 +00:00", tick=False)
+    interrupt.clear()
+    dl_mock.reset_mock()
+    refresh_backtest_ohlcv_data(**kwargs)
+    assert dl_mock.call_count == 4
+    assert not manifest_file.is_file()
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch(
         "freqtrade.data.history.history_utils._download_pair_history", MagicMock()
@@ -630,6 +812,8 @@ def test_download_trades_history(
 
     ght_mock = MagicMock(side_effect=lambda pair, *args, **kwargs: (pair, trades_history))
     mocker.patch(f"{EXMS}.get_historic_trades", ght_mock)
+    # Skip binance's archive download
+    default_conf["exchange"]["only_from_ccxt"] = True
     exchange = get_patched_exchange(mocker, default_conf)
     file1 = tmp_path / "ETH_BTC-trades.json.gz"
     data_handler = get_datahandler(tmp_path, data_format="jsongz")
@@ -663,6 +847,8 @@ def test_download_trades_history(
     # Check this in seconds - since we had to convert to seconds above too.
     assert int(ght_mock.call_args_list[0][1]["since"] // 1000) == since_time2 - 5
     assert ght_mock.call_args_list[0][1]["from_id"] is not None
+    # Redownloaded trades are not duplicated
+    assert log_has("New Amount of trades: 6", caplog)
 
     file1.unlink()
 
@@ -698,3 +884,38 @@ def test_download_trades_history(
     assert ght_mock.call_count == 0
 
     _clean_test_file(file2)
+
+
+def test_download_trades_history_chunks(
+    trades_history_df, mocker, default_conf, tmp_path, caplog
+) -> None:
+    # Chunks overlap by one trade - the 2nd chunk also has a new trade with the same timestamp
+    chunks = [trades_history_df.iloc[:4], trades_history_df.iloc[0:0], trades_history_df.iloc[3:]]
+    exchange = get_patched_exchange(mocker, default_conf)
+    ghtc_mock = mocker.patch.object(
+        exchange, "get_historic_trades_chunks", side_effect=lambda *args, **kwargs: iter(chunks)
+    )
+    data_handler = get_datahandler(tmp_path, data_format="feather")
+
+    assert _download_trades_history(
+        data_handler=data_handler, exchange=exchange, pair="ETH/BTC", trading_mode=TradingMode.SPOT
+    )
+    assert log_has("New Amount of trades: 6", caplog)
+    stored = data_handler.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert stored["id"].tolist() == trades_history_df["id"].tolist()
+    caplog.clear()
+
+    # Redownloaded trades overlap the stored trades
+    chunks = [trades_history_df.iloc[2:5], trades_history_df.iloc[4:]]
+    timerange = TimeRange("date", None, int(trades_history_df.iloc[2]["timestamp"] // 1000), 0)
+    assert _download_trades_history(
+        data_handler=data_handler,
+        exchange=exchange,
+        pair="ETH/BTC",
+        timerange=timerange,
+        trading_mode=TradingMode.SPOT,
+    )
+    assert ghtc_mock.call_args[1]["from_id"] is not None
+    assert log_has("New Amount of trades: 6", caplog)
+    stored = data_handler.trades_load("ETH/BTC", TradingMode.SPOT)
+    assert stored["id"].tolist() == trades_history_df["id"].tolist()
@@ -6,13 +6,13 @@ import ccxt
 import pandas as pd
 import pytest
 
-from freqtrade.data.converter.trade_converter import trades_dict_to_list
+from freqtrade.data.converter.trade_converter import trades_dict_to_list, trades_list_to_df
 from freqtrade.enums import CandleType, MarginMode, TradingMode
 from freqtrade.exceptions import DependencyException, InvalidOrderException, OperationalException
 from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_seconds
 from freqtrade.persistence import Trade
 from freqtrade.util.datetime_helpers import dt_from_ts, dt_ts, dt_utc
-from tests.conftest import EXMS, get_patched_exchange
+from tests.conftest import EXMS, get_mock_coro, get_patched_exchange
 from tests.exchange.test_exchange import ccxt_exceptionhandlers
 
 
@@ -346,6 +346,68 @@ def test_liquidation_price_binance(
     )
 
 
+@pytest.mark.parametrize("runmode", ["backtest", "dry_run"])
+@pytest.mark.parametrize("margin_mode", ["isolated", "cross"])
+def test_get_liquidation_prices_binance(mocker, default_conf, leverage_tiers, margin_mode, runmode):
+    default_conf["trading_mode"] = "futures"
+    default_conf["margin_mode"] = margin_mode
+    default_conf["runmode"] = runmode
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    exchange = get_patched_exchange(mocker, default_conf, exchange="binance")
+    exchange._leverage_tiers = leverage_tiers
+    fetch_funding_rates = mocker.patch.object(
+        exchange,
+        "fetch_funding_rates",
+        return_value={
+            "BTC/USDT:USDT": {"markPrice": 41000.0},
+            "XRP/USDT:USDT": {"markPrice": 0.61},
+            "ADA/USDT:USDT": {"markPrice": 0.52},
+        },
+    )
+    leverage = 5.0
+    trades = [
+        Trade(
+            pair=pair,
+            open_rate=open_rate,
+            amount=amount,
+            stake_amount=open_rate * amount / leverage,
+            leverage=leverage,
+            is_short=is_short,
+            fee_open=0,
+        )
+        for pair, open_rate, amount, is_short in [
+            ("BTC/USDT:USDT", 20000.0, 0.5, False),
+            ("BTC/USDT:USDT", 42000.0, 400.0, True),
+            ("XRP/USDT:USDT", 0.6, 20000.0, True),
+            ("ADA/USDT:USDT", 0.5, 100000.0, False),
+        ]
+    ]
+    wallet_balance = 2_000_000.0
+
+    res = exchange.get_liquidation_prices(trades, wallet_balance=wallet_balance, open_trades=trades)
+    expected = [
+        exchange.get_liquidation_price(
+            pair=t.pair,
+            open_rate=t.open_rate,
+            is_short=t.is_short,
+            amount=t.amount,
+            stake_amount=t.stake_amount,
+            leverage=t.leverage,
+            wallet_balance=wallet_balance,
+            open_trades=trades,
+        )
+        for t in trades
+    ]
+    assert res == pytest.approx(expected)
+    if margin_mode == "cross" and runmode == "dry_run":
+        # Mark prices are fetched once for the batch, and once per trade for the single calls
+        assert fetch_funding_rates.call_count == 1 + len(trades)
+    else:
+        assert fetch_funding_rates.call_count == 0
+
+    assert exchange.get_liquidation_prices([], wallet_balance=0, open_trades=trades) == []
+
+
 def test_fill_leverage_tiers_binance(default_conf, mocker):
     api_mock = MagicMock()
     api_mock.fetch_leverage_tiers = MagicMock(
@@ -1060,6 +1122,66 @@ async def test__async_get_trade_history_id_binance(default_conf_usdt, mocker, fe
     exchange.close()
 
 
+def test_get_historic_trades_chunks_binance(default_conf_usdt, mocker, fetch_trades_result):
+    default_conf_usdt["exchange"]["only_from_ccxt"] = False
+    exchange = get_patched_exchange(mocker, default_conf_usdt, exchange="binance")
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    exchange._api_async.fetch_trades = get_mock_coro(fetch_trades_result[:1])
+    archive_trades = trades_list_to_df(trades_dict_to_list(fetch_trades_result[:-2]), convert=False)
+
+    async def mock_iter_archive_trades(*args, **kwargs):
+        # One chunk per trade
+        for i in range(len(archive_trades)):
+            yield archive_trades.iloc[i : i + 1]
+
+    iter_mock = mocker.patch(
+        "freqtrade.exchange.binance.iter_archive_trades", side_effect=mock_iter_archive_trades
+    )
+    rest_mock = mocker.patch(
+        f"{EXMS}._async_get_trade_history_id",
+        return_value=("ETH/BTC", trades_dict_to_list(fetch_trades_result[-3:])),
+    )
+    pair = "ETH/BTC"
+    since = fetch_trades_result[0]["timestamp"] - 1000
+    chunks = list(
+        exchange.get_historic_trades_chunks(
+            pair, since=since, until=fetch_trades_result[-1]["timestamp"] + 1
+        )
+    )
+    assert len(chunks) == len(archive_trades) + 1
+    assert all("date" in chunk.columns for chunk in chunks)
+    # since moved to the listing date
+    assert iter_mock.call_args[1]["since_ms"] == fetch_trades_result[0]["timestamp"]
+    # Remaining trades from the REST API, starting with the last archived trade
+    assert rest_mock.call_count == 1
+    assert rest_mock.call_args[1]["since"] == archive_trades.iloc[-1]["timestamp"]
+    assert rest_mock.call_args[1]["from_id"] == archive_trades.iloc[-1]["id"]
+    assert chunks[-1]["id"].tolist() == [t["id"] for t in fetch_trades_result[-3:]]
+
+    # Archive covers the requested range
+    rest_mock.reset_mock()
+    chunks = list(
+        exchange.get_historic_trades_chunks(
+            pair, since=since, until=int(archive_trades.iloc[-1]["timestamp"]), from_id="1"
+        )
+    )
+    assert len(chunks) == len(archive_trades)
+    assert rest_mock.call_count == 0
+
+    default_conf_usdt["exchange"]["only_from_ccxt"] = True
+    ght_mock = mocker.patch(
+        f"{EXMS}.get_historic_trades",
+        return_value=(pair, trades_dict_to_list(fetch_trades_result)),
+    )
+    chunks = list(exchange.get_historic_trades_chunks(pair, since=since))
+    assert len(chunks) == 1
+    assert len(chunks[0]) == len(fetch_trades_result)
+    assert ght_mock.call_count == 1
+
+    # Clean up event loop to avoid warnings
+    exchange.close()
+
+
 async def test__async_get_trade_history_id_binance_fast(
     default_conf_usdt, mocker, fetch_trades_result
 ):
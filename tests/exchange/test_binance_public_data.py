@@ -9,7 +9,10 @@ from datetime import timedelta
 import aiohttp
 import pandas as pd
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
+from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.enums import CandleType
 from freqtrade.exchange.binance_public_data import (
     BadHttpStatus,
@@ -20,6 +23,7 @@ from freqtrade.exchange.binance_public_data import (
     download_archive_trades,
     get_daily_ohlcv,
     get_daily_trades,
+    iter_archive_trades,
 )
 from freqtrade.util.datetime_helpers import dt_ts, dt_utc
 from ft_client.test_client.test_rest_client import log_has_re
@@ -494,3 +498,66 @@ async def test_get_daily_trades(mocker, testdatadir):
         with pytest.raises(zipfile.BadZipFile):
             await get_daily_trades(symbol, CandleType.SPOT, date, session)
         assert get.call_count == 4  # 1 + 3 default retries
+
+
+async def test_iter_archive_trades(mocker, testdatadir, caplog):
+    pair = "PEPE/USDT"
+    markets = {pair: {"id": "PEPEUSDT"}}
+    spot_zip = (
+        testdatadir / "binance/binance_public_data/spot-PEPEUSDT-aggTrades-2024-10-27.zip"
+    ).read_bytes()
+    requested = []
+
+    async def handler(request):
+        day = request.match_info["day"]
+        requested.append(day)
+        if day == "2020-01-03":
+            return web.Response(status=404)
+        return web.Response(body=spot_zip)
+
+    app = web.Application()
+    app.router.add_get("/{symbol}/{day}.zip", handler)
+    # Serve the fixture archives from a local server
+    async with TestServer(app) as server:
+        mocker.patch(
+            "freqtrade.exchange.binance_public_data.binance_vision_trades_zip_url",
+            side_effect=lambda symbol, candle_type, date: str(
+                server.make_url(f"/{symbol}/{date:%Y-%m-%d}.zip")
+            ),
+        )
+        chunks = [
+            chunk
+            async for chunk in iter_archive_trades(
+                CandleType.SPOT,
+                pair,
+                since_ms=dt_ts(dt_utc(2020, 1, 1)),
+                until_ms=dt_ts(dt_utc(2020, 1, 6)),
+                markets=markets,
+                prefetch_days=2,
+            )
+        ]
+
+    # Stops at the missing day
+    assert len(chunks) == 2
+    assert log_has_re(r"Binance fast download .*stopped", caplog)
+    # No more than prefetch_days downloads are started ahead
+    assert "2020-01-05" not in requested
+    assert list(chunks[0].columns) == DEFAULT_TRADES_COLUMNS
+    assert chunks[0].iloc[0]["timestamp"] == 1729987202368
+    assert chunks[0].iloc[-1]["timestamp"] == 1730073596350
+    assert set(chunks[0]["side"]) == {"buy", "sell"}
+    assert (chunks[0]["cost"] == chunks[0]["price"] * chunks[0]["amount"]).all()
+
+    caplog.clear()
+    chunks = [
+        chunk
+        async for chunk in iter_archive_trades(
+            CandleType.SPOT,
+            "XRP/USDT",
+            since_ms=dt_ts(dt_utc(2020, 1, 1)),
+            until_ms=dt_ts(dt_utc(2020, 1, 6)),
+            markets=markets,
+        )
+    ]
+    assert chunks == []
+    assert log_has_re("An exception occurred during fast trades download", caplog)
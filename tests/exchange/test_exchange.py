@@ -6,6 +6,7 @@ from random import randint
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import ccxt
+import numpy as np
 import pytest
 from numpy import nan
 from pandas import DataFrame, to_datetime
@@ -36,6 +37,7 @@ from freqtrade.exchange.common import (
     API_RETRY_COUNT,
     calculate_backoff,
 )
+from freqtrade.exchange.leverage_tiers import LeverageTierIndex
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (
@@ -2476,6 +2478,8 @@ def test_refresh_latest_trades(
     assert len(res) == len(pairs)
 
     assert exchange._api_async.fetch_trades.call_count == 4
+    # New trades are appended to the stored trades
+    assert (tmp_path / "IOTA_USDT_USDT-cached-trades-segments").is_dir()
 
     # cache - but disabled caching
     exchange._api_async.fetch_trades.reset_mock()
@@ -2823,6 +2827,44 @@ def test_refresh_latest_ohlcv_inv_result(default_conf, mocker, caplog):
     assert log_has("Async code raised an exception: TypeError()", caplog)
 
 
+def test_refresh_latest_ohlcv_order(default_conf, mocker):
+    default_conf["timeframe"] = "5m"
+    requested = []
+
+    async def mock_get_candle_hist(pair, timeframe, *args, **kwargs):
+        requested.append((pair, timeframe))
+        return pair, timeframe, CandleType.SPOT, [], True
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._async_get_candle_history = MagicMock(side_effect=mock_get_candle_hist)
+
+    pairs = [
+        ("ETH/BTC", "1h", ""),
+        ("XRP/BTC", "5m", ""),
+        ("ETH/BTC", "5m", ""),
+        ("XRP/BTC", "5m", ""),
+        ("LTC/BTC", "1h", ""),
+    ]
+    exchange.refresh_latest_ohlcv(pairs, cache=False)
+    # Deduplicated, strategy timeframe first, otherwise in the order of the pairlist
+    assert requested == [
+        ("XRP/BTC", "5m"),
+        ("ETH/BTC", "5m"),
+        ("ETH/BTC", "1h"),
+        ("LTC/BTC", "1h"),
+    ]
+
+    # Pairs with open trades first
+    requested.clear()
+    exchange.refresh_latest_ohlcv(pairs, cache=False, priority_pairs=["LTC/BTC", "ETH/BTC"])
+    assert requested == [
+        ("ETH/BTC", "5m"),
+        ("ETH/BTC", "1h"),
+        ("LTC/BTC", "1h"),
+        ("XRP/BTC", "5m"),
+    ]
+
+
 def test_get_next_limit_in_list():
     limit_range = [5, 10, 20, 50, 100, 500, 1000]
     assert Exchange.get_next_limit_in_list(1, limit_range) == 5
@@ -3424,6 +3466,55 @@ async def test__async_get_trade_history_id(
     assert exchange._ft_has["trades_pagination_arg"] in fetch_trades_cal[1][1]["params"]
 
 
+def test_refresh_rate_tickers(default_conf, mocker, time_machine) -> None:
+    time_machine.move_to("2024-05-01 12:00:00 +00:00", tick=False)
+    default_conf["entry_pricing"]["price_side"] = "ask"
+    default_conf["exit_pricing"]["price_side"] = "bid"
+    api_mock = MagicMock()
+    api_mock.fetch_ticker = MagicMock(return_value={"ask": 10, "last": 9, "bid": 8})
+    api_mock.fetch_tickers = MagicMock(
+        return_value={
+            "ETH/BTC": {"ask": 5, "last": 4.5, "bid": 4},
+            "XRP/BTC": {"ask": None, "last": 4.5, "bid": None},
+            "LTC/BTC": {"ask": 3, "last": 2.5, "bid": 2},
+        }
+    )
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange="gate")
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    pairs = ["ETH/BTC", "XRP/BTC", "NEO/BTC"]
+
+    # Disabled by default
+    exchange.refresh_rate_tickers(pairs)
+    assert api_mock.fetch_tickers.call_count == 0
+    assert exchange.get_rate("ETH/BTC", True, "entry", False) == 10
+    assert api_mock.fetch_ticker.call_count == 1
+
+    default_conf["exchange"]["tickers_max_age"] = 10
+    exchange.refresh_rate_tickers(pairs)
+    assert api_mock.fetch_tickers.call_count == 1
+    assert exchange._rate_tickers.keys() == {"ETH/BTC", "XRP/BTC"}
+    api_mock.fetch_ticker.reset_mock()
+
+    assert exchange.get_rates("ETH/BTC", True, False) == (5, 4)
+    assert api_mock.fetch_ticker.call_count == 0
+    # No bid / ask in bulk ticker
+    assert exchange.get_rate("XRP/BTC", True, "exit", False) == 8
+    assert api_mock.fetch_ticker.call_count == 1
+    # Not requested in bulk
+    assert exchange.get_rate("NEO/BTC", True, "exit", False) == 8
+    assert api_mock.fetch_ticker.call_count == 2
+
+    # Bulk tickers expired
+    time_machine.shift(11)
+    assert exchange.get_rate("ETH/BTC", True, "exit", False) == 8
+    assert api_mock.fetch_ticker.call_count == 3
+
+    # Failure keeps previous tickers
+    api_mock.fetch_tickers = MagicMock(side_effect=ccxt.NetworkError("boom"))
+    exchange.refresh_rate_tickers(pairs)
+    assert exchange._rate_tickers.keys() == {"ETH/BTC", "XRP/BTC"}
+
+
 @pytest.mark.parametrize(
     "trade_id, expected",
     [
@@ -5908,6 +5999,61 @@ def test_get_maintenance_ratio_and_amt(
     assert exchange.get_maintenance_ratio_and_amt(pair, value) == (mmr, maintAmt)
 
 
+def test_get_maintenance_ratios_and_amts(mocker, default_conf, leverage_tiers):
+    default_conf["trading_mode"] = "futures"
+    default_conf["margin_mode"] = "isolated"
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    exchange = get_patched_exchange(mocker, default_conf)
+    exchange._leverage_tiers = leverage_tiers
+
+    notionals = np.array([0, 500, 10000, 250000, 20000000, 1e12])
+    for pair in leverage_tiers:
+        mm_ratios, maint_amts = exchange.get_maintenance_ratios_and_amts(pair, notionals)
+        expected = [exchange.get_maintenance_ratio_and_amt(pair, n) for n in notionals]
+        assert mm_ratios.tolist() == [e[0] for e in expected]
+        assert maint_amts.tolist() == pytest.approx(
+            [nan if e[1] is None else e[1] for e in expected], nan_ok=True
+        )
+
+    with pytest.raises(DependencyException, match="nominal value can not be lower than 0"):
+        exchange.get_maintenance_ratios_and_amts("ADA/USDT:USDT", np.array([500, -1]))
+    with pytest.raises(InvalidOrderException, match="Maintenance margin rate for"):
+        exchange.get_maintenance_ratios_and_amts("SPONGE/USDT:USDT", notionals)
+
+
+def test_leverage_tier_index():
+    # Deliberately unsorted - lookups must match a linear scan over the tiers
+    tiers = [
+        {"minNotional": 0, "maxNotional": 5000, "maxLeverage": 50},
+        {"minNotional": 20000, "maxNotional": 50000, "maxLeverage": 10},
+        {"minNotional": 5000, "maxNotional": 20000, "maxLeverage": 25},
+        {"minNotional": 50000, "maxNotional": 100000, "maxLeverage": 20},
+        {"minNotional": 100000, "maxNotional": 500000, "maxLeverage": 5},
+    ]
+    for t in tiers:
+        t.update({"maintenanceMarginRate": t["maxLeverage"] / 1000, "maintAmt": None})
+    index = LeverageTierIndex(tiers)
+
+    for notional in [0, 1, 4999, 5000, 19999, 20000, 60000, 100000, 1e9]:
+        expected = next((t for t in reversed(tiers) if notional >= t["minNotional"]), None)
+        assert index.tier_for_notional(notional) is expected
+    assert index.tier_for_notional(-1) is None
+    assert index.tiers_for_notionals(np.array([-1, 0, 6000, 1e9])).tolist() == [-1, 0, 2, 4]
+    assert np.isnan(index.maint_amt_arr).all()
+
+    for leverage in [1, 5, 6, 10, 15, 20, 25, 40, 50, 51]:
+        expected = next((t for t in reversed(tiers) if leverage <= t["maxLeverage"]), None)
+        assert index.tier_for_leverage(leverage) is expected
+
+    for stake in [0.1, 100, 101, 2000, 5000, 100000, 100001]:
+        expected = next(
+            (i for i, t in enumerate(tiers) if stake <= t["maxNotional"] / t["maxLeverage"]),
+            len(tiers),
+        )
+        assert index.tier_index_for_stake(stake) == expected
+    assert index.min_stake == [0, 20000 / 50, 5000 / 10, 50000 / 25, 100000 / 20]
+
+
 def test_get_max_leverage_futures(default_conf, mocker, leverage_tiers):
     # Test Spot
     exchange = get_patched_exchange(mocker, default_conf, exchange="binance")
@@ -6105,6 +6251,40 @@ def test_get_liquidation_price1(mocker, default_conf):
         )
 
 
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_get_liquidation_prices(mocker, default_conf, dry_run):
+    default_conf["dry_run"] = dry_run
+    default_conf["trading_mode"] = "futures"
+    default_conf["margin_mode"] = "isolated"
+    default_conf["liquidation_buffer"] = 0.1
+    mocker.patch(f"{EXMS}.exchange_has", return_value=True)
+    trades = [
+        MagicMock(pair="ETH/USDT:USDT", open_rate=10.0, is_short=False),
+        MagicMock(pair="XRP/USDT:USDT", open_rate=10.0, is_short=True),
+    ]
+    exchange = get_patched_exchange(mocker, default_conf, exchange="gate")
+    dry_run_liq = mocker.patch.object(exchange, "dry_run_liquidation_price", return_value=8.0)
+    fetch_positions = mocker.patch.object(
+        exchange, "fetch_positions", return_value=[{"liquidationPrice": 8.0}]
+    )
+
+    res = exchange.get_liquidation_prices(trades, wallet_balance=50, open_trades=trades)
+    # Buffer is applied towards the open rate
+    assert res == pytest.approx([8.2, 7.8])
+    assert dry_run_liq.call_count == (2 if dry_run else 0)
+    assert fetch_positions.call_count == (0 if dry_run else 2)
+    if dry_run:
+        assert dry_run_liq.call_args[1]["wallet_balance"] == 50
+        assert dry_run_liq.call_args[1]["open_trades"] == trades
+
+    default_conf["trading_mode"] = "spot"
+    exchange = get_patched_exchange(mocker, default_conf, exchange="gate")
+    assert exchange.get_liquidation_prices(trades, wallet_balance=50, open_trades=trades) == [
+        None,
+        None,
+    ]
+
+
 @pytest.mark.parametrize("liquidation_buffer", [0.0])
 @pytest.mark.parametrize(
     "is_short,trading_mode,exchange_name,margin_mode,leverage,open_rate,amount,mramt,expected_liq",
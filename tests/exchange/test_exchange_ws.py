@@ -5,6 +5,7 @@ from datetime import timedelta
 from time import sleep
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 from ccxt import NotSupported
 
 from freqtrade.enums import CandleType
@@ -223,3 +224,45 @@ async def test_exchangews_get_ohlcv(mocker, caplog):
     assert log_has_re(msg, caplog)
 
     exchange_ws.cleanup()
+
+
+def test_exchangews_ohlcv_snapshot(mocker):
+    config = MagicMock()
+    ccxt_object = MagicMock()
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+
+    exchange_ws = ExchangeWS(config, ccxt_object)
+    candles = [
+        [1635840000000, 100, 200, 300, 400, 500],
+        [1635840060000, 101, 201, 301, 401, 501],
+        [1635840120000, 102, 202, 302, 402, 502],
+    ]
+    ccxt_object.ohlcvs = {"ETH/USDT": {"1m": candles}}
+    # No snapshot yet - falls back to a copy of ccxt's cache
+    res = exchange_ws.ohlcvs("ETH/USDT", "1m")
+    assert res == candles
+    assert res is not candles
+
+    exchange_ws._update_ohlcv_snapshot("ETH/USDT", "1m", candles)
+    snapshot = exchange_ws.ohlcvs("ETH/USDT", "1m")
+    assert isinstance(snapshot, np.ndarray)
+    assert not snapshot.flags.writeable
+    assert np.array_equal(snapshot, np.array(candles))
+    # Snapshot is not copied
+    assert exchange_ws.ohlcvs("ETH/USDT", "1m") is snapshot
+
+    # Update of the last candle, one new candle, first candle aged out
+    candles = [
+        [1635840060000, 101, 201, 301, 401, 501],
+        [1635840120000, 102, 205, 302, 405, 600],
+        [1635840180000, 103, 203, 303, 403, 503],
+    ]
+    exchange_ws._update_ohlcv_snapshot("ETH/USDT", "1m", candles)
+    new_snapshot = exchange_ws.ohlcvs("ETH/USDT", "1m")
+    assert np.array_equal(new_snapshot, np.array(candles))
+    # Previous snapshot is unchanged
+    assert snapshot[-1, 2] == 202
+
+    exchange_ws._pop_history(("ETH/USDT", "1m", CandleType.SPOT))
+    assert exchange_ws._ohlcv_snapshots == {}
+    exchange_ws.cleanup()
@@ -0,0 +1,143 @@
+import asyncio
+
+from freqtrade.exceptions import DDosProtection
+from freqtrade.exchange.common import retrier_async
+from freqtrade.exchange.request_scheduler import RequestScheduler, report_rate_limited
+
+
+async def test_request_scheduler_run():
+    scheduler = RequestScheduler("test", max_concurrency=3)
+    running = 0
+    max_running = 0
+    started = []
+
+    async def job(i):
+        nonlocal running, max_running
+        started.append(i)
+        running += 1
+        max_running = max(max_running, running)
+        # Later jobs finish first
+        await asyncio.sleep(0.001 * (10 - i))
+        running -= 1
+        if i == 4:
+            raise ValueError("boom")
+        return i
+
+    results = await scheduler.run([job(i) for i in range(10)])
+    assert max_running == 3
+    assert started == list(range(10))
+    assert results[:4] == [0, 1, 2, 3]
+    assert isinstance(results[4], ValueError)
+    assert results[5:] == [5, 6, 7, 8, 9]
+    assert scheduler.queue_depth == 0
+    assert scheduler.stats()["running"] == 0
+    assert scheduler.latency is not None
+    assert await scheduler.run([]) == []
+
+
+async def test_request_scheduler_rate_limited(caplog, mocker):
+    mocker.patch("freqtrade.exchange.common.asyncio.sleep", new=mocker.AsyncMock())
+    scheduler = RequestScheduler("test", max_concurrency=8, target_latency=0)
+    calls = 0
+
+    @retrier_async
+    async def job(self):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise DDosProtection("rate limited")
+        return calls
+
+    results = await scheduler.run([job(mocker.MagicMock())])
+    assert results == [2]
+    # Halved on the rate limit, never increased due to target_latency 0
+    assert scheduler.concurrency == 4
+    assert "reducing concurrency to 4" in caplog.text
+
+    for _ in range(5):
+        scheduler.rate_limited()
+    assert scheduler.concurrency == 1
+
+    # Grows by one once as many requests as the current limit finished
+    scheduler.target_latency = 5
+    await scheduler.run([asyncio.sleep(0) for _ in range(3)])
+    assert scheduler.concurrency == 3
+    await scheduler.run([asyncio.sleep(0) for _ in range(2)])
+    assert scheduler.concurrency == 3
+    await scheduler.run([asyncio.sleep(0)])
+    assert scheduler.concurrency == 4
+
+    # Outside of a scheduler, reporting is a no-op
+    report_rate_limited()
+    assert scheduler.concurrency == 4
+
+
+async def test_request_scheduler_slow_recovery():
+    scheduler = RequestScheduler("test", max_concurrency=100)
+    scheduler.rate_limited()
+    assert scheduler.concurrency == 50
+    # One refresh worth of requests doesn't undo the back-off
+    await scheduler.run([asyncio.sleep(0) for _ in range(100)])
+    assert scheduler.concurrency == 51
+
+    # Rate limiting resets the progress towards the next increase
+    scheduler.rate_limited()
+    assert scheduler.concurrency == 25
+    await scheduler.run([asyncio.sleep(0) for _ in range(24)])
+    assert scheduler.concurrency == 25
+
+
+async def test_request_scheduler_concurrent_rate_limits(mocker):
+    mocker.patch("freqtrade.exchange.common.asyncio.sleep", new=mocker.AsyncMock())
+    scheduler = RequestScheduler("test", max_concurrency=100)
+    all_sent = asyncio.Event()
+    attempts: dict[int, int] = {}
+
+    @retrier_async
+    async def job(self, i):
+        attempts[i] = attempts.get(i, 0) + 1
+        if attempts[i] > 1:
+            return i
+        if len(attempts) == 10:
+            all_sent.set()
+        # All requests are sent before the first response arrives
+        await all_sent.wait()
+        raise DDosProtection("rate limited")
+
+    results = await scheduler.run([job(mocker.MagicMock(), i) for i in range(10)])
+    assert results == list(range(10))
+    # 10 concurrent rate limits only halve the limit once
+    assert scheduler.concurrency == 50
+
+    # Requests sent after the decrease count again
+    assert await scheduler.run([job(mocker.MagicMock(), 10)]) == [10]
+    assert scheduler.concurrency == 25
+
+
+async def test_request_scheduler_latency_excludes_retries(mocker):
+    clock = 0.0
+
+    async def backoff(delay):
+        nonlocal clock
+        clock += delay
+
+    mocker.patch("freqtrade.exchange.common.asyncio.sleep", side_effect=backoff)
+    mocker.patch("freqtrade.exchange.request_scheduler.time").monotonic.side_effect = lambda: clock
+    scheduler = RequestScheduler("test", max_concurrency=10, target_latency=1)
+    calls = 0
+
+    @retrier_async
+    async def job(self):
+        nonlocal calls, clock
+        calls += 1
+        if calls == 1:
+            clock += 10
+            raise DDosProtection("rate limited")
+        clock += 0.5
+        return calls
+
+    assert await scheduler.run([job(mocker.MagicMock())]) == [2]
+    assert clock > 10
+    assert scheduler.concurrency == 5
+    # Neither the failed attempt nor the backoff delay count towards the latency
+    assert scheduler.latency == 0.5
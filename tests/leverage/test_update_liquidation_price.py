@@ -14,6 +14,7 @@ def test_update_liquidation_prices(mocker, margin_mode, dry_run):
     # update liquidation price for all trades in cross mode
     exchange = MagicMock()
     exchange.margin_mode = margin_mode
+    exchange.get_liquidation_prices.side_effect = lambda trades, **kwargs: [1.0] * len(trades)
     wallets = MagicMock()
     trade_mock = MagicMock()
 
@@ -28,6 +29,10 @@ def test_update_liquidation_prices(mocker, margin_mode, dry_run):
     )
 
     assert trade_mock.set_liquidation_price.call_count == 1
+    # Cross margin evaluates all positions in one call
+    assert exchange.get_liquidation_prices.call_count == (
+        1 if margin_mode == MarginMode.CROSS else 0
+    )
 
     assert wallets.get_collateral.call_count == (
         0 if margin_mode == MarginMode.ISOLATED or not dry_run else 1
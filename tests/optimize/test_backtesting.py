@@ -25,6 +25,7 @@ from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.bt_fast_path import fast_path_unsupported_reason
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -963,6 +964,42 @@ def test_backtest_one_detail(default_conf_usdt, mocker, testdatadir, use_detail)
     assert late_entry > 0
 
 
+def test_get_detail_data(default_conf_usdt, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf_usdt["timeframe_detail"] = "1m"
+    backtesting = Backtesting(default_conf_usdt)
+    pair = "UNITTEST/USDT"
+    dates = pd.date_range("2024-01-01 00:00", periods=15, freq="1min", tz="UTC")
+    # Gap - no detail candles for the 3rd main candle
+    detail = pd.DataFrame({"date": dates[:10], "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5})
+    detail["open"] = np.arange(10, dtype=float)
+    backtesting.detail_data = {pair: detail}
+
+    def main_row(date):
+        return (pd.Timestamp(date, tz="UTC"), 1, 2, 0.5, 1.5, 1, 0, 0, 0, "tag", None)
+
+    main_rows = [main_row(d) for d in ("2024-01-01 00:00", "2024-01-01 00:05", "2024-01-01 00:10")]
+    for index_main_candles in (False, True):
+        if index_main_candles:
+            backtesting._index_detail_data({pair: main_rows})
+        rows = backtesting.get_detail_data(pair, main_rows[1])
+        assert rows == [
+            (dates[i], float(i), 2.0, 0.5, 1.5, 1, 0, 0, 0, "tag", None) for i in range(5, 10)
+        ]
+        assert backtesting.get_detail_data(pair, main_rows[2]) is None
+
+    detail_candles = backtesting._detail_candles[pair]
+    assert detail_candles._starts.tolist() == [0, 5, 10]
+    assert detail_candles._ends.tolist() == [5, 10, 10]
+    assert detail_candles._starts.dtype == np.int64
+    # Candle data is not copied
+    assert np.shares_memory(detail_candles._columns[0], detail["open"].to_numpy())
+
+    # Replaced detail data is converted again
+    backtesting.detail_data = {pair: detail.iloc[:7]}
+    assert len(backtesting.get_detail_data(pair, main_rows[1])) == 2
+
+
 @pytest.mark.parametrize(
     "use_detail,exp_funding_fee, exp_ff_updates",
     [
@@ -1586,6 +1623,85 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results["results"], "5m", 1)) == 0
 
 
+@pytest.mark.parametrize("trailing_stop", [False, True])
+@pytest.mark.parametrize("max_open_trades", [1, 3, 10])
+@pytest.mark.parametrize("tres", [0, 30])
+def test_backtest_fast_path(
+    default_conf, fee, mocker, tres, max_open_trades, trailing_stop, testdatadir
+):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/BTC", "LTC/BTC") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % (multi * 3) == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": max_open_trades,
+            "stake_amount": "unlimited",
+            "minimal_roi": {"0": 0.03, "60": 0.01, "120": -1},
+            "stoploss": -0.01,
+            "trailing_stop": trailing_stop,
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs), -500)
+    if tres > 0:
+        data["LTC/BTC"] = data["LTC/BTC"][tres:].reset_index()
+
+    results = {}
+    for fast_path in (False, True):
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold
+        backtesting.strategy.advise_exit = _trend_alternate_hold
+        backtesting._use_fast_path = fast_path
+        bl_spy = mocker.spy(backtesting, "backtest_loop")
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[fast_path] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        results[fast_path]["calls"] = bl_spy.call_count
+
+    assert len(results[False]["results"]) > 10
+    pd.testing.assert_frame_equal(results[False]["results"], results[True]["results"])
+    assert results[False]["rejected_signals"] == results[True]["rejected_signals"]
+    assert results[False]["final_balance"] == results[True]["final_balance"]
+    assert results[True]["calls"] < results[False]["calls"]
+
+
+def test_backtest_fast_path_unsupported(default_conf, mocker, caplog) -> None:
+    default_conf["backtest_fast_path"] = True
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    # StrategyTestV3 implements leverage() and adjust_trade_position()
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._use_fast_path is False
+    assert log_has_re(r"Backtest fast path disabled: strategy implements .*leverage", caplog)
+
+    mocker.patch("freqtrade.optimize.backtesting.fast_path_unsupported_reason", return_value=None)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._use_fast_path is True
+    assert log_has("Using backtest fast path.", caplog)
+
+    default_conf["timeframe_detail"] = "1m"
+    assert (
+        fast_path_unsupported_reason(backtesting.strategy, default_conf)
+        == "--timeframe-detail is not supported"
+    )
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 @pytest.mark.parametrize("pair", ["ADA/USDT", "LTC/USDT"])
 @pytest.mark.parametrize("tres", [0, 20, 30])
@@ -14,6 +14,8 @@ from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_datastore import load_columnar_data, store_columnar_data
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import IndicatorCache
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal, ft_IntDistribution
@@ -379,7 +381,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -583,7 +585,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load_columnar_data",
+        return_value={"XRP/BTC": None},
     )
 
     optimizer_param = {
@@ -659,15 +662,18 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
         MagicMock(return_value={}),
     )
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_file", MagicMock(return_value=True))
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.is_dir", MagicMock(return_value=True))
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Path.unlink", MagicMock())
+    rmtreemock = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.shutil.rmtree", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    assert unlinkmock.call_count == 1
+    assert rmtreemock.call_count == 1
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -734,7 +740,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -791,7 +797,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -846,7 +852,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -900,7 +906,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -939,7 +945,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -993,7 +999,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1059,7 +1065,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.store_columnar_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -1177,6 +1183,43 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
     hyperopt.start()
 
 
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_in_strategy_auto_hyperopt_persistent_workers(
+    mocker, hyperopt_conf, tmp_path, fee, caplog
+) -> None:
+    mocker.patch(f"{EXMS}.validate_config", MagicMock())
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.reload_markets")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=get_markets()))
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt.INITIAL_POINTS", 2)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["all"],
+            "epochs": 5,
+            "hyperopt_jobs": 2,
+            "hyperopt_persistent_workers": True,
+            "fee": fee.return_value,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    opt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    opt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    opt.backtesting.exchange._markets = get_markets()
+    parallel = mocker.patch("freqtrade.optimize.hyperopt.hyperopt.Parallel")
+
+    hyperopt.start()
+
+    assert parallel.call_count == 0
+    assert log_has("Effective number of persistent workers used: 2", caplog)
+    assert hyperopt.num_epochs_saved == 5
+
+
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
     patch_exchange(mocker)
     mocker.patch(f"{EXMS}.get_fee", fee)
@@ -1381,3 +1424,100 @@ def test_max_open_trades_consistency(mocker, hyperopt_conf, tmp_path, fee) -> No
 
     assert hyperopt.hyperopter.backtesting.strategy.max_open_trades == 4
     assert hyperopt.config["max_open_trades"] == 4
+
+
+def test_hyperopt_columnar_datastore(testdatadir, tmp_path):
+    data = load_data(testdatadir, "1m", ["UNITTEST/BTC"], fill_up_missing=True)
+    data["UNITTEST/BTC"]["enter_tag"] = "tag"
+    data["UNITTEST/BTC"]["flag"] = data["UNITTEST/BTC"]["close"] > data["UNITTEST/BTC"]["open"]
+    data["XRP/BTC"] = data["UNITTEST/BTC"].iloc[0:0]
+    store_path = tmp_path / "hyperopt_tickerdata"
+
+    store_columnar_data(data, store_path)
+    assert (store_path / "metadata.pkl").is_file()
+
+    loaded = load_columnar_data(store_path)
+    assert list(loaded.keys()) == ["UNITTEST/BTC", "XRP/BTC"]
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+
+    # Arrays are memory-mapped and read-only
+    with pytest.raises(ValueError, match=r"read-only"):
+        loaded["UNITTEST/BTC"].loc[0, "close"] = 5
+
+    # New columns don't leak into the shared data
+    loaded["UNITTEST/BTC"]["new_col"] = 1
+    loaded2 = load_columnar_data(store_path)
+    assert "new_col" not in loaded2["UNITTEST/BTC"].columns
+    assert loaded2["UNITTEST/BTC"]["close"].values.base is not None
+
+
+def test_hyperopt_columnar_datastore_multiple_dates(testdatadir, tmp_path):
+    data = load_data(testdatadir, "1m", ["UNITTEST/BTC"], fill_up_missing=True)
+    df = data["UNITTEST/BTC"]
+    # Informative-style date column, misaligned with "date"
+    df["date_1h"] = df["date"].dt.floor("1h")
+    df["date_local"] = df["date"].dt.tz_convert("Europe/Vienna") - timedelta(minutes=5)
+    store_path = tmp_path / "hyperopt_tickerdata"
+
+    store_columnar_data(data, store_path)
+    loaded = load_columnar_data(store_path)
+
+    pd.testing.assert_frame_equal(loaded["UNITTEST/BTC"], df)
+    assert not loaded["UNITTEST/BTC"]["date_1h"].equals(loaded["UNITTEST/BTC"]["date"])
+    assert str(loaded["UNITTEST/BTC"]["date_local"].dt.tz) == "Europe/Vienna"
+
+
+def test_hyperopt_indicator_cache(mocker, hyperopt_conf, testdatadir, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"strategy": "HyperoptableStrategy", "user_data_dir": tmp_path})
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    strategy = Hyperopt(hyperopt_conf).hyperopter.backtesting.strategy
+    calls = []
+
+    def populate_indicators(dataframe, metadata):
+        calls.append(metadata["pair"])
+        dataframe["sma"] = dataframe["close"].rolling(strategy.buy_rsi.value).mean()
+        return dataframe
+
+    strategy.populate_indicators = populate_indicators
+    data = load_data(testdatadir, "1m", ["UNITTEST/BTC"], fill_up_missing=True)
+    cache = IndicatorCache()
+
+    strategy.buy_rsi.value = 20
+    strategy.sell_rsi.value = 60
+    res = cache.advise_all_indicators(strategy, data)
+    assert len(calls) == 1
+    assert cache.misses == 1
+    assert type(strategy.buy_rsi) is IntParameter
+
+    # Only parameters not used for indicators changed
+    strategy.sell_rsi.value = 80
+    res1 = cache.advise_all_indicators(strategy, data)
+    assert len(calls) == 1
+    assert cache.hits == 1
+    pd.testing.assert_frame_equal(res["UNITTEST/BTC"], res1["UNITTEST/BTC"])
+    # Changes to the returned frame don't affect the cache
+    res1["UNITTEST/BTC"]["sma"] = 0
+
+    strategy.buy_rsi.value = 25
+    res2 = cache.advise_all_indicators(strategy, data)
+    assert len(calls) == 2
+    assert not res2["UNITTEST/BTC"]["sma"].equals(res["UNITTEST/BTC"]["sma"])
+
+    strategy.buy_rsi.value = 20
+    res3 = cache.advise_all_indicators(strategy, data)
+    assert len(calls) == 2
+    assert cache.hits == 2
+    pd.testing.assert_frame_equal(res["UNITTEST/BTC"], res3["UNITTEST/BTC"])
+
+    # Memory budget only allows one entry
+    cache = IndicatorCache(memory_budget=cache.memory_usage // 2)
+    cache.advise_all_indicators(strategy, data)
+    strategy.buy_rsi.value = 25
+    cache.advise_all_indicators(strategy, data)
+    strategy.buy_rsi.value = 20
+    cache.advise_all_indicators(strategy, data)
+    assert cache.hits == 0
+    assert cache.misses == 3
+    assert len(calls) == 5
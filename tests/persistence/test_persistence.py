@@ -1886,6 +1886,59 @@ def test_get_trades_proxy(fee, use_db, is_short):
 
     assert len(Trade.get_trades_proxy(open_date=opendate)) == 3
 
+    closedate = datetime.now(tz=UTC) - timedelta(minutes=5)
+    assert len(Trade.get_trades_proxy(is_open=False, close_date=closedate)) == 2
+    trades = Trade.get_trades_proxy(pair="XRP/BTC", is_open=False, close_date=closedate)
+    assert len(trades) == 1
+    assert trades[0].pair == "XRP/BTC"
+    closedate = datetime.now(tz=UTC) - timedelta(minutes=1)
+    assert len(Trade.get_trades_proxy(is_open=False, close_date=closedate)) == 1
+    assert len(Trade.get_trades_proxy(pair="ETC/BTC", is_open=False, close_date=closedate)) == 0
+    trades = Trade.get_trades_proxy(pair="ETC/BTC", is_open=True)
+    assert trades == [t for t in Trade.get_trades_proxy(is_open=True) if t.pair == "ETC/BTC"]
+
+    Trade.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_trades_proxy_closed_index():
+    Trade.use_db = False
+    Trade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    pairs = ["ETH/BTC", "XRP/BTC"]
+
+    def closed_trade(i, minutes):
+        return LocalTrade(
+            id=i,
+            pair=pairs[i % 2],
+            open_date=start,
+            close_date=start + timedelta(minutes=minutes),
+            is_open=False,
+        )
+
+    # Out of order, including duplicate close dates
+    for i, minutes in enumerate([10, 30, 20, 30, 5, 40, 30]):
+        LocalTrade.add_bt_trade(closed_trade(i, minutes))
+
+    trades = Trade.get_trades_proxy(is_open=False, close_date=start + timedelta(minutes=20))
+    assert [t.id for t in trades] == [1, 3, 6, 5]
+    trades = Trade.get_trades_proxy(
+        pair="ETH/BTC", is_open=False, close_date=start + timedelta(minutes=5)
+    )
+    assert [t.id for t in trades] == [0, 2, 6]
+    trades = Trade.get_trades_proxy(
+        is_open=False, close_date=start, open_date=start - timedelta(minutes=1)
+    )
+    assert len(trades) == 7
+    assert Trade.get_trades_proxy(is_open=False, close_date=start + timedelta(minutes=40)) == []
+    assert Trade.get_trades_proxy(pair="LTC/BTC", is_open=False, close_date=start) == []
+
+    # Trades appended to the list directly are picked up
+    LocalTrade.bt_trades.append(closed_trade(7, 50))
+    trades = Trade.get_trades_proxy(is_open=False, close_date=start + timedelta(minutes=40))
+    assert [t.id for t in trades] == [7]
+
+    Trade.reset_trades()
     Trade.use_db = True
 
 
@@ -2144,6 +2197,7 @@ def test_Trade_object_idem():
         "bt_trades",
         "bt_trades_open",
         "bt_trades_open_pp",
+        "bt_trades_closed_index",
         "bt_open_open_trade_count",
         "bt_total_profit",
         "from_json",
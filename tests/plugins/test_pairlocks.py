@@ -1,3 +1,4 @@
+import random
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -158,3 +159,51 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_backtest_index():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    rng = random.Random(42)
+    pairs = ["XRP/USDT", "ETH/USDT", "*"]
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+
+    def scan(pair, now, side):
+        return [
+            lock
+            for lock in PairLocks.get_all_locks()
+            if lock.lock_end_time >= now
+            and lock.active
+            and (pair is None or lock.pair == pair)
+            and (side is None or lock.side in ("*", side))
+        ]
+
+    for step in range(300):
+        now = start + timedelta(minutes=5 * step)
+        if rng.random() < 0.5:
+            PairLocks.lock_pair(
+                rng.choice(pairs),
+                now + timedelta(minutes=rng.randint(0, 60)),
+                now=now,
+                side=rng.choice(["*", "long", "short"]),
+            )
+        if rng.random() < 0.05:
+            PairLocks.unlock_pair(rng.choice(pairs), now, side=rng.choice(["*", "long", "short"]))
+        for pair in pairs:
+            for side in (None, "*", "long", "short"):
+                assert PairLocks.get_pair_locks(pair, now, side) == scan(pair, now, side)
+    # Queries for earlier times still see expired locks
+    now = start + timedelta(minutes=100)
+    for pair in [None, *pairs]:
+        assert PairLocks.get_pair_locks(pair, now, "long") == scan(pair, now, "long")
+    assert len(PairLocks.get_all_locks()) > 100
+
+    # Locks added to the list directly are picked up
+    lock = PairLocks.get_all_locks()[0]
+    PairLocks.locks = [lock]
+    assert PairLocks.get_pair_locks(lock.pair, lock.lock_time, lock.side) == [lock]
+
+    PairLocks.reset_locks()
+    PairLocks.use_db = True
@@ -1401,3 +1401,5 @@ def test_rpc_health(mocker, default_conf) -> None:
     result = rpc.health()
     assert result["last_process"] is None
     assert result["last_process_ts"] is None
+    assert result["ohlcv_requests_pending"] == 0
+    assert result["ohlcv_request_concurrency"] == 100
@@ -3077,6 +3077,8 @@ def test_health(botclient):
     ret = rc.json()
     assert ret["last_process_ts"] is None
     assert ret["last_process"] is None
+    assert ret["ohlcv_requests_pending"] == 0
+    assert ret["ohlcv_request_concurrency"] == 100
 
 
 def test_api_ws_subscribe(botclient, mocker):
@@ -1,10 +1,12 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 from pandas import DataFrame, concat
 
@@ -132,6 +134,57 @@ def test_analyze_pair_empty(mocker, caplog, ohlcv_history):
     assert log_has("Empty dataframe for pair ETH/BTC", caplog)
 
 
+@pytest.mark.parametrize("threads", [1, 4])
+def test_analyze_threads(mocker, default_conf, ohlcv_history, threads):
+    default_conf["internals"] = {"analyze_threads": threads}
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    strategy.ft_bot_start()
+    # Each pair gets its own dataframe - as DataProvider.ohlcv() returns copies
+    mocker.patch.object(strategy.dp, "ohlcv", side_effect=lambda *a, **k: ohlcv_history.copy())
+    set_cached_df = mocker.patch.object(strategy.dp, "_set_cached_df")
+    pairs = [f"PAIR{i}/BTC" for i in range(10)]
+
+    strategy.analyze(pairs)
+
+    assert set_cached_df.call_count == 10
+    # Results are stored in whitelist order
+    assert [c[0][0] for c in set_cached_df.call_args_list] == pairs
+    assert (strategy._analyze_executor is not None) == (threads > 1)
+    assert strategy._pending_analyzed_dfs is None
+    for c in set_cached_df.call_args_list:
+        assert "enter_long" in c[0][2].columns
+
+    # Failing pairs don't prevent other pairs from being stored
+    set_cached_df.reset_mock()
+    mocker.patch.object(
+        strategy, "analyze_ticker", side_effect=[KeyError("xyz")] + [ohlcv_history] * 9
+    )
+    strategy._last_candle_seen_per_pair = {}
+    strategy.analyze(pairs)
+    assert set_cached_df.call_count == 9
+
+    # Worker threads are stopped on cleanup
+    executor = strategy._analyze_executor
+    strategy.ft_bot_cleanup()
+    assert strategy._analyze_executor is None
+    if executor is not None:
+        assert executor._shutdown
+        assert not any(t.is_alive() for t in executor._threads)
+
+    # FreqAI failures don't leak the worker threads
+    strategy._analyze_executor = ThreadPoolExecutor(max_workers=2)
+    strategy._analyze_executor.submit(lambda: None).result()
+    executor = strategy._analyze_executor
+    strategy.freqai = MagicMock()
+    strategy.freqai.shutdown.side_effect = ValueError("freqai")
+    with pytest.raises(ValueError, match="freqai"):
+        strategy.ft_bot_cleanup()
+    assert strategy._analyze_executor is None
+    assert not any(t.is_alive() for t in executor._threads)
+    assert strategy.freqai.shutdown.call_count == 1
+
+
 def test_get_signal_empty(default_conf, caplog):
     assert (None, None) == _STRATEGY.get_latest_candle(
         "foo", default_conf["timeframe"], DataFrame()
@@ -862,6 +915,61 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has("Skipping TA Analysis for already analyzed candle", caplog)
 
 
+def test__analyze_ticker_internal_incremental(testdatadir, mocker) -> None:
+    def populate_indicators(dataframe, metadata):
+        dataframe["sma"] = dataframe["close"].rolling(10).mean()
+        return dataframe
+
+    def populate_entry(dataframe, metadata):
+        dataframe["enter_long"] = (dataframe["close"] > dataframe["sma"]).astype(int)
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=populate_indicators)
+    mocker.patch.multiple(
+        "freqtrade.strategy.interface.IStrategy",
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=populate_entry),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.incremental_analysis = True
+    strategy.startup_candle_count = 10
+    data = load_data(testdatadir, "1m", ["UNITTEST/BTC"])["UNITTEST/BTC"]
+
+    def analyze(start, end):
+        df = data.iloc[start:end].reset_index(drop=True)
+        res = strategy._analyze_ticker_internal(df.copy(), {"pair": "UNITTEST/BTC"})
+        expected = populate_entry(populate_indicators(df.copy(), {}), {})
+        assert len(res) == len(df)
+        # Candles within the startup period may differ, as they were analyzed with more history.
+        pd.testing.assert_frame_equal(res.iloc[10:], expected.iloc[10:])
+        return len(ind_mock.call_args[0][0])
+
+    # Initial analysis uses the full dataframe
+    assert analyze(0, 500) == 500
+    # One new candle, oldest candle dropped
+    assert analyze(1, 501) == 11
+    # Multiple new candles
+    assert analyze(3, 504) == 13
+    # Same candle - no analysis
+    ind_mock.reset_mock()
+    strategy._analyze_ticker_internal(
+        data.iloc[3:504].reset_index(drop=True), {"pair": "UNITTEST/BTC"}
+    )
+    assert ind_mock.call_count == 0
+
+    # Already analyzed candle changed - full analysis
+    data.loc[503, "close"] += 1
+    assert analyze(4, 505) == 501
+    # Data gap - full analysis
+    assert analyze(600, 1000) == 400
+
+    # Without startup candles, the full dataframe is analyzed.
+    strategy.startup_candle_count = 0
+    assert analyze(601, 1001) == 400
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf["timeframe"]
@@ -1,7 +1,7 @@
 import pytest
 
 from freqtrade.exceptions import StrategyError
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade, Order, Trade
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util.datetime_helpers import dt_now
 from tests.conftest import create_mock_trades, log_has_re
@@ -91,3 +91,64 @@ def test_strategy_safe_wrapper_trade_copy(fee, mocker):
     )
 
     assert deepcopy_mock.call_count == 0
+
+
+def test_strategy_safe_wrapper_bt_trade_copy(mocker):
+    import freqtrade.strategy.strategy_wrapper as swm
+
+    deepcopy_mock = mocker.spy(swm, "deepcopy")
+    trade_ = LocalTrade(
+        id=1,
+        pair="ETH/USDT",
+        open_rate=2.0,
+        amount=30.0,
+        stake_amount=60.0,
+        fee_open=0.001,
+        fee_close=0.001,
+        open_date=dt_now(),
+        is_open=True,
+        exchange="binance",
+    )
+    order = Order(
+        ft_order_side="buy",
+        ft_pair="ETH/USDT",
+        ft_is_open=False,
+        ft_amount=30.0,
+        ft_price=2.0,
+        order_id="1",
+        side="buy",
+        order_type="limit",
+        status="closed",
+        price=2.0,
+        average=2.0,
+        amount=30.0,
+        filled=30.0,
+        remaining=0.0,
+        cost=60.0,
+        order_date=dt_now(),
+    )
+    order._trade_bt = trade_
+    trade_.orders.append(order)
+    strat = StrategyTestV3(config={})
+
+    def working_method(trade):
+        assert trade.orders[0].trade is trade
+        assert trade.orders[0].safe_price == 2.0
+        assert trade.nr_of_successful_entries == 1
+        trade.orders[0].filled = 10.0
+        trade.orders.append(trade.orders[0])
+        trade.stake_amount = 1.0
+        return trade
+
+    strat.working_method = working_method
+
+    ret = strategy_safe_wrapper(strat.working_method, message="DeadBeef")(trade=trade_)
+    assert isinstance(ret, LocalTrade)
+    assert ret is not trade_
+    assert ret.orders[0] is not order
+    # Did not modify the original trade or order
+    assert trade_.stake_amount == 60.0
+    assert trade_.orders == [order]
+    assert order.filled == 30.0
+    assert order.trade is trade_
+    assert deepcopy_mock.call_count == 0
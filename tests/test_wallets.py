@@ -7,12 +7,14 @@ from sqlalchemy import select
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.wallets import Wallets
 from tests.conftest import (
     EXMS,
     create_mock_trades,
     create_mock_trades_usdt,
     get_patched_freqtradebot,
+    log_has_re,
     patch_wallet,
 )
 
@@ -605,3 +607,65 @@ def test_dry_run_wallet_initialization(mocker, default_conf_usdt, config, wallet
             pytest.approx(freqtrade.wallets._wallets[stake_currency].free)
             == wallets[stake_currency]["free"] - 100.0
         )
+
+
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("trading_mode", ["spot", "futures"])
+def test_update_trade_backtest(mocker, default_conf_usdt, fee, caplog, trading_mode):
+    default_conf_usdt["trading_mode"] = trading_mode
+    default_conf_usdt["margin_mode"] = "isolated"
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    Trade.use_db = False
+    LocalTrade.reset_trades()
+    create_mock_trades_usdt(fee, is_short=None, use_db=False)
+    for idx, trade in enumerate(LocalTrade.bt_trades_open + LocalTrade.bt_trades, start=1):
+        trade.id = idx
+        # Not set without database
+        trade.leverage = 1.0
+    LocalTrade.bt_total_profit = 10.0
+
+    wallets = Wallets(default_conf_usdt, freqtrade.exchange, is_backtest=True)
+    full = Wallets(default_conf_usdt, freqtrade.exchange, is_backtest=True)
+
+    def assert_in_sync():
+        full.update()
+        assert wallets.get_all_balances() == full.get_all_balances()
+        assert wallets.get_all_positions() == full.get_all_positions()
+
+    assert_in_sync()
+    trade = LocalTrade.bt_trades_open[1]
+    trade.stake_amount += 5
+    trade.amount *= 1.5
+    trade.realized_profit = 2.0
+    wallets.update_trade(trade)
+    assert_in_sync()
+
+    LocalTrade.remove_bt_trade(trade)
+    wallets.update_trade(trade)
+    assert_in_sync()
+    assert len(wallets._bt_balances) == len(LocalTrade.bt_trades_open)
+
+    # Trade added without update_trade()
+    LocalTrade.add_bt_trade(trade)
+    wallets.update_trade(LocalTrade.bt_trades_open[0])
+    assert_in_sync()
+    # Changes to other trades are picked up
+    LocalTrade.bt_trades_open[1].stake_amount += 5
+    LocalTrade.bt_trades_open[2].orders.pop()
+    wallets.update_trade(LocalTrade.bt_trades_open[0])
+    assert_in_sync()
+
+    # Debug mode detects order changes which are not picked up
+    default_conf_usdt["internals"] = {"backtest_wallet_check": True}
+    wallets = Wallets(default_conf_usdt, freqtrade.exchange, is_backtest=True)
+    wallets.update_trade(LocalTrade.bt_trades_open[0])
+    assert not log_has_re(r"Backtest wallets out of sync.*", caplog)
+    trade = next(t for t in LocalTrade.bt_trades_open[1:] if t.has_open_orders)
+    trade.open_orders[0].ft_is_open = False
+    wallets.update_trade(LocalTrade.bt_trades_open[0])
+    if trading_mode == "spot":
+        assert log_has_re(r"Backtest wallets out of sync.*", caplog)
+    assert_in_sync()
+
+    LocalTrade.reset_trades()
+    Trade.use_db = True